@@ -0,0 +1,59 @@
+"""
+  Bulk operations benchmark.
+
+  Compares a python loop of single add/get/remove calls with add_many/get_many/remove_many,
+  for both the HashTable and the OpenAddressingHashTable.
+  Only the OpenAddressingHashTable probes the whole batch in vectorized rounds. The HashTable
+  still appends to (or walks) a linked list per bucket in python: its bulk operations only
+  save the per call overhead (the hashing, the resizes), and its get_many is a plain loop.
+
+  Usage: python3 bench_bulk.py [number of keys]
+"""
+import gc
+import sys
+import time
+import numpy as np
+from hashtable import HashTable
+from openaddressing import OpenAddressingHashTable
+
+def timed(function) -> float:
+  start = time.perf_counter()
+  function()
+  return time.perf_counter() - start
+
+def bench(table_class: type, keys: np.ndarray) -> dict[str, tuple[float, float]]:
+  values = keys.tolist()
+  key_list = keys.tolist()
+  single, bulk = table_class(8), table_class(8)
+  results = {}
+
+  def add_loop():
+    for key, value in zip(key_list, values):
+      single.add(key, value)
+  def get_loop():
+    for key in key_list:
+      single.get(key)
+  def remove_loop():
+    for key in key_list:
+      single.remove(key)
+
+  results['add'] = timed(add_loop), timed(lambda: bulk.add_many(keys, values))
+  results['get'] = timed(get_loop), timed(lambda: bulk.get_many(keys))
+  results['remove'] = timed(remove_loop), timed(lambda: bulk.remove_many(keys))
+  return results
+
+def main():
+  gc.disable()
+  number_of_keys = int(float(sys.argv[1])) if len(sys.argv) > 1 else 1_000_000
+  keys = np.random.default_rng(0).permutation(number_of_keys)
+  print(f'{number_of_keys} keys')
+  print(f'{"table":>24} {"operation":>10} {"loop (keys/s)":>14} {"bulk (keys/s)":>14} {"speedup":>8}')
+  for table_class in (HashTable, OpenAddressingHashTable):
+    for operation, (loop_time, bulk_time) in bench(table_class, keys).items():
+      print(
+        f'{table_class.__name__:>24} {operation:>10} '
+        f'{number_of_keys / loop_time:>14.0f} {number_of_keys / bulk_time:>14.0f} {loop_time / bulk_time:>8.1f}'
+      )
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,86 @@
+"""
+  Concurrent throughput benchmark.
+
+  Runs a mix of get and add/remove calls from several threads at once, on the
+  ConcurrentHashTable and on a HashTable guarded by a single lock, varying the
+  number of threads and the fraction of reads.
+
+  Note that with the GIL, python threads do not run python code in parallel, so
+  the throughput does not grow with the threads: the benchmark shows how much
+  the locking costs and how it holds up under contention.
+
+  Usage: python3 bench_concurrent.py [operations per thread]
+"""
+import gc
+import sys
+import threading
+import time
+import typing
+import numpy as np
+from concurrenthashtable import ConcurrentHashTable
+from hashtable import HashTable, KeyType
+
+NUMBER_OF_KEYS = 100_000
+THREAD_COUNTS = (1, 2, 4, 8)
+READ_FRACTIONS = (.5, .9, .99)
+
+class LockedHashTable:
+  """A HashTable guarded by a single lock, the baseline"""
+  def __init__(self, capacity: int):
+    self._table = HashTable(capacity)
+    self._lock = threading.Lock()
+
+  def add(self, key: KeyType, value: typing.Any):
+    with self._lock:
+      self._table.add(key, value)
+
+  def get(self, key: KeyType) -> typing.Any:
+    with self._lock:
+      return self._table.get(key)
+
+  def remove(self, key: KeyType, all_occurrences = False) -> int:
+    with self._lock:
+      return self._table.remove(key, all_occurrences)
+
+def bench(table: typing.Any, number_of_threads: int, read_fraction: float, operations_per_thread: int) -> float:
+  barrier = threading.Barrier(number_of_threads + 1)
+
+  def work(index: int):
+    rng = np.random.default_rng(index)
+    keys = rng.integers(0, NUMBER_OF_KEYS, operations_per_thread).tolist()
+    reads = (rng.random(operations_per_thread) < read_fraction).tolist()
+    # each thread writes its own keys, so the removals always find what they added
+    own_key = NUMBER_OF_KEYS * (index + 1)
+    barrier.wait()
+    for key, read in zip(keys, reads):
+      if read:
+        table.get(key)
+      else:
+        table.add(own_key, key)
+        table.remove(own_key)
+
+  threads = [threading.Thread(target=work, args=(index,)) for index in range(0, number_of_threads)]
+  for thread in threads:
+    thread.start()
+  barrier.wait()
+  start = time.perf_counter()
+  for thread in threads:
+    thread.join()
+  return number_of_threads * operations_per_thread / (time.perf_counter() - start)
+
+def main():
+  gc.disable()
+  operations_per_thread = int(float(sys.argv[1])) if len(sys.argv) > 1 else 50_000
+  print(f'{NUMBER_OF_KEYS} keys, {operations_per_thread} operations per thread')
+  print(f'{"table":>20} {"threads":>8} {"reads":>6} {"ops/s":>10}')
+  for table_class in (LockedHashTable, ConcurrentHashTable):
+    table = table_class(NUMBER_OF_KEYS)
+    for key in range(0, NUMBER_OF_KEYS):
+      table.add(key, key)
+    for read_fraction in READ_FRACTIONS:
+      for number_of_threads in THREAD_COUNTS:
+        throughput = bench(table, number_of_threads, read_fraction, operations_per_thread)
+        print(f'{table_class.__name__:>20} {number_of_threads:>8} {read_fraction:>6.0%} {throughput:>10.0f}')
+
+if __name__ == '__main__':
+  main()
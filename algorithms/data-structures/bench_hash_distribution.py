@@ -0,0 +1,48 @@
+"""
+  Collision distribution benchmark.
+
+  Hashes adversarial key patterns into a power of two table, with the python hash()
+  alone (what key % capacity amounts to) and with the default (mixed) hash function,
+  and reports how many slots are used, the longest chain and the average number
+  of keys compared by a successful lookup (1 is perfect).
+
+  Usage: python3 bench_hash_distribution.py
+"""
+import numpy as np
+from hashing import MASK_64, default_hash, next_power_of_two
+
+CAPACITY = next_power_of_two(1 << 16)
+NUMBER_OF_KEYS = CAPACITY // 2
+
+PATTERNS = {
+  'sequential': [key for key in range(0, NUMBER_OF_KEYS)],
+  'multiples of capacity': [key * CAPACITY for key in range(0, NUMBER_OF_KEYS)],
+  'stride 1000': [key * 1000 for key in range(0, NUMBER_OF_KEYS)],
+  'floats (key / 10)': [key / 10 for key in range(0, NUMBER_OF_KEYS)],
+  'floats (key + .5)': [key + .5 for key in range(0, NUMBER_OF_KEYS)],
+  'strings': [f'key-{key}' for key in range(0, NUMBER_OF_KEYS)],
+}
+
+HASH_FUNCTIONS = {
+  'hash()': hash,
+  'default_hash': default_hash,
+}
+
+def distribution(keys: list, hash_function) -> tuple[float, int, float]:
+  positions = np.fromiter(((hash_function(key) & MASK_64) & (CAPACITY - 1) for key in keys), np.int64, len(keys))
+  chain_lengths = np.bincount(positions, minlength=CAPACITY)
+  used_slots = np.count_nonzero(chain_lengths) / CAPACITY
+  # a successful lookup compares, on average, half of its chain
+  average_comparisons = float((chain_lengths * (chain_lengths + 1) / 2).sum() / len(keys))
+  return used_slots, int(chain_lengths.max()), average_comparisons
+
+def main():
+  print(f'{NUMBER_OF_KEYS} keys, capacity {CAPACITY} (ideal used slots: {1 - np.exp(-NUMBER_OF_KEYS / CAPACITY):.1%})')
+  print(f'{"pattern":>22} {"hash function":>14} {"used slots":>11} {"longest chain":>14} {"comparisons/lookup":>19}')
+  for pattern, keys in PATTERNS.items():
+    for name, hash_function in HASH_FUNCTIONS.items():
+      used_slots, longest_chain, average_comparisons = distribution(keys, hash_function)
+      print(f'{pattern:>22} {name:>14} {used_slots:>11.1%} {longest_chain:>14} {average_comparisons:>19.2f}')
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,64 @@
+"""
+  HashTable throughput benchmark.
+
+  Measures insert and lookup throughput from 1e3 keys up to a given maximum
+  (1e7 by default, pass a smaller one as the first argument for a quick run),
+  for a table with a fixed capacity, a resizing table, an incrementally
+  rehashed one and the open addressing table, and the worst single insert
+  latency (the rehash pause).
+
+  The fixed capacity table is only measured up to 1e5 keys, above that its lists are too long.
+
+  Usage: python3 bench_hashtable.py [max number of keys]
+"""
+import gc
+import sys
+import time
+from hashtable import HashTable
+from openaddressing import OpenAddressingHashTable
+
+FIXED_CAPACITY = 1024
+MAX_FIXED_KEYS = 100_000
+
+VARIANTS = ('fixed', 'resize', 'incremental', 'open')
+
+def build(variant: str) -> HashTable | OpenAddressingHashTable:
+  if variant == 'fixed':
+    return HashTable(FIXED_CAPACITY, max_load_factor=float('inf'))
+  if variant == 'incremental':
+    return HashTable(8, incremental_rehash=True)
+  if variant == 'open':
+    return OpenAddressingHashTable(8)
+  return HashTable(8)
+
+def bench(variant: str, number_of_keys: int) -> tuple[float, float, float]:
+  table = build(variant)
+  worst_insert = 0
+  start = time.perf_counter()
+  for key in range(0, number_of_keys):
+    insert_start = time.perf_counter()
+    table.add(key, key)
+    worst_insert = max(worst_insert, time.perf_counter() - insert_start)
+  insert_time = time.perf_counter() - start
+
+  start = time.perf_counter()
+  for key in range(0, number_of_keys):
+    table.get(key)
+  lookup_time = time.perf_counter() - start
+  return number_of_keys / insert_time, number_of_keys / lookup_time, worst_insert
+
+def main():
+  gc.disable() # as timeit does, so the collector pauses do not show up as rehash pauses
+  max_number_of_keys = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10_000_000
+  print(f'{"keys":>10} {"variant":>12} {"inserts/s":>12} {"lookups/s":>12} {"worst insert (ms)":>18}')
+  number_of_keys = 1_000
+  while number_of_keys <= max_number_of_keys:
+    for variant in VARIANTS:
+      if variant == 'fixed' and number_of_keys > MAX_FIXED_KEYS:
+        continue
+      inserts, lookups, worst_insert = bench(variant, number_of_keys)
+      print(f'{number_of_keys:>10} {variant:>12} {inserts:>12.0f} {lookups:>12.0f} {worst_insert * 1000:>18.3f}')
+    number_of_keys *= 10
+
+if __name__ == '__main__':
+  main()
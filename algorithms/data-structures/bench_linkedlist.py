@@ -0,0 +1,58 @@
+"""
+  List indexed access benchmark.
+
+  Compares the List with its finger (the last accessed node) against the walk from
+  the head or the tail alone. Each access pattern starts at the middle of the list:
+  sequential access (list[i] for consecutive indices, forwards and backwards), a random
+  walk near the last index, and random access.
+
+  Usage: python3 bench_linkedlist.py [number of nodes] [number of accesses]
+"""
+import gc
+import sys
+import time
+import numpy as np
+from linkedlist import List, Node
+
+class NoFingerList(List):
+  """The List walking from the head or the tail on every access"""
+  def _get_node_at(self, index: int) -> Node:
+    self._finger = None
+    return super()._get_node_at(index)
+
+def timed(function) -> float:
+  start = time.perf_counter()
+  function()
+  return time.perf_counter() - start
+
+def bench(list_class: type, number_of_nodes: int, patterns: dict[str, list[int]]) -> dict[str, float]:
+  list = list_class()
+  for value in range(0, number_of_nodes):
+    list.append(value)
+  return {
+    pattern: len(indices) / timed(lambda: [list[index] for index in indices])
+    for pattern, indices in patterns.items()
+  }
+
+def main():
+  gc.disable()
+  number_of_nodes = int(float(sys.argv[1])) if len(sys.argv) > 1 else 100_000
+  number_of_accesses = int(float(sys.argv[2])) if len(sys.argv) > 2 else 1_000
+  rng = np.random.default_rng(0)
+  middle = number_of_nodes // 2
+  steps = rng.integers(-8, 9, number_of_accesses)
+  patterns = {
+    'sequential': [index % number_of_nodes for index in range(middle, middle + number_of_accesses)],
+    'reversed': [index % number_of_nodes for index in range(middle, middle - number_of_accesses, -1)],
+    'nearby': np.clip(middle + np.cumsum(steps), 0, number_of_nodes - 1).tolist(),
+    'random': rng.integers(0, number_of_nodes, number_of_accesses).tolist(),
+  }
+
+  print(f'{number_of_nodes} nodes, {number_of_accesses} accesses per pattern')
+  print(f'{"list":>14} {"access":>12} {"accesses/s":>12}')
+  for list_class in (NoFingerList, List):
+    for access, throughput in bench(list_class, number_of_nodes, patterns).items():
+      print(f'{list_class.__name__:>14} {access:>12} {throughput:>12.0f}')
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,72 @@
+"""
+  List construction and iteration benchmark.
+
+  Compares building a List with append calls against from_iterable, and iterating it
+  with the previous Iterator class (an object with an index counter per step) against
+  the generator based __iter__ and __reversed__, and for_each.
+
+  Usage: python3 bench_list_build.py [number of values]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from linkedlist import List, Node
+
+class LegacyIterator:
+  """The previous iterator of the List"""
+  def __init__(self, head_node: Node, list_size: int):
+    self.node = head_node
+    self.list_size = list_size
+    self.current_index = 0
+
+  def __iter__(self):
+    return self
+
+  def __next__(self):
+    if self.list_size == self.current_index:
+      raise StopIteration
+    value = self.node.value
+    self.node = self.node.next_node
+    self.current_index += 1
+    return value
+
+def timed(function) -> float:
+  start = time.perf_counter()
+  function()
+  return time.perf_counter() - start
+
+def appended(values: range) -> List:
+  list = List()
+  for value in values:
+    list.append(value)
+  return list
+
+def bytes_per_value(values: range) -> float:
+  tracemalloc.start()
+  list = List.from_iterable(values)
+  size, _ = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  return size / len(values)
+
+def main():
+  gc.disable()
+  number_of_values = int(float(sys.argv[1])) if len(sys.argv) > 1 else 1_000_000
+  values = range(0, number_of_values)
+  list = List.from_iterable(values)
+  results = {
+    'append': timed(lambda: appended(values)),
+    'from_iterable': timed(lambda: List.from_iterable(values)),
+    'LegacyIterator': timed(lambda: [value for value in LegacyIterator(list._head, list.size)]),
+    '__iter__': timed(lambda: [value for value in list]),
+    '__reversed__': timed(lambda: [value for value in reversed(list)]),
+    'for_each': timed(lambda: list.for_each(lambda value, index: None)),
+  }
+
+  print(f'{number_of_values} values, {bytes_per_value(values):.1f} bytes per value (values included)')
+  print(f'{"operation":>16} {"time (s)":>10} {"values/s":>12}')
+  for operation, elapsed in results.items():
+    print(f'{operation:>16} {elapsed:>10.4f} {number_of_values / elapsed:>12.0f}')
+
+if __name__ == '__main__':
+  main()
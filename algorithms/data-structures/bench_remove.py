@@ -0,0 +1,62 @@
+"""
+  Remove benchmark.
+
+  Removes all the occurrences of a key with many duplicates from a single chain,
+  behind a few other colliding keys, comparing the single pass removal with the
+  previous one (an at/pop loop that restarts from the first index after each match).
+
+  Usage: python3 bench_remove.py [number of duplicates] [number of other keys]
+"""
+import gc
+import sys
+import time
+from hashtable import HashTable, KeyType
+from linkedlist import List
+
+class RescanHashTable(HashTable):
+  """The HashTable with the previous remove, that rescans the chain from its head after each match"""
+  def _remove_from(self, table_slot: List, key_hash: int, key: KeyType, all_occurrences: bool) -> int:
+    removed = 0
+    index = 0
+    while True:
+      try:
+        pair = table_slot.at(index)
+        if pair.key == key:
+          table_slot.pop(index)
+          removed += 1
+          if not all_occurrences:
+            return removed
+          index = 0
+        else:
+          index += 1
+      except IndexError:
+        return removed
+
+def bench(table_class: type, number_of_duplicates: int, number_of_other_keys: int) -> float:
+  # every key hashes to the same slot, so all the entries share a single chain
+  table = table_class(number_of_duplicates + number_of_other_keys, hash_function=lambda key: 0)
+  for key in range(1, number_of_other_keys + 1):
+    table.add(key, key)
+  for value in range(0, number_of_duplicates):
+    table.add(0, value)
+
+  start = time.perf_counter()
+  removed = table.remove(0, True)
+  elapsed = time.perf_counter() - start
+  assert table.size == number_of_other_keys and removed == number_of_duplicates
+  return elapsed
+
+def main():
+  gc.disable()
+  number_of_duplicates = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10_000
+  number_of_other_keys = int(float(sys.argv[2])) if len(sys.argv) > 2 else 100
+  print(f'{number_of_duplicates} duplicates behind {number_of_other_keys} other keys')
+  print(f'{"table":>16} {"time (s)":>10} {"removals/s":>12}')
+  times = {}
+  for table_class in (RescanHashTable, HashTable):
+    times[table_class] = bench(table_class, number_of_duplicates, number_of_other_keys)
+    print(f'{table_class.__name__:>16} {times[table_class]:>10.4f} {number_of_duplicates / times[table_class]:>12.0f}')
+  print(f'speedup: {times[RescanHashTable] / times[HashTable]:.1f}x')
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,56 @@
+"""
+  Snapshot benchmark.
+
+  Compares the cold start of a table of string keys: rebuilding it through add,
+  loading a snapshot into a new HashTable (mmap=False) and mapping it (mmap=True).
+  Then compares the lookups of the in-memory and the mapped tables.
+
+  Usage: python3 bench_snapshot.py [number of keys]
+"""
+import gc
+import os
+import sys
+import tempfile
+import time
+from hashtable import HashTable
+
+def timed(function) -> tuple[float, object]:
+  start = time.perf_counter()
+  result = function()
+  return time.perf_counter() - start, result
+
+def rebuild(keys: list[str]) -> HashTable:
+  table = HashTable(8)
+  for value, key in enumerate(keys):
+    table.add(key, value)
+  return table
+
+def lookups(table: object, keys: list[str]) -> float:
+  elapsed, _ = timed(lambda: [table.get(key) for key in keys])
+  return len(keys) / elapsed
+
+def main():
+  gc.disable()
+  number_of_keys = int(float(sys.argv[1])) if len(sys.argv) > 1 else 1_000_000
+  keys = [f'key {index}' for index in range(0, number_of_keys)]
+  sample = keys[::max(number_of_keys // 10_000, 1)]
+
+  with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, 'table.snapshot')
+    rebuild_time, table = timed(lambda: rebuild(keys))
+    save_time, _ = timed(lambda: table.save(path))
+    load_time, loaded = timed(lambda: HashTable.open(path, mmap=False))
+    open_time, mapped = timed(lambda: HashTable.open(path))
+
+    print(f'{number_of_keys} keys, {os.path.getsize(path) / 2**20:.1f} MiB snapshot (saved in {save_time:.2f}s)')
+    print(f'{"start":>20} {"time (s)":>10}')
+    print(f'{"rebuild with add":>20} {rebuild_time:>10.4f}')
+    print(f'{"open, mmap=False":>20} {load_time:>10.4f}')
+    print(f'{"open, mmap=True":>20} {open_time:>10.6f}')
+    print(f'{"table":>20} {"lookups/s":>10}')
+    print(f'{"in memory":>20} {lookups(loaded, sample):>10.0f}')
+    print(f'{"mapped":>20} {lookups(mapped, sample):>10.0f}')
+    mapped.close()
+
+if __name__ == '__main__':
+  main()
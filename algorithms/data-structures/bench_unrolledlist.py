@@ -0,0 +1,60 @@
+"""
+  Unrolled list benchmark.
+
+  Compares the List (a node per value) with the UnrolledList (blocks of values)
+  on append, pop(0), pop(-1), iteration and memory use.
+
+  Usage: python3 bench_unrolledlist.py [number of values]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+import typing
+from linkedlist import List
+from unrolledlist import UnrolledList
+
+def timed(function) -> float:
+  start = time.perf_counter()
+  function()
+  return time.perf_counter() - start
+
+def filled(list_class: type, number_of_values: int) -> typing.Any:
+  list = list_class()
+  for value in range(0, number_of_values):
+    list.append(value)
+  return list
+
+def memory(list_class: type, number_of_values: int) -> int:
+  # the bytes allocated while filling the list, including the values (about 32 bytes per integer)
+  tracemalloc.start()
+  list = filled(list_class, number_of_values)
+  size, _ = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  return size
+
+def bench(list_class: type, number_of_values: int) -> dict[str, float]:
+  values = range(0, number_of_values)
+  results = {}
+  list = list_class()
+  results['append'] = number_of_values / timed(lambda: [list.append(value) for value in values])
+  results['iteration'] = number_of_values / timed(lambda: [value for value in list])
+  results['pop(-1)'] = number_of_values / timed(lambda: [list.pop(-1) for _ in values])
+  list = filled(list_class, number_of_values)
+  results['pop(0)'] = number_of_values / timed(lambda: [list.pop(0) for _ in values])
+  return results
+
+def main():
+  gc.disable()
+  number_of_values = int(float(sys.argv[1])) if len(sys.argv) > 1 else 100_000
+  print(f'{number_of_values} values')
+  print(f'{"list":>14} {"operation":>10} {"values/s":>12}')
+  for list_class in (List, UnrolledList):
+    for operation, throughput in bench(list_class, number_of_values).items():
+      print(f'{list_class.__name__:>14} {operation:>10} {throughput:>12.0f}')
+  print(f'{"list":>14} {"bytes/value":>12}')
+  for list_class in (List, UnrolledList):
+    print(f'{list_class.__name__:>14} {memory(list_class, number_of_values) / number_of_values:>12.1f}')
+
+if __name__ == '__main__':
+  main()
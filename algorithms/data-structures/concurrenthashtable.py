@@ -0,0 +1,162 @@
+import threading
+import typing
+from hashtable import HashTable, DataNotFound, KeyType, HashFunction
+from hashing import MASK_64, default_hash, next_power_of_two
+
+class _Stripe:
+  # a HashTable and the lock that guards its writes. The version is odd while a write is in progress
+  __slots__ = ('table', 'lock', 'version')
+
+  def __init__(self, table: HashTable):
+    self.table = table
+    self.lock = threading.Lock()
+    self.version = 0
+
+class ConcurrentHashTable:
+  """
+    A thread-safe HashMap data structure, with the same API as the HashTable.
+
+    The keys are split into stripes by the highest bits of their hash (the lowest
+    ones pick the bucket), and each stripe is a HashTable guarded by its own lock,
+    so writes to different stripes never wait for each other. Each stripe grows and
+    shrinks on its own, always while holding its lock, so a resize never blocks the
+    whole table.
+
+    Reads are lock-free: each stripe has a version counter that its writers bump
+    before and after a change (a seqlock), and a read is only trusted if the version
+    was even and has not changed during it. Otherwise, the read is retried while
+    holding the stripe lock. The size is the sum of the stripe sizes, each one
+    only changed while holding its stripe lock.
+
+    Args:
+      capacity:
+        The initial capacity of the whole table, split among the stripes
+      number_of_stripes:
+        The number of locks. Rounded up to a power of two. Defaults to 16
+      max_load_factor:
+        The load factor above which a stripe grows. Defaults to 0.75
+      min_load_factor:
+        The load factor below which a stripe shrinks. Defaults to 0.1
+      hash_function:
+        The function that hashes a key into an integer. Defaults to default_hash
+  """
+  def __init__(
+    self,
+    capacity: int,
+    number_of_stripes: int = 16,
+    max_load_factor: float = .75,
+    min_load_factor: float = .1,
+    hash_function: HashFunction = default_hash,
+  ):
+    number_of_stripes = next_power_of_two(number_of_stripes)
+    self._hash_function = hash_function
+    self._stripe_shift = 64 - (number_of_stripes.bit_length() - 1)
+    stripe_capacity = max(capacity // number_of_stripes, 1)
+    self._stripes = [
+      _Stripe(HashTable(stripe_capacity, max_load_factor, min_load_factor, hash_function=hash_function))
+      for _ in range(0, number_of_stripes)
+    ]
+
+  def _full_hash(self, key: KeyType) -> int:
+    return self._hash_function(key) & MASK_64
+
+  def _stripe_of(self, key_hash: int) -> _Stripe:
+    return self._stripes[key_hash >> self._stripe_shift]
+
+  @property
+  def number_of_stripes(self) -> int:
+    return len(self._stripes)
+
+  @property
+  def size(self) -> int:
+    """
+    The size of the hash table/the number of values in it.
+    [time complexity: O(s), where s is the number of stripes]
+    """
+    return sum(stripe.table.size for stripe in self._stripes)
+
+  @property
+  def capacity(self) -> int:
+    """
+    The capacity of the hash table/the sum of the stripe capacities.
+    [time complexity: O(s), where s is the number of stripes]
+    """
+    return sum(stripe.table.capacity for stripe in self._stripes)
+
+  @property
+  def load_factor(self) -> float:
+    """
+    The number of values per slot of the table (size/capacity).
+    [time complexity: O(s), where s is the number of stripes]
+    """
+    return self.size / self.capacity
+
+  def add(self, key: KeyType, value: typing.Any):
+    """
+    Adds a value to the hash table.
+    [time complexity: amortized O(1)]
+
+    Args:
+      key:
+        The key of the value to be added
+      value:
+        The value to be added
+    """
+    key_hash = self._full_hash(key)
+    stripe = self._stripe_of(key_hash)
+    with stripe.lock:
+      stripe.version += 1
+      try:
+        stripe.table._add_hashed(key_hash, key, value)
+      finally:
+        stripe.version += 1
+
+  def get(self, key: KeyType) -> typing.Any:
+    """
+    Retrieves the value of the first occurrence of a given key, without locking
+    unless a write to its stripe happens at the same time.
+    [time complexity: O(1) on average]
+
+    Args:
+      key:
+        The key of the value to be retrieved
+    """
+    key_hash = self._full_hash(key)
+    stripe = self._stripe_of(key_hash)
+    version = stripe.version
+    if version % 2 == 0:
+      try:
+        value = stripe.table._find(key_hash, key)
+      except DataNotFound:
+        if stripe.version == version:
+          raise
+      except Exception:
+        pass # a torn read of a table being changed, retried below
+      else:
+        if stripe.version == version:
+          return value
+    with stripe.lock:
+      return stripe.table._find(key_hash, key)
+
+  def remove(self, key: KeyType, all_occurrences = False) -> int:
+    """
+    Removes a value from the table based on its key.
+    [time complexity: O(1) on average]
+
+    Args:
+      key:
+        The key of the value to be removed
+      all_occurrences:
+        If true, removes all occurrences of a given key, else, removes the first one
+
+    Returns:
+      The number of removed values
+    """
+    key_hash = self._full_hash(key)
+    stripe = self._stripe_of(key_hash)
+    with stripe.lock:
+      stripe.version += 1
+      try:
+        return stripe.table._remove_hashed(key_hash, key, all_occurrences)
+      finally:
+        stripe.version += 1
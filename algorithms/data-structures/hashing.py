@@ -0,0 +1,104 @@
+import hashlib
+import numpy as np
+import typing
+
+MASK_64 = (1 << 64) - 1
+# python hashes integers modulo this prime, so smaller integers hash to themselves
+PYTHON_HASH_MODULUS = (1 << 61) - 1
+
+def mix64(value: int) -> int:
+  """
+  The splitmix64 finalizer: scrambles the bits of a 64 bits integer, so keys that
+  only differ in a few (or in the high) bits end up in unrelated slots.
+
+  Args:
+    value:
+      The integer to be mixed. Only its lowest 64 bits are used
+  """
+  value &= MASK_64
+  value = ((value ^ (value >> 30)) * 0xbf58476d1ce4e5b9) & MASK_64
+  value = ((value ^ (value >> 27)) * 0x94d049bb133111eb) & MASK_64
+  return value ^ (value >> 31)
+
+def default_hash(key: typing.Hashable) -> int:
+  """
+  The default hash function of the tables: the python hash() of the key (so strings,
+  tuples, bytes and floats are supported, and 1 and 1.0 are the same key) mixed by mix64.
+
+  Note that python randomizes the hash() of strings and bytes on each process.
+  """
+  return mix64(hash(key))
+
+def stable_hash(key: typing.Hashable) -> int:
+  """
+  A hash function that gives the same hash in every process, unlike hash(), whose
+  results for strings and bytes change on each run. Used by the table snapshots.
+
+  Supports strings, bytes, numbers (1 and 1.0 are the same key), None and tuples of them.
+
+  Raises:
+    TypeError: The key has no stable hash
+  """
+  if isinstance(key, str):
+    key = key.encode('utf-8')
+  if isinstance(key, bytes):
+    return mix64(int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little'))
+  if isinstance(key, (int, float)): # python hashes numbers the same way in every process
+    return mix64(hash(key))
+  if key is None:
+    return mix64(0x6e6f6e65)
+  if isinstance(key, tuple):
+    value = 0x345678
+    for item in key:
+      value = mix64(value ^ stable_hash(item))
+    return value
+  raise TypeError(f'Key [{key!r}] of type {type(key).__name__} has no stable hash')
+
+def mix64_array(values: np.ndarray) -> np.ndarray:
+  """The vectorized version of mix64, over an uint64 array"""
+  values = values.astype(np.uint64)
+  with np.errstate(over='ignore'):
+    values ^= values >> np.uint64(30)
+    values *= np.uint64(0xbf58476d1ce4e5b9)
+    values ^= values >> np.uint64(27)
+    values *= np.uint64(0x94d049bb133111eb)
+    values ^= values >> np.uint64(31)
+  return values
+
+def default_hash_array(keys: np.ndarray) -> np.ndarray | None:
+  """
+  The vectorized version of default_hash, for integer arrays.
+
+  Returns:
+    An uint64 array with the hash of each key, or None if the keys
+    cannot be hashed in a vectorized way (then default_hash must be used on each key)
+  """
+  if keys.dtype.kind not in 'iu' or keys.size == 0:
+    return None
+  if keys.dtype.kind == 'u' and int(keys.max()) >= PYTHON_HASH_MODULUS:
+    return None
+  keys = keys.astype(np.int64)
+  if int(keys.max()) >= PYTHON_HASH_MODULUS or int(keys.min()) <= -PYTHON_HASH_MODULUS:
+    return None
+  python_hashes = np.where(keys == -1, -2, keys) # hash(-1) is -2 in python
+  return mix64_array(python_hashes.view(np.uint64))
+
+def hashes_of(keys: typing.Iterable[typing.Hashable], hash_function: typing.Callable[[typing.Hashable], int]) -> tuple[list[typing.Hashable], np.ndarray]:
+  """
+  Hashes a batch of keys, for the bulk operations of the tables.
+  Integer arrays hashed by default_hash are hashed in a vectorized way.
+
+  Returns:
+    The keys as a list, and an uint64 array with their hashes
+  """
+  if isinstance(keys, np.ndarray):
+    key_hashes = default_hash_array(keys) if hash_function is default_hash else None
+    keys = keys.tolist()
+    if key_hashes is not None:
+      return keys, key_hashes
+  else:
+    keys = list(keys)
+  return keys, np.fromiter((hash_function(key) & MASK_64 for key in keys), np.uint64, len(keys))
+
+def next_power_of_two(value: int) -> int:
+  return 1 << max(value - 1, 0).bit_length()
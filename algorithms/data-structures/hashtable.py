@@ -2,13 +2,16 @@ import numpy as np
 from linkedlist import List
 import typing
 from dataclasses import dataclass
+from hashing import MASK_64, default_hash, hashes_of, next_power_of_two
 
-type KeyType = float
+type KeyType = typing.Hashable
+type HashFunction = typing.Callable[[KeyType], int]
 
 @dataclass
 class Pair:
   key: KeyType
   value: typing.Any
+  key_hash: int # cached, so a resize never calls the hash function again
 
 class DataNotFound(Exception):
   def __init__(self, key: typing.Any):
@@ -24,6 +27,23 @@ class HashTable:
     To resolve collisions, this implementation uses the List defined at _linkedlist.py_.
     which is a circular linked list.
 
+    Any hashable key is supported. The hash function is pluggable, and the default
+    one (see _hashing.py_) mixes the bits of the python hash(), so sequential or strided
+    keys are spread over the whole table. The capacity is always a power of two, so the
+    slot of a key is its hash masked by capacity - 1. The hash of each key is cached in
+    its Pair.
+
+    The batch operations (add_many/get_many/remove_many) hash all their keys at once, but
+    the lists are still walked in python, so they only save the overhead of the single
+    calls. The OpenAddressingHashTable looks up and inserts whole batches in a vectorized way.
+
+    The table grows (doubling its capacity) when the load factor goes above
+    max_load_factor, and shrinks (halving its capacity, never below the initial one)
+    when it goes below min_load_factor, so the lists stay short.
+    By default, all the values are rehashed into the new table at once, which is
+    amortized O(1) per operation. With incremental_rehash, only rehash_step buckets
+    are moved on each operation, so a single operation never pauses for a full rehash.
+
     All time complexities will be represented in two separated categories,-
     one that considers only the hash table implementation itself, and another one-
     that also considers the list implementation behind.
@@ -32,16 +52,53 @@ class HashTable:
 
     Args:
       capacity:
-        The table capacity - the internal array size 
+        The table capacity - the internal array size. Rounded up to a power of two
+      max_load_factor:
+        The load factor (size/capacity) above which the table grows. Defaults to 0.75
+      min_load_factor:
+        The load factor below which the table shrinks. Defaults to 0.1
+      incremental_rehash:
+        If true, the rehash is spread over the following operations. Defaults to False
+      rehash_step:
+        How many buckets are moved on each operation during an incremental rehash. Defaults to 4
+      hash_function:
+        The function that hashes a key into an integer. Defaults to default_hash
   """
-  def __init__(self, capacity: int):
+  def __init__(
+    self,
+    capacity: int,
+    max_load_factor: float = .75,
+    min_load_factor: float = .1,
+    incremental_rehash: bool = False,
+    rehash_step: int = 4,
+    hash_function: HashFunction = default_hash,
+  ):
+    if min_load_factor * 2 >= max_load_factor:
+      raise ValueError('min_load_factor must be less than half of max_load_factor')
+    capacity = next_power_of_two(capacity)
+    self._hash_function = hash_function
     self._table = np.empty(capacity, List) # initialize an empty numpy array of N size
     self._capacity = capacity
+    self._initial_capacity = capacity
     self._size = 0
+    self._max_load_factor = max_load_factor
+    self._min_load_factor = min_load_factor
+    self._incremental_rehash = incremental_rehash
+    self._rehash_step = rehash_step
+    # the table being emptied during an incremental rehash, and the next bucket to be moved
+    self._old_table = None
+    self._old_capacity = 0
+    self._rehash_index = 0
+
+  def _full_hash(self, key: KeyType) -> int:
+    return self._hash_function(key) & MASK_64
+
+  def _index(self, key_hash: int, capacity: int | None = None) -> int:
+    return key_hash & ((self._capacity if capacity is None else capacity) - 1)
+
+  def _hash(self, key: KeyType, capacity: int | None = None) -> int:
+    return self._index(self._full_hash(key), capacity)
 
-  def _hash(self, key: KeyType) -> int:
-    return key % self._capacity
-  
   @property
   def size(self) -> int:
     """
@@ -49,19 +106,94 @@ class HashTable:
     [time complexity: O(1)]
     """
     return self._size
-  
+
   @property
   def capacity(self) -> int:
     """
     The capacity of the hash_table/the size of the internal array.
+    During an incremental rehash, it is the capacity of the new array.
     [time complexity: O(1)]
     """
     return self._capacity
 
+  @property
+  def load_factor(self) -> float:
+    """
+    The number of values per slot of the table (size/capacity).
+    [time complexity: O(1)]
+    """
+    return self._size / self._capacity
+
+  @property
+  def is_rehashing(self) -> bool:
+    """
+    Whether an incremental rehash is in progress.
+    [time complexity: O(1)]
+    """
+    return self._old_table is not None
+
+  def _append_pair(self, pair: Pair):
+    position = self._index(pair.key_hash)
+    if self._table[position] == None:
+      self._table[position] = List()
+    self._table[position].append(pair)
+
+  def _move_bucket(self, index: int):
+    # moves a bucket of the old table into the new one, if it has not been moved yet
+    table_slot = self._old_table[index]
+    if table_slot is not None:
+      self._old_table[index] = None
+      for pair in table_slot:
+        self._append_pair(pair)
+
+  def _move_buckets(self, number_of_buckets: int):
+    # moves the next buckets of the old table into the new one
+    last_index = min(self._rehash_index + number_of_buckets, self._old_capacity)
+    for index in range(self._rehash_index, last_index):
+      self._move_bucket(index)
+    self._rehash_index = last_index
+    if self._rehash_index == self._old_capacity: # rehash done
+      self._old_table = None
+      self._old_capacity = 0
+      self._rehash_index = 0
+
+  def _resize(self, capacity: int):
+    if self.is_rehashing: # finishes the ongoing rehash first
+      self._move_buckets(self._old_capacity)
+    self._old_table = self._table
+    self._old_capacity = self._capacity
+    self._rehash_index = 0
+    self._table = np.empty(capacity, List)
+    self._capacity = capacity
+    if not self._incremental_rehash:
+      self._move_buckets(self._old_capacity)
+
+  def _before_operation(self):
+    if self.is_rehashing:
+      self._move_buckets(self._rehash_step)
+
+  def _after_operation(self):
+    if self.load_factor > self._max_load_factor:
+      self._resize(self._capacity * 2)
+    elif self.load_factor < self._min_load_factor and self._capacity > self._initial_capacity:
+      self._resize(max(self._capacity // 2, self._initial_capacity))
+
+  def _buckets_of(self, key_hash: int) -> list[List]:
+    # the lists where a key may be, from the oldest values to the newest ones
+    buckets = []
+    if self.is_rehashing:
+      old_position = self._index(key_hash, self._old_capacity)
+      if old_position >= self._rehash_index and self._old_table[old_position] is not None:
+        buckets.append(self._old_table[old_position])
+    position = self._index(key_hash)
+    if self._table[position] is not None:
+      buckets.append(self._table[position])
+    return buckets
+
   def add(self, key: KeyType, value: typing.Any):
     """
     Adds a value to the hash table.
-    [time complexity: O(1)/O(n)/O(n)]
+    [time complexity: amortized O(1)/O(1)/O(1)]
 
     Args:
       key:
@@ -69,53 +201,219 @@ class HashTable:
       value:
         The value to be added
     """
-    position = self._hash(key)
-    if self._table[position] == None:
-      self._table[position] = List()
-    self._table[position].append(Pair(key, value))
+    self._add_hashed(self._full_hash(key), key, value)
+
+  def _add_hashed(self, key_hash: int, key: KeyType, value: typing.Any):
+    self._before_operation()
+    if self.is_rehashing:
+      # the older pairs of the key must be moved first, so they stay in front of the new one
+      self._move_bucket(self._index(key_hash, self._old_capacity))
+    self._append_pair(Pair(key, value, key_hash))
     self._size += 1
+    self._after_operation()
 
   def get(self, key: KeyType) -> typing.Any:
     """
     Retrieves the value of the first occurrence of a given key.
-    [time complexity: O(n)]
-    
+    [time complexity: O(1)/O(n)/O(n), where n is the length of the list, kept short by the resizing]
+
     Args:
       key:
         The key of the value to be retrieved
     """
-    position = self._hash(key)
-    table_slot = self._table[position]
-    for pair in table_slot:
-      if pair.key == key:
-        return pair.value
+    self._before_operation()
+    return self._find(self._full_hash(key), key)
+
+  def _find(self, key_hash: int, key: KeyType) -> typing.Any:
+    # only reads the table, so it never moves buckets of an incremental rehash
+    for table_slot in self._buckets_of(key_hash):
+      for pair in table_slot:
+        if pair.key_hash == key_hash and pair.key == key:
+          return pair.value
     raise DataNotFound(key)
 
-  def remove(self, key: KeyType, all_occurrences = False):
+  def _remove_from(self, table_slot: List, key_hash: int, key: KeyType, all_occurrences: bool) -> int:
+    return table_slot.remove_where(lambda pair: pair.key_hash == key_hash and pair.key == key, all_occurrences)
+
+  def remove(self, key: KeyType, all_occurrences = False) -> int:
     """
     Removes a value from the list based on its key.
-    [time complexity: O(n)/O(n)/O(n2)]
+    The list is walked only once, even to remove all occurrences.
+    [time complexity: O(1)/O(n)/O(n)]
 
     Args:
       key:
         The key of the value to be removed
       all_occurrences:
-        If true, removes all occurrences of a given key, else, removes the first one 
+        If true, removes all occurrences of a given key, else, removes the first one
+
+    Returns:
+      The number of removed values
+    """
+    return self._remove_hashed(self._full_hash(key), key, all_occurrences)
+
+  def _remove_hashed(self, key_hash: int, key: KeyType, all_occurrences: bool) -> int:
+    self._before_operation()
+    removed = 0
+    for table_slot in self._buckets_of(key_hash):
+      removed += self._remove_from(table_slot, key_hash, key, all_occurrences)
+      if removed > 0 and not all_occurrences:
+        break
+    self._size -= removed
+    self._after_operation()
+    return removed
+
+  def save(self, path: str):
+    """
+    Writes the table to a snapshot file (see _snapshot.py_), that any process can open with HashTable.open.
+    [time complexity: O(n)]
+
+    Args:
+      path:
+        The snapshot file
+
+    Raises:
+      TypeError: A key has no stable hash (see stable_hash at _hashing.py_)
+    """
+    from snapshot import save_snapshot # snapshot imports this module
+    self._finish_rehash()
+    save_snapshot(((pair.key, pair.value) for table_slot in self._table if table_slot is not None for pair in table_slot), path)
+
+  @classmethod
+  def open(cls, path: str, mmap: bool = True, **kwargs) -> typing.Any:
+    """
+    Opens a snapshot file written by save.
+
+    Args:
+      path:
+        The snapshot file
+      mmap:
+        If true, returns a read-only MappedHashTable over the mapped file, that opens in constant
+        time and only unpickles the looked up entries. Else, loads all the entries into a new HashTable
+      kwargs:
+        The arguments of the new HashTable, when mmap is false
+
+    Returns:
+      A MappedHashTable or a HashTable
+    """
+    from snapshot import MappedHashTable
+    mapped = MappedHashTable(path)
+    if mmap:
+      return mapped
+    with mapped:
+      table = cls(kwargs.pop('capacity', mapped.capacity), **kwargs)
+      keys, values = [], []
+      for key, value in mapped.items():
+        keys.append(key)
+        values.append(value)
+    table.add_many(keys, values)
+    return table
+
+  def _group_by_bucket(self, key_hashes: np.ndarray) -> tuple[list[int], list[int]]:
+    # the bucket position of each key, and the key indices sorted by bucket
+    # (keeping their original order inside a bucket), as plain lists for fast iteration
+    positions = (key_hashes & np.uint64(self._capacity - 1)).astype(np.intp)
+    order = np.argsort(positions, kind='stable')
+    return positions.tolist(), order.tolist()
+
+  def _finish_rehash(self):
+    if self.is_rehashing:
+      self._move_buckets(self._old_capacity)
+
+  def add_many(self, keys: typing.Iterable[KeyType], values: typing.Iterable[typing.Any]):
+    """
+    Adds many values to the hash table at once.
+    The table is resized (at most) once for the whole batch, all positions are hashed
+    at once, and the values are added bucket by bucket.
+    [time complexity: O(n), where n is the number of values]
+
+    Args:
+      keys:
+        The keys of the values to be added, a numpy array or any iterable
+      values:
+        The values to be added, in the same order as the keys
+    """
+    keys, key_hashes = hashes_of(keys, self._hash_function)
+    values = list(values)
+    if len(keys) != len(values):
+      raise ValueError('keys and values must have the same length')
+
+    self._finish_rehash()
+    capacity = self._capacity
+    while (self._size + len(keys)) / capacity > self._max_load_factor:
+      capacity *= 2
+    if capacity != self._capacity:
+      self._resize(capacity)
+      self._finish_rehash()
+
+    positions, order = self._group_by_bucket(key_hashes)
+    key_hashes = key_hashes.tolist()
+    buckets = self._table.tolist()
+    for index in order:
+      position = positions[index]
+      table_slot = buckets[position]
+      if table_slot is None:
+        table_slot = buckets[position] = self._table[position] = List()
+      table_slot.append(Pair(keys[index], values[index], key_hashes[index]))
+    self._size += len(keys)
+
+  def get_many(self, keys: typing.Iterable[KeyType]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Retrieves the values of the first occurrences of many keys at once.
+    All the keys are hashed at once, but each of them still walks its list in python,
+    so this is only a loop of get calls without the raised DataNotFound: the vectorized
+    lookup of a whole batch is only available in the OpenAddressingHashTable.
+    [time complexity: O(n)/O(m)/O(n * m), where n is the number of keys and m the length of the lists]
+
+    Args:
+      keys:
+        The keys of the values to be retrieved, a numpy array or any iterable
+
+    Returns:
+      A tuple with an object array of the values (None where the key is missing)
+      and a boolean array that is true where the key is missing
+    """
+    keys, key_hashes = hashes_of(keys, self._hash_function)
+    values: list[typing.Any] = [None] * len(keys)
+    missing = np.zeros(len(keys), bool)
+    for index, (key, key_hash) in enumerate(zip(keys, key_hashes.tolist())):
+      try:
+        values[index] = self._find(key_hash, key)
+      except DataNotFound:
+        missing[index] = True
+    return np.fromiter(values, object, len(values)), missing
+
+  def remove_many(self, keys: typing.Iterable[KeyType], all_occurrences = False) -> int:
+    """
+    Removes the values of many keys at once.
+    The table is resized (at most) once for the whole batch.
+
+    Args:
+      keys:
+        The keys of the values to be removed, a numpy array or any iterable
+      all_occurrences:
+        If true, removes all occurrences of each key, else, removes the first one
+
+    Returns:
+      The number of removed values
     """
-    position = self._hash(key)
-    if self._table[position] is not None:
-      index = 0
-      while True:
-        try:
-          pair = self._table[position].at(index)
-          if pair.key == key:
-            self._table[position].pop(index)
-            self._size -= 1
-            if not all_occurrences:
-              return
-            index = 0
-          else:
-            index += 1
-        except IndexError:
-          return
+    keys, key_hashes = hashes_of(keys, self._hash_function)
+    self._finish_rehash()
+    removed = 0
+    positions, order = self._group_by_bucket(key_hashes)
+    buckets = self._table.tolist()
+    key_hashes = key_hashes.tolist()
+    for index in order:
+      table_slot = buckets[positions[index]]
+      if table_slot is not None:
+        removed += self._remove_from(table_slot, key_hashes[index], keys[index], all_occurrences)
+    self._size -= removed
+
+    capacity = self._capacity
+    while self._size / capacity < self._min_load_factor and capacity // 2 >= self._initial_capacity:
+      capacity //= 2
+    if capacity != self._capacity:
+      self._resize(capacity)
+      self._finish_rehash()
+    return removed
 
@@ -1,36 +1,27 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import typing
 
-@dataclass
+@dataclass(slots=True, eq=False) # nodes are compared by identity
 class Node:
   value: typing.Any
-  previous_node = None
-  next_node = None
-  
-class Iterator:
-  def __init__(self, head_node: Node, list_size: int):
-    self.node = head_node
-    self.list_size = list_size
-    self.current_index = 0
-
-  def __iter__(self):
-    return self
-  
-  def __next__(self):
-    if self.list_size == self.current_index:
-      raise StopIteration
-    value = self.node.value
-    self.node = self.node.next_node
-    self.current_index += 1
-    return value
- 
+  previous_node: 'Node' = field(default=None, repr=False)
+  next_node: 'Node' = field(default=None, repr=False)
+
 class List:
-  """A circular linked list"""
+  """
+    A circular linked list.
+
+    The list keeps a finger: the last accessed node and its index. An indexed
+    access walks from the closest of the head, the tail and the finger, so
+    accessing the indices in order (or near the last accessed one) is O(1).
+  """
 
   def __init__(self):
     self._head: Node = None
     self._tail: Node = None
     self._size: int = 0
+    self._finger: Node = None
+    self._finger_index: int = 0
 
   def __str__(self) -> str:
     return self.__repr__()
@@ -49,15 +40,49 @@ class List:
     str_repr += ']'
     return str_repr
   
-  def __iter__(self) -> Node:
-    return Iterator(self._head, self.size)
+  @classmethod
+  def from_iterable(cls, values: typing.Iterable[typing.Any]) -> 'List':
+    """
+    Creates a list with the given values, linking all the nodes in a single pass.
+    [time complexity: O(n)]
+    """
+    list = cls()
+    list.extend(values)
+    return list
+
+  def __iter__(self) -> typing.Iterator[typing.Any]:
+    node = self._head
+    for _ in range(0, self._size):
+      yield node.value
+      node = node.next_node
+
+  def __reversed__(self) -> typing.Iterator[typing.Any]:
+    node = self._tail
+    for _ in range(0, self._size):
+      yield node.value
+      node = node.previous_node
+
+  def __len__(self) -> int:
+    return self._size
+
+  def __getitem__(self, index: int | slice) -> typing.Any:
+    """
+    Returns the value at a given index (see at), or a new List with the values of a slice.
+    [time complexity: O(1) near the last accessed index, else O(n). O(k) for a slice of k values]
+    """
+    if isinstance(index, slice):
+      sliced = List()
+      for position in range(*index.indices(self._size)):
+        sliced.append(self._get_node_at(position).value)
+      return sliced
+    return self._get_node_at(index).value
 
   @property
   def size(self) -> int:
     """The size of the list"""
     return self._size
 
-  def append(self, value: typing.Any) -> None:
+  def append(self, value: typing.Any) -> Node:
     """
     Appends/adds an element to the end of the list
     [time complexity: O(1)]
@@ -65,8 +90,15 @@ class List:
     Args:
       value:
         The value to be appended
+
+    Returns:
+      The node of the value, that can be passed to move_to_end and remove_node
     """
     new_node = Node(value)
+    self._link_at_tail(new_node)
+    return new_node
+
+  def _link_at_tail(self, new_node: Node) -> None:
     if self._head is None: # when the list is empty
       self._head = new_node
       self._tail = self._head
@@ -83,13 +115,42 @@ class List:
     self._tail.next_node = self._head
     self._size+=1
 
+  def extend(self, values: typing.Iterable[typing.Any]) -> None:
+    """
+    Appends all the given values to the end of the list.
+    The new nodes are linked to each other in a single pass, and to the list only once.
+    [time complexity: O(k), where k is the number of values]
+
+    Args:
+      values:
+        The values to be appended
+    """
+    first = last = None
+    count = 0
+    for value in values:
+      node = Node(value, last)
+      if last is None:
+        first = node
+      else:
+        last.next_node = node
+      last = node
+      count += 1
+    if first is None:
+      return
+
+    if self._head is None: # when the list is empty
+      self._head = first
+    else:
+      first.previous_node = self._tail
+      self._tail.next_node = first
+    self._tail = last
+    self._head.previous_node = self._tail
+    self._tail.next_node = self._head
+    self._size += count
+
   def _convert_nagative_index_into_positive(self, negative_index: int) -> int:
     return self.size - abs(negative_index)
   
-  def _is_index_closest_to_the_head(self, index: int) -> bool:
-    mid_index = ((self.size - 1) // 2)
-    return index <= mid_index if mid_index // 2 == 0 else index <= mid_index + 1
-  
   def _get_node_at(self, index: int) -> Node:
     converted_index = index
     if index < 0:
@@ -98,15 +159,22 @@ class List:
     if converted_index > self.size - 1 or converted_index < 0:
       raise IndexError(f'Index [{index}] is out of range')
     
-    if self._is_index_closest_to_the_head(converted_index): # closest to the head
-      node = self._head
-      for i in range(0, converted_index):
+    # starts from the closest of the head, the tail and the finger
+    node, steps = self._head, converted_index
+    if self.size - 1 - converted_index < abs(steps):
+      node, steps = self._tail, converted_index - (self.size - 1)
+    if self._finger is not None and abs(converted_index - self._finger_index) < abs(steps):
+      node, steps = self._finger, converted_index - self._finger_index
+
+    if steps > 0: # walks forward
+      for i in range(0, steps):
         node = node.next_node
-    else: # closest to the tail
-      node = self._tail
-      for i in range(self.size-1, converted_index, -1):
-        node = self._tail.previous_node
-    
+    else: # walks backward
+      for i in range(0, -steps):
+        node = node.previous_node
+
+    self._finger = node
+    self._finger_index = converted_index
     return node
 
   def pop(self, index: int = -1) -> None:
@@ -123,24 +191,68 @@ class List:
     Raises:
       IndexError: The given index is out of range
     """
-    node = self._get_node_at(index)
+    self._unlink(self._get_node_at(index))
 
-    if node == self._head and node == self._tail: # list has only one node
+  def _unlink(self, node: Node) -> None:
+    self._finger = None # the indices after the node change
+    if node is self._head and node is self._tail: # list has only one node
       self._head = None
       self._tail = None
-    elif node == self._head: # given node is the head
+    elif node is self._head: # given node is the head
       self._head = node.next_node
-    elif node == self._tail: # given node is the tail
+    elif node is self._tail: # given node is the tail
       self._tail = node.previous_node
 
     node.previous_node.next_node = node.next_node
     node.next_node.previous_node = node.previous_node
     self._size-=1
 
+  def remove_node(self, node: Node) -> None:
+    """
+    Removes a node (returned by append) from the list.
+    [time complexity: O(1)]
+    """
+    self._unlink(node)
+
+  def move_to_end(self, node: Node) -> None:
+    """
+    Moves a node (returned by append) to the end of the list.
+    [time complexity: O(1)]
+    """
+    if node is not self._tail:
+      self._unlink(node)
+      self._link_at_tail(node)
+
+  def remove_where(self, predicate: typing.Callable[[typing.Any], bool], all_occurrences = False) -> int:
+    """
+    Removes the values that match a predicate, unlinking their nodes in a single pass.
+    [time complexity: O(n)]
+
+    Args:
+      predicate:
+        The function that tells if a value must be removed
+      all_occurrences:
+        If true, removes all the matching values, else, removes the first one
+
+    Returns:
+      The number of removed values
+    """
+    removed = 0
+    node = self._head
+    for _ in range(0, self.size):
+      next_node = node.next_node
+      if predicate(node.value):
+        self._unlink(node)
+        removed += 1
+        if not all_occurrences:
+          break
+      node = next_node
+    return removed
+
   def at(self, index: int) -> typing.Any:
     """
     Returns the value at a given index
-    [time complexity: O(n)]
+    [time complexity: O(1) near the last accessed index, else O(n)]
 
     Args:
       index:
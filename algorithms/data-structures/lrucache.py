@@ -0,0 +1,226 @@
+import functools
+import time
+import typing
+from dataclasses import dataclass
+from hashtable import HashTable, DataNotFound, KeyType
+from linkedlist import List, Node
+
+# separates the positional arguments from the keyword ones in the memoize keys, so they never collide
+_KWARGS_MARK = object()
+
+@dataclass
+class CacheEntry:
+  key: KeyType
+  value: typing.Any
+  size: int
+  expires_at: float | None # None when the entry never expires
+
+class LRUCache:
+  """
+    A bounded cache that evicts the least recently used entries.
+
+    The HashTable maps each key to its node in a List, which keeps the entries in
+    recency order: the head is the least recently used entry and the tail is the most
+    recently used one. A hit moves its node to the tail and an eviction pops the head,
+    both in O(1).
+
+    The cache can be bounded by a number of entries, by a total size (the sum of
+    size_of(value) of the entries), or by both. Entries can expire after a time to live,
+    and expired entries are dropped when they are found (on a lookup or an eviction).
+
+    Args:
+      max_entries:
+        The maximum number of entries. Defaults to None (unbounded)
+      max_size:
+        The maximum total size of the entries. Defaults to None (unbounded)
+      size_of:
+        The function that gives the size of a value. Defaults to 1 per value
+      ttl:
+        The default time to live of the entries, in seconds. Defaults to None (no expiration)
+      clock:
+        The function that gives the current time, in seconds. Defaults to time.monotonic
+  """
+  def __init__(
+    self,
+    max_entries: int | None = None,
+    max_size: int | None = None,
+    size_of: typing.Callable[[typing.Any], int] = lambda value: 1,
+    ttl: float | None = None,
+    clock: typing.Callable[[], float] = time.monotonic,
+  ):
+    if max_entries is not None and max_entries < 1:
+      raise ValueError('max_entries must be at least 1')
+    self._max_entries = max_entries
+    self._max_size = max_size
+    self._size_of = size_of
+    self._ttl = ttl
+    self._clock = clock
+    self._table = HashTable(16)
+    self._order = List()
+    self._total_size = 0
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+    self.expirations = 0
+
+  @property
+  def size(self) -> int:
+    """
+    The number of entries in the cache, including the expired ones not dropped yet.
+    [time complexity: O(1)]
+    """
+    return self._order.size
+
+  @property
+  def total_size(self) -> int:
+    """
+    The sum of the sizes of the entries.
+    [time complexity: O(1)]
+    """
+    return self._total_size
+
+  @property
+  def hit_rate(self) -> float:
+    lookups = self.hits + self.misses
+    return self.hits / lookups if lookups > 0 else 0
+
+  def _is_expired(self, entry: CacheEntry) -> bool:
+    return entry.expires_at is not None and entry.expires_at <= self._clock()
+
+  def _drop(self, node: Node):
+    entry = node.value
+    self._table.remove(entry.key)
+    self._order.remove_node(node)
+    self._total_size -= entry.size
+
+  def _is_full(self) -> bool:
+    return (
+      (self._max_entries is not None and self._order.size > self._max_entries)
+      or (self._max_size is not None and self._total_size > self._max_size)
+    )
+
+  def _evict(self):
+    while self._is_full():
+      entry = self._order.at(0) # the least recently used entry
+      if self._is_expired(entry):
+        self.expirations += 1
+      else:
+        self.evictions += 1
+      self._drop(self._table.get(entry.key))
+
+  def get(self, key: KeyType) -> typing.Any:
+    """
+    Retrieves the value of a key, and marks it as the most recently used one.
+    [time complexity: O(1)]
+
+    Args:
+      key:
+        The key of the value to be retrieved
+
+    Raises:
+      DataNotFound: There is no value with the given key, or it has expired
+    """
+    try:
+      node = self._table.get(key)
+    except DataNotFound:
+      self.misses += 1
+      raise
+    if self._is_expired(node.value):
+      self.expirations += 1
+      self.misses += 1
+      self._drop(node)
+      raise DataNotFound(key)
+    self.hits += 1
+    self._order.move_to_end(node)
+    return node.value.value
+
+  def put(self, key: KeyType, value: typing.Any, ttl: float | None = None):
+    """
+    Adds or replaces the value of a key, evicting the least recently used entries if the cache is full.
+    A value larger than max_size is not cached.
+    [time complexity: amortized O(1)]
+
+    Args:
+      key:
+        The key of the value
+      value:
+        The value to be cached
+      ttl:
+        The time to live of this entry, in seconds. Defaults to the ttl of the cache
+    """
+    self.remove(key)
+    size = self._size_of(value)
+    if self._max_size is not None and size > self._max_size:
+      return
+    ttl = self._ttl if ttl is None else ttl
+    entry = CacheEntry(key, value, size, None if ttl is None else self._clock() + ttl)
+    self._table.add(key, self._order.append(entry))
+    self._total_size += size
+    self._evict()
+
+  def remove(self, key: KeyType) -> bool:
+    """
+    Removes the value of a key.
+    [time complexity: O(1)]
+
+    Returns:
+      True if the key was in the cache
+    """
+    try:
+      node = self._table.get(key)
+    except DataNotFound:
+      return False
+    self._drop(node)
+    return True
+
+  def clear(self):
+    """Removes all the entries, keeping the counters"""
+    self._table = HashTable(16)
+    self._order = List()
+    self._total_size = 0
+
+  def purge_expired(self) -> int:
+    """
+    Drops all the expired entries.
+    [time complexity: O(n)]
+
+    Returns:
+      The number of dropped entries
+    """
+    expired = [entry.key for entry in self._order if self._is_expired(entry)]
+    for key in expired:
+      self.remove(key)
+    self.expirations += len(expired)
+    return len(expired)
+
+def memoize(
+  max_entries: int | None = 128,
+  max_size: int | None = None,
+  size_of: typing.Callable[[typing.Any], int] = lambda value: 1,
+  ttl: float | None = None,
+):
+  """
+  Caches the results of a function in an LRUCache, keyed by its arguments
+  (that must be hashable). The cache is available as the cache attribute of the function.
+
+  Usage example:
+    @memoize(max_entries=32)
+    def generate_board(seed: int) -> Board:
+      ...
+  """
+  def decorator(function):
+    cache = LRUCache(max_entries, max_size, size_of, ttl)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+      key = (*args, _KWARGS_MARK, *sorted(kwargs.items())) if kwargs else args
+      try:
+        return cache.get(key)
+      except DataNotFound:
+        value = function(*args, **kwargs)
+        cache.put(key, value)
+        return value
+
+    wrapper.cache = cache
+    return wrapper
+  return decorator
@@ -0,0 +1,319 @@
+import numpy as np
+import typing
+from hashtable import DataNotFound, KeyType, HashFunction
+from hashing import MASK_64, default_hash, hashes_of, next_power_of_two
+
+# the state of a slot
+EMPTY = 0
+OCCUPIED = 1
+DELETED = 2 # tombstone
+
+class OpenAddressingHashTable:
+  """
+    A HashMap data structure using open addressing, with the same API as the HashTable.
+
+    Instead of a list per slot, the entries are stored in parallel contiguous
+    numpy arrays (the key hashes, the keys, the values and a state byte per slot),
+    and collisions are resolved by linear probing, so there is no allocation
+    per entry and no pointer chasing.
+
+    As in the HashTable, the hash function is pluggable, the capacity is always a
+    power of two and the slot of a key is its hash masked by capacity - 1.
+
+    Removed entries leave a tombstone, so the probing goes on past them.
+    Tombstones are never reused by an insertion, which keeps the entries with
+    the same key in insertion order along the probe sequence (the first
+    occurrence of a key is always found first). They are dropped on resize,
+    and they count towards the load factor that triggers a grow.
+
+    Args:
+      capacity:
+        The table capacity - the internal arrays size. Rounded up to a power of two
+      max_load_factor:
+        The load factor (occupied and deleted slots/capacity) above which the table grows. Defaults to 0.75
+      min_load_factor:
+        The load factor (size/capacity) below which the table shrinks. Defaults to 0.1
+      hash_function:
+        The function that hashes a key into an integer. Defaults to default_hash
+  """
+  def __init__(self, capacity: int, max_load_factor: float = .75, min_load_factor: float = .1, hash_function: HashFunction = default_hash):
+    if min_load_factor * 2 >= max_load_factor:
+      raise ValueError('min_load_factor must be less than half of max_load_factor')
+    if max_load_factor >= 1:
+      raise ValueError('max_load_factor must be less than 1, at least one slot must be empty')
+    capacity = next_power_of_two(capacity)
+    self._hash_function = hash_function
+    self._initial_capacity = capacity
+    self._max_load_factor = max_load_factor
+    self._min_load_factor = min_load_factor
+    self._allocate(capacity)
+
+  def _allocate(self, capacity: int):
+    self._capacity = capacity
+    self._hashes = np.zeros(capacity, np.uint64)
+    self._keys = np.empty(capacity, object)
+    self._values = np.empty(capacity, object)
+    self._states = np.zeros(capacity, np.uint8) # EMPTY
+    self._size = 0
+    self._number_of_deleted = 0
+
+  def _full_hash(self, key: KeyType) -> int:
+    return self._hash_function(key) & MASK_64
+
+  def _hash(self, key: KeyType) -> int:
+    return self._full_hash(key) & (self._capacity - 1)
+
+  @property
+  def size(self) -> int:
+    """
+    The size of the hash table/the number of values in it.
+    [time complexity: O(1)]
+    """
+    return self._size
+
+  @property
+  def capacity(self) -> int:
+    """
+    The capacity of the hash_table/the size of the internal arrays.
+    [time complexity: O(1)]
+    """
+    return self._capacity
+
+  @property
+  def load_factor(self) -> float:
+    """
+    The number of values per slot of the table (size/capacity).
+    [time complexity: O(1)]
+    """
+    return self._size / self._capacity
+
+  def _insert(self, key_hash: int, key: KeyType, value: typing.Any):
+    mask = self._capacity - 1
+    position = key_hash & mask
+    while self._states[position] != EMPTY:
+      position = (position + 1) & mask
+    self._hashes[position] = key_hash
+    self._keys[position] = key
+    self._values[position] = value
+    self._states[position] = OCCUPIED
+    self._size += 1
+
+  def _insert_many(self, key_hashes: np.ndarray, keys: np.ndarray, values: np.ndarray):
+    # inserts a batch in rounds of probing: the pending entries on an empty slot claim it, the first
+    # of them (in batch order) gets it, and the others move to the next slot. The entries sharing a
+    # key move together until one of them gets a slot, so they stay in batch order along the probe sequence
+    mask = self._capacity - 1
+    pending = np.arange(len(keys))
+    positions = (key_hashes & np.uint64(mask)).astype(np.intp)
+    # the first claim of each slot. A claimed slot is always taken, so it is never claimed again
+    first_claims = np.full(self._capacity, len(keys), np.intp)
+    while pending.size > 0:
+      on_empty = np.flatnonzero(self._states[positions] == EMPTY)
+      claimed, claims = positions[on_empty], pending[on_empty]
+      np.minimum.at(first_claims, claimed, claims)
+      placed = on_empty[first_claims[claimed] == claims]
+      slots, entries = positions[placed], pending[placed]
+      self._hashes[slots] = key_hashes[entries]
+      self._keys[slots] = keys[entries]
+      self._values[slots] = values[entries]
+      self._states[slots] = OCCUPIED
+      unplaced = np.ones(pending.size, bool)
+      unplaced[placed] = False
+      pending = pending[unplaced]
+      positions = (positions[unplaced] + 1) & mask
+    self._size += len(keys)
+
+  def _resize(self, capacity: int):
+    occupied = np.flatnonzero(self._states == OCCUPIED)
+    hashes, keys, values = self._hashes[occupied], self._keys[occupied], self._values[occupied]
+    # reinserting by distance from the home slot keeps the entries sharing a key
+    # (and so a home slot) in insertion order
+    mask = self._capacity - 1
+    order = np.argsort((occupied - (hashes & np.uint64(mask)).astype(np.intp)) & mask, kind='stable')
+    self._allocate(capacity)
+    self._insert_many(hashes[order], keys[order], values[order])
+
+  def _delete(self, position: int):
+    self._states[position] = DELETED
+    self._keys[position] = None
+    self._values[position] = None
+    self._size -= 1
+    self._number_of_deleted += 1
+
+  def _shrink_if_needed(self):
+    capacity = self._capacity
+    while self._size / capacity < self._min_load_factor and capacity // 2 >= self._initial_capacity:
+      capacity //= 2
+    if capacity != self._capacity:
+      self._resize(capacity)
+
+  def _probe(self, key_hash: int, key: KeyType) -> typing.Iterator[int]:
+    # the positions of the entries with a given key, in insertion order
+    mask = self._capacity - 1
+    position = key_hash & mask
+    while self._states[position] != EMPTY:
+      if self._states[position] == OCCUPIED and self._hashes[position] == key_hash and self._keys[position] == key:
+        yield position
+      position = (position + 1) & mask
+
+  def add(self, key: KeyType, value: typing.Any):
+    """
+    Adds a value to the hash table.
+    [time complexity: amortized O(1)]
+
+    Args:
+      key:
+        The key of the value to be added
+      value:
+        The value to be added
+    """
+    self._insert(self._full_hash(key), key, value)
+    if (self._size + self._number_of_deleted) / self._capacity > self._max_load_factor:
+      # when most of the load are tombstones, a rehash at the same capacity is enough
+      grow = self._size / self._capacity > self._max_load_factor / 2
+      self._resize(self._capacity * 2 if grow else self._capacity)
+
+  def get(self, key: KeyType) -> typing.Any:
+    """
+    Retrieves the value of the first occurrence of a given key.
+    [time complexity: O(1) on average]
+
+    Args:
+      key:
+        The key of the value to be retrieved
+    """
+    for position in self._probe(self._full_hash(key), key):
+      return self._values[position]
+    raise DataNotFound(key)
+
+  def remove(self, key: KeyType, all_occurrences = False) -> int:
+    """
+    Removes a value from the table based on its key.
+    [time complexity: O(1) on average]
+
+    Args:
+      key:
+        The key of the value to be removed
+      all_occurrences:
+        If true, removes all occurrences of a given key, else, removes the first one
+
+    Returns:
+      The number of removed values
+    """
+    removed = 0
+    for position in self._probe(self._full_hash(key), key):
+      self._delete(position)
+      removed += 1
+      if not all_occurrences:
+        break
+    self._shrink_if_needed()
+    return removed
+
+  def add_many(self, keys: typing.Iterable[KeyType], values: typing.Iterable[typing.Any]):
+    """
+    Adds many values to the hash table at once.
+    The table is resized (at most) once for the whole batch, and all the keys are
+    probed together, the ones that claim the same empty slot being placed in batch order.
+    [time complexity: O(n), where n is the number of values]
+
+    Args:
+      keys:
+        The keys of the values to be added, a numpy array or any iterable
+      values:
+        The values to be added, in the same order as the keys
+    """
+    keys, key_hashes = hashes_of(keys, self._hash_function)
+    values = list(values)
+    if len(keys) != len(values):
+      raise ValueError('keys and values must have the same length')
+
+    capacity = self._capacity
+    while (self._size + self._number_of_deleted + len(keys)) / capacity > self._max_load_factor:
+      capacity *= 2
+    if capacity != self._capacity:
+      self._resize(capacity)
+    self._insert_many(key_hashes, np.fromiter(keys, object, len(keys)), np.fromiter(values, object, len(values)))
+
+  def get_many(self, keys: typing.Iterable[KeyType]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Retrieves the values of the first occurrences of many keys at once.
+    All the keys are probed together: each round compares every pending key with
+    its current slot in a vectorized way, and moves the unresolved ones to the next slot.
+    [time complexity: O(n), where n is the number of keys]
+
+    Args:
+      keys:
+        The keys of the values to be retrieved, a numpy array or any iterable
+
+    Returns:
+      A tuple with an object array of the values (None where the key is missing)
+      and a boolean array that is true where the key is missing
+    """
+    keys, hashes = hashes_of(keys, self._hash_function)
+    key_array = np.fromiter(keys, object, len(keys))
+    result = np.empty(len(keys), object)
+    missing = np.zeros(len(keys), bool)
+
+    mask = self._capacity - 1
+    pending = np.arange(len(keys))
+    positions = (hashes & np.uint64(mask)).astype(np.intp)
+    while pending.size > 0:
+      states = self._states[positions]
+      empty = states == EMPTY
+      missing[pending[empty]] = True
+      found = (states == OCCUPIED) & (self._hashes[positions] == hashes[pending])
+      found[found] = (self._keys[positions[found]] == key_array[pending[found]]).astype(bool)
+      result[pending[found]] = self._values[positions[found]]
+      unresolved = ~(empty | found)
+      pending = pending[unresolved]
+      positions = (positions[unresolved] + 1) & mask
+    return result, missing
+
+  def remove_many(self, keys: typing.Iterable[KeyType], all_occurrences = False) -> int:
+    """
+    Removes the values of many keys at once.
+    The table is resized (at most) once for the whole batch, and all the keys are probed
+    together as in get_many. When several keys of the batch find the same entry, the first
+    of them removes it and the others go on to the next occurrence, as in a loop of remove calls.
+    [time complexity: O(n), where n is the number of keys]
+
+    Args:
+      keys:
+        The keys of the values to be removed, a numpy array or any iterable
+      all_occurrences:
+        If true, removes all occurrences of each key, else, removes the first one
+
+    Returns:
+      The number of removed values
+    """
+    keys, hashes = hashes_of(keys, self._hash_function)
+    key_array = np.fromiter(keys, object, len(keys))
+    removed = 0
+
+    mask = self._capacity - 1
+    pending = np.arange(len(keys))
+    positions = (hashes & np.uint64(mask)).astype(np.intp)
+    # the first claim of each entry, as in _insert_many. A claimed entry is always removed
+    first_claims = np.full(self._capacity, len(keys), np.intp)
+    while pending.size > 0:
+      states = self._states[positions]
+      found = (states == OCCUPIED) & (self._hashes[positions] == hashes[pending])
+      found[found] = (self._keys[positions[found]] == key_array[pending[found]]).astype(bool)
+      on_found = np.flatnonzero(found)
+      claimed, claims = positions[on_found], pending[on_found]
+      np.minimum.at(first_claims, claimed, claims)
+      first = on_found[first_claims[claimed] == claims]
+      slots = positions[first]
+      self._states[slots] = DELETED
+      self._keys[slots] = None
+      self._values[slots] = None
+      removed += slots.size
+      unresolved = states != EMPTY
+      if not all_occurrences:
+        unresolved[first] = False
+      pending = pending[unresolved]
+      positions = (positions[unresolved] + 1) & mask
+    self._size -= removed
+    self._number_of_deleted += removed
+    self._shrink_if_needed()
+    return removed
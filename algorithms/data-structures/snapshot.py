@@ -0,0 +1,143 @@
+"""
+  The on-disk snapshot format of the hash tables (see HashTable.save and HashTable.open).
+
+  All the numbers are little endian, and all the arrays are 8 bytes aligned:
+
+    header          magic (4 bytes), version (uint32), capacity (uint64), size (uint64), reserved (uint64)
+    bucket index    capacity + 1 uint64, the first entry of each bucket (the entries are sorted by bucket)
+    hashes          size uint64, the stable_hash of each key
+    offsets         size + 1 uint64, where the record of each entry starts in the records
+    key lengths     size uint64, the length of the key part of each record
+    records         the pickled key of each entry, followed by its pickled value
+
+  The keys are hashed with stable_hash (the python hash() of strings changes on each process),
+  so the file can be opened by any process, whatever the hash function of the saved table.
+  Entries with the same key keep their order, so the first occurrence is found first.
+
+  The records are pickled, so only open snapshots from trusted sources.
+"""
+import mmap as mmap_module
+import pickle
+import struct
+import typing
+import numpy as np
+from hashtable import DataNotFound, KeyType
+from hashing import stable_hash, next_power_of_two
+
+MAGIC = b'PYHT'
+VERSION = 1
+HEADER = struct.Struct('<4sIQQQ')
+
+def save_snapshot(pairs: typing.Iterable[tuple[KeyType, typing.Any]], path: str):
+  """
+  Writes the (key, value) pairs to a snapshot file.
+
+  Raises:
+    TypeError: A key has no stable hash
+  """
+  keys, records, key_lengths = [], [], []
+  for key, value in pairs:
+    key_record = pickle.dumps(key, pickle.HIGHEST_PROTOCOL)
+    keys.append(key)
+    key_lengths.append(len(key_record))
+    records.append(key_record + pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+  size = len(keys)
+  capacity = next_power_of_two(max(size, 1))
+  hashes = np.fromiter((stable_hash(key) for key in keys), np.uint64, size)
+  order = np.argsort(hashes & np.uint64(capacity - 1), kind='stable')
+  hashes = hashes[order]
+  index = np.searchsorted(hashes & np.uint64(capacity - 1), np.arange(capacity + 1, dtype=np.uint64)).astype(np.uint64)
+  sorted_records = [records[position] for position in order.tolist()]
+  offsets = np.zeros(size + 1, np.uint64)
+  np.cumsum([len(record) for record in sorted_records], out=offsets[1:])
+
+  with open(path, 'wb') as file:
+    file.write(HEADER.pack(MAGIC, VERSION, capacity, size, 0))
+    file.write(index.tobytes())
+    file.write(hashes.tobytes())
+    file.write(offsets.tobytes())
+    file.write(np.asarray(key_lengths, np.uint64)[order].tobytes())
+    for record in sorted_records:
+      file.write(record)
+
+class MappedHashTable:
+  """
+    A read-only hash table over a snapshot file, returned by HashTable.open.
+
+    Opening it only reads the header: the arrays are numpy views of the mapped file
+    and only the records of the looked up keys are unpickled, so it opens in constant
+    time, and the processes that open the same file share its pages.
+
+    Args:
+      path:
+        The snapshot file
+  """
+  def __init__(self, path: str):
+    with open(path, 'rb') as file:
+      self._buffer = mmap_module.mmap(file.fileno(), 0, access=mmap_module.ACCESS_READ)
+    magic, version, capacity, size, _ = HEADER.unpack_from(self._buffer)
+    if magic != MAGIC or version != VERSION:
+      raise ValueError(f'[{path}] is not a hash table snapshot (version {VERSION})')
+    self._capacity = capacity
+    self._size = size
+
+    position = HEADER.size
+    def array(length: int) -> np.ndarray:
+      nonlocal position
+      view = np.frombuffer(self._buffer, np.uint64, length, position)
+      position += length * 8
+      return view
+    self._index = array(capacity + 1)
+    self._hashes = array(size)
+    self._offsets = array(size + 1)
+    self._key_lengths = array(size)
+    self._records_start = position
+
+  @property
+  def size(self) -> int:
+    return self._size
+
+  @property
+  def capacity(self) -> int:
+    return self._capacity
+
+  def _record(self, entry: int) -> tuple[int, int, int]:
+    # where the key and the value of an entry start, and where the value ends
+    start = self._records_start + int(self._offsets[entry])
+    return start, start + int(self._key_lengths[entry]), self._records_start + int(self._offsets[entry + 1])
+
+  def get(self, key: KeyType) -> typing.Any:
+    """
+    Retrieves the value of the first occurrence of a given key.
+    [time complexity: O(1) on average]
+
+    Args:
+      key:
+        The key of the value to be retrieved
+    """
+    key_hash = stable_hash(key)
+    bucket = key_hash & (self._capacity - 1)
+    for entry in range(int(self._index[bucket]), int(self._index[bucket + 1])):
+      if self._hashes[entry] == key_hash:
+        key_start, value_start, value_end = self._record(entry)
+        if pickle.loads(self._buffer[key_start:value_start]) == key:
+          return pickle.loads(self._buffer[value_start:value_end])
+    raise DataNotFound(key)
+
+  def items(self) -> typing.Iterator[tuple[KeyType, typing.Any]]:
+    """The (key, value) pairs, grouped by bucket, with the same keys in their saved order"""
+    for entry in range(0, self._size):
+      key_start, value_start, value_end = self._record(entry)
+      yield pickle.loads(self._buffer[key_start:value_start]), pickle.loads(self._buffer[value_start:value_end])
+
+  def close(self):
+    """Unmaps the file. The table cannot be used after that"""
+    self._index = self._hashes = self._offsets = self._key_lengths = None
+    self._buffer.close()
+
+  def __enter__(self) -> 'MappedHashTable':
+    return self
+
+  def __exit__(self, *exception):
+    self.close()
@@ -0,0 +1,90 @@
+import sys
+import threading
+import unittest
+from concurrenthashtable import ConcurrentHashTable
+from hashtable import DataNotFound
+
+class ConcurrentHashTableTest(unittest.TestCase):
+  def setUp(self):
+    # switches threads more often, so the races show up in a short test
+    self.switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+  def tearDown(self):
+    sys.setswitchinterval(self.switch_interval)
+
+  def run_threads(self, target, number_of_threads: int):
+    errors = []
+    def run(index: int):
+      try:
+        target(index)
+      except Exception as error:
+        errors.append(error)
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(0, number_of_threads)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+    self.assertEqual([], errors)
+
+  def test_add_get_remove(self):
+    table = ConcurrentHashTable(16, number_of_stripes=4)
+
+    table.add(0, 'a str')
+    table.add(1, 12)
+    table.add(0, 8)
+
+    self.assertEqual('a str', table.get(0))
+    self.assertEqual(12, table.get(1))
+    self.assertEqual(3, table.size)
+    self.assertEqual(2, table.remove(0, True))
+    self.assertRaises(DataNotFound, lambda: table.get(0))
+    self.assertEqual(0, table.remove(0))
+    self.assertEqual(1, table.size)
+
+  def test_stripes(self):
+    self.assertEqual(8, ConcurrentHashTable(16, number_of_stripes=5).number_of_stripes)
+
+    table = ConcurrentHashTable(4, number_of_stripes=1)
+    for key in range(0, 100):
+      table.add(key, key)
+    self.assertEqual(100, table.size)
+    self.assertLessEqual(table.load_factor, .75)
+
+  def test_concurrent_adds(self):
+    table = ConcurrentHashTable(4, number_of_stripes=4)
+    keys_per_thread = 2000
+
+    def add(index: int):
+      for key in range(index * keys_per_thread, (index + 1) * keys_per_thread):
+        table.add(key, -key)
+    self.run_threads(add, 8)
+
+    self.assertEqual(8 * keys_per_thread, table.size)
+    for key in range(0, 8 * keys_per_thread):
+      self.assertEqual(-key, table.get(key))
+
+  def test_concurrent_reads_during_resizes(self):
+    table = ConcurrentHashTable(4, number_of_stripes=2)
+    stable_keys = range(0, 500)
+    for key in stable_keys:
+      table.add(key, -key)
+
+    def work(index: int):
+      if index < 2: # writers, growing and shrinking the stripes with their own keys
+        churn_keys = range(10_000 * (index + 1), 10_000 * (index + 1) + 2000)
+        for _ in range(0, 3):
+          for key in churn_keys:
+            table.add(key, key)
+          for key in churn_keys:
+            self.assertEqual(1, table.remove(key))
+      else: # readers, that must always see the stable keys
+        for _ in range(0, 10):
+          for key in stable_keys:
+            self.assertEqual(-key, table.get(key))
+    self.run_threads(work, 6)
+
+    self.assertEqual(len(stable_keys), table.size)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -1,18 +1,61 @@
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
+import numpy as np
 from hashtable import HashTable, DataNotFound
+from hashing import stable_hash
+from openaddressing import OpenAddressingHashTable
+from snapshot import MappedHashTable
 
 class HashTableTest(unittest.TestCase):
+  table_class = HashTable
+
   def test_hash_function(self):
-    table = HashTable(5)
-    
+    table = self.table_class(5, hash_function=hash) # identity for small integers
+
+    self.assertEqual(8, table.capacity) # rounded up to a power of two
     self.assertEqual(1, table._hash(1))
-    self.assertEqual(0, table._hash(-10))
+    self.assertEqual(6, table._hash(-10))
     self.assertEqual(2, table._hash(2))
-    self.assertEqual(2, table._hash(7))
-    self.assertEqual(4, table._hash(29))
+    self.assertEqual(7, table._hash(7))
+    self.assertEqual(5, table._hash(29))
+
+  def test_default_hash_spreads_strided_keys(self):
+    table = self.table_class(64)
+
+    positions = {table._hash(key * 64) for key in range(0, 64)}
+    self.assertGreater(len(positions), 32) # with key % capacity, all of them would be in slot 0
+
+  def test_any_hashable_key(self):
+    table = self.table_class(4)
+
+    table.add('a string', 1)
+    table.add((1, 'tuple'), 2)
+    table.add(b'bytes', 3)
+    table.add(.5, 4)
+    table.add(2, 5)
+
+    self.assertEqual(1, table.get('a string'))
+    self.assertEqual(2, table.get((1, 'tuple')))
+    self.assertEqual(3, table.get(b'bytes'))
+    self.assertEqual(4, table.get(.5))
+    self.assertEqual(5, table.get(2.0)) # equal keys have the same hash
+    values, missing = table.get_many([(1, 'tuple'), 'missing', .5])
+    self.assertEqual([2, None, 4], values.tolist())
+    self.assertEqual([False, True, False], missing.tolist())
+
+  def test_vectorized_hash_matches_scalar(self):
+    table = self.table_class(4)
+    keys = np.array([0, 1, -1, -2, 2 ** 40, -(2 ** 50), 12345])
+
+    table.add_many(keys, keys.tolist())
+    for key in keys.tolist():
+      self.assertEqual(key, table.get(key))
 
   def test_add_get(self):
-    table = HashTable(2)
+    table = self.table_class(2)
 
     table.add(0, 'a str')
     table.add(1, 12)
@@ -27,7 +70,7 @@ class HashTableTest(unittest.TestCase):
     self.assertEqual(4, table.size)
 
   def test_delete(self):
-    table = HashTable(10)
+    table = self.table_class(10)
 
     table.add(0, 'a str')
     table.add(1, 12)
@@ -38,7 +81,7 @@ class HashTableTest(unittest.TestCase):
     self.assertEqual(1, table.size)
 
   def test_delete_all_occurrences(self):
-    table = HashTable(10)
+    table = self.table_class(10)
 
     table.add(0, 'a str')
     table.add(1, 12)
@@ -47,13 +90,250 @@ class HashTableTest(unittest.TestCase):
 
     # all_occurrences = False
 
-    table.remove(0)
+    self.assertEqual(1, table.remove(0))
     self.assertEqual(8, table.get(0))
     self.assertEqual(3, table.size)
 
     # all_occurrences = True
 
-    table.remove(0, True)
+    self.assertEqual(2, table.remove(0, True))
     self.assertRaises(DataNotFound, lambda: table.get(0))
     self.assertEqual(1, table.size)
-    
\ No newline at end of file
+    self.assertEqual(0, table.remove(0, True))
+
+  def test_delete_many_duplicates(self):
+    table = self.table_class(16)
+
+    for value in range(0, 1000):
+      table.add(7, value)
+      table.add(23, value)
+    table.add(5, 'other')
+
+    self.assertEqual(1000, table.remove(7, True))
+    self.assertRaises(DataNotFound, lambda: table.get(7))
+    self.assertEqual(0, table.get(23))
+    self.assertEqual('other', table.get(5))
+    self.assertEqual(1001, table.size)
+
+  def test_grow(self):
+    table = self.table_class(4)
+
+    for key in range(0, 100):
+      table.add(key, key * 2)
+
+    self.assertEqual(100, table.size)
+    self.assertEqual(256, table.capacity)
+    self.assertLessEqual(table.load_factor, .75)
+    for key in range(0, 100):
+      self.assertEqual(key * 2, table.get(key))
+
+  def test_shrink(self):
+    table = self.table_class(4)
+
+    for key in range(0, 100):
+      table.add(key, key)
+    for key in range(0, 98):
+      table.remove(key)
+
+    self.assertEqual(2, table.size)
+    self.assertEqual(16, table.capacity)
+    self.assertEqual(98, table.get(98))
+    self.assertEqual(99, table.get(99))
+
+    table = self.table_class(64)
+    table.add(0, 0)
+    table.remove(0)
+    self.assertEqual(64, table.capacity) # never below the initial capacity
+
+  def test_incremental_rehash(self):
+    table = self.table_class(4, incremental_rehash=True, rehash_step=1)
+
+    for key in range(0, 100):
+      table.add(key, key)
+      if table.is_rehashing:
+        self.assertEqual(key, table.get(key))
+    table.add(0, 'duplicate')
+
+    self.assertEqual(101, table.size)
+    for key in range(0, 100):
+      self.assertEqual(key, table.get(key))
+    table.remove(0)
+    self.assertEqual('duplicate', table.get(0))
+
+  def test_duplicates_added_during_incremental_rehash(self):
+    table = self.table_class(64, incremental_rehash=True, rehash_step=1)
+    for key in range(0, 49):
+      table.add(key, 'first')
+    self.assertTrue(table.is_rehashing)
+
+    for key in range(0, 48):
+      table.add(key, 'second')
+    self.assertTrue(table.is_rehashing)
+    table._finish_rehash()
+
+    for key in range(0, 48):
+      self.assertEqual('first', table.get(key))
+    self.assertEqual(48, table.remove_many(range(0, 48)))
+    for key in range(0, 48):
+      self.assertEqual('second', table.get(key))
+
+  def test_add_many_get_many(self):
+    table = self.table_class(4)
+    keys = np.arange(0, 1000)
+
+    table.add_many(keys, (key * 2 for key in keys.tolist()))
+    table.add_many([5, 5], ['duplicate', 'another'])
+    values, missing = table.get_many(np.array([0, 999, 5, 1000, -3]))
+
+    self.assertEqual(1002, table.size)
+    self.assertEqual([0, 1998, 10, None, None], values.tolist())
+    self.assertEqual([False, False, False, True, True], missing.tolist())
+    self.assertEqual(table.get(500), table.get_many([500])[0][0])
+    self.assertRaises(ValueError, lambda: table.add_many([1, 2], [1]))
+
+  def test_remove_many(self):
+    table = self.table_class(4)
+    table.add_many(range(0, 100), range(0, 100))
+    table.add_many([7, 7], ['duplicate', 'another'])
+
+    self.assertEqual(50, table.remove_many(range(0, 100, 2)))
+    self.assertEqual(52, table.size)
+    self.assertEqual(7, table.get(7))
+    self.assertEqual(3, table.remove_many([7, 8], all_occurrences=True))
+    self.assertEqual(49, table.size)
+    _, missing = table.get_many(range(0, 100))
+    self.assertEqual([key for key in range(1, 100, 2) if key != 7], [key for key in range(0, 100) if not missing[key]])
+
+  def test_many_with_duplicates_in_the_batch(self):
+    table = self.table_class(8, hash_function=lambda key: key % 4) # the keys compete for the same slots
+    table.add_many([1, 5, 1, 9, 1, 13], ['first', 5, 'second', 9, 'third', 13])
+
+    self.assertEqual('first', table.get(1))
+    self.assertEqual(3, table.remove_many([1, 5, 1]))
+    self.assertEqual('third', table.get(1))
+    self.assertEqual([9, 13], table.get_many([9, 13])[0].tolist())
+    self.assertEqual(1, table.remove_many([1, 1], all_occurrences=True))
+    self.assertEqual(2, table.size)
+
+  def test_invalid_load_factors(self):
+    self.assertRaises(ValueError, lambda: self.table_class(4, max_load_factor=.5, min_load_factor=.3))
+
+class OpenAddressingHashTableTest(HashTableTest):
+  table_class = OpenAddressingHashTable
+
+  def test_incremental_rehash(self):
+    self.skipTest('the open addressing table always rehashes at once')
+
+  def test_duplicates_added_during_incremental_rehash(self):
+    self.skipTest('the open addressing table always rehashes at once')
+
+  def test_tombstones(self):
+    table = self.table_class(8)
+    table.add(0, 'kept')
+
+    for key in range(1, 100):
+      table.add(key, key)
+      table.add(key + 8, 'collision')
+      table.remove(key)
+      table.remove(key + 8)
+
+    self.assertEqual(1, table.size)
+    self.assertEqual(8, table.capacity) # tombstones only cause rehashes at the same capacity
+    self.assertEqual('kept', table.get(0))
+    self.assertRaises(DataNotFound, lambda: table.get(50))
+
+  def test_duplicates_keep_order_on_resize(self):
+    table = self.table_class(4)
+
+    table.add(3, 'first')
+    table.add(3, 'second')
+    for key in range(100, 200):
+      table.add(key, key)
+
+    self.assertEqual('first', table.get(3))
+    table.remove(3)
+    self.assertEqual('second', table.get(3))
+
+class SnapshotTest(unittest.TestCase):
+  def setUp(self):
+    directory = tempfile.TemporaryDirectory()
+    self.addCleanup(directory.cleanup)
+    self.path = os.path.join(directory.name, 'table.snapshot')
+
+  def make_table(self) -> HashTable:
+    table = HashTable(4, incremental_rehash=True)
+    for key in range(0, 200):
+      table.add(f'key {key}', {'value': key})
+    table.add((1, 'tuple'), [1, 2])
+    table.add(b'bytes', None)
+    table.add(1.5, 'first')
+    table.add(1.5, 'second')
+    return table
+
+  def test_open_mapped(self):
+    self.make_table().save(self.path)
+
+    with HashTable.open(self.path) as table:
+      self.assertIsInstance(table, MappedHashTable)
+      self.assertEqual(204, table.size)
+      self.assertEqual({'value': 7}, table.get('key 7'))
+      self.assertEqual([1, 2], table.get((1, 'tuple')))
+      self.assertEqual(None, table.get(b'bytes'))
+      self.assertEqual('first', table.get(1.5))
+      self.assertRaises(DataNotFound, lambda: table.get('key 200'))
+
+  def test_open_in_memory(self):
+    self.make_table().save(self.path)
+
+    table = HashTable.open(self.path, mmap=False, capacity=8)
+    self.assertIsInstance(table, HashTable)
+    self.assertEqual(204, table.size)
+    self.assertEqual({'value': 199}, table.get('key 199'))
+    self.assertEqual(1, table.remove(1.5))
+    self.assertEqual('second', table.get(1.5))
+
+  def test_duplicates_added_during_incremental_rehash(self):
+    table = HashTable(64, incremental_rehash=True, rehash_step=1)
+    for key in range(0, 49):
+      table.add(key, 'first')
+    for key in range(0, 48):
+      table.add(key, 'second')
+    self.assertTrue(table.is_rehashing)
+    table.save(self.path)
+
+    with HashTable.open(self.path) as mapped:
+      for key in range(0, 48):
+        self.assertEqual('first', mapped.get(key))
+
+  def test_empty_table(self):
+    HashTable(4).save(self.path)
+
+    with HashTable.open(self.path) as table:
+      self.assertEqual(0, table.size)
+      self.assertRaises(DataNotFound, lambda: table.get('key'))
+
+  def test_keys_without_stable_hash(self):
+    table = HashTable(4)
+    table.add(frozenset(), 1)
+
+    self.assertRaises(TypeError, lambda: table.save(self.path))
+
+  def test_other_process(self):
+    # the hash of strings is randomized on each process, the stable hash is not
+    self.make_table().save(self.path)
+    code = (
+      'from hashtable import HashTable\n'
+      f'print(HashTable.open({self.path!r}).get("key 42"))'
+    )
+    for seed in ('1', '2'):
+      result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)), env={**os.environ, 'PYTHONHASHSEED': seed},
+      )
+      self.assertEqual("{'value': 42}", result.stdout.strip())
+
+  def test_stable_hash(self):
+    self.assertEqual(stable_hash(1), stable_hash(1.0))
+    self.assertEqual(stable_hash(('a', 1)), stable_hash(('a', 1.0)))
+    self.assertNotEqual(stable_hash(('a', 1)), stable_hash(('a', 2)))
+    self.assertEqual(0x931cddc3613b6f2e, stable_hash('a')) # the same in every process and version
@@ -2,8 +2,10 @@ import unittest
 from linkedlist import List
 
 class LinkedListTests(unittest.TestCase):
+  list_class = List
+
   def test_append(self):
-    list = List()
+    list = self.list_class()
     list.append(0)
     list.append(5.5)
     list.append('a string')
@@ -14,7 +16,7 @@ class LinkedListTests(unittest.TestCase):
     self.assertEqual(3, list.size)
 
   def test_at(self):
-    list = List()
+    list = self.list_class()
     list.append(1)
     list.append(2)
     list.append(3)
@@ -26,15 +28,81 @@ class LinkedListTests(unittest.TestCase):
     self.assertEqual(3, list.at(2))
     self.assertEqual(3, list.at(-1))
 
+  def test_at_near_the_tail(self):
+    list = self.list_class()
+    for value in range(0, 10):
+      list.append(value)
+
+    self.assertEqual([9, 8, 7, 6, 5], [list.at(index) for index in range(9, 4, -1)])
+    self.assertEqual(7, list.at(-3))
+    self.assertEqual(list.at(0), 0)
+
+  def test_getitem(self):
+    list = self.list_class()
+    for value in range(0, 10):
+      list.append(value)
+
+    self.assertEqual(10, len(list))
+    self.assertEqual(4, list[4])
+    self.assertEqual(9, list[-1])
+    self.assertEqual([2, 3, 4], [value for value in list[2:5]])
+    self.assertEqual([9, 6, 3, 0], [value for value in list[::-3]])
+    self.assertEqual(0, len(list[5:2]))
+    self.assertRaises(IndexError, lambda: list[10])
+
+  def test_access_after_changes(self):
+    list = self.list_class()
+    for value in range(0, 10):
+      list.append(value)
+
+    self.assertEqual(5, list[5])
+    list.pop(2)
+    self.assertEqual(6, list[5])
+    list.pop(0)
+    list.append(10)
+    self.assertEqual([1, 3, 4, 5, 6, 7, 8, 9, 10], [list[index] for index in range(0, len(list))])
+
+  def test_extend(self):
+    list = self.list_class()
+    list.extend([])
+    self.assertEqual(0, list.size)
+
+    list.extend(range(0, 3))
+    list.append(3)
+    list.extend(value for value in range(4, 7))
+    self.assertEqual(7, list.size)
+    self.assertEqual([0, 1, 2, 3, 4, 5, 6], [value for value in list])
+    self.assertEqual(6, list.at(-1))
+    self.assertEqual(0, list.at(-7))
+    list.pop(-1)
+    list.pop(0)
+    self.assertEqual([1, 2, 3, 4, 5], [value for value in list])
+
+  def test_from_iterable(self):
+    list = self.list_class.from_iterable('abc')
+
+    self.assertEqual(['a', 'b', 'c'], [value for value in list])
+    self.assertEqual(['c', 'b', 'a'], [value for value in reversed(list)])
+    self.assertEqual(3, list.size)
+
+  def test_duplicated_values(self):
+    list = self.list_class()
+    list.extend([1, 1, 2, 1])
+    values = []
+
+    list.for_each(lambda value, index: values.append(value))
+    self.assertEqual([1, 1, 2, 1], values)
+    self.assertEqual([1, 2, 1, 1], [value for value in reversed(list)])
+
   def test_at_invalid_index(self):
-    list = List()
+    list = self.list_class()
     list.append(1)
 
     self.assertRaises(IndexError, lambda: list.at(1))
     self.assertRaises(IndexError, lambda: list.at(-2))
 
   def test_pop(self):
-    list = List()
+    list = self.list_class()
     list.append(1)
     list.append(2)
     list.append(3)
@@ -55,15 +123,45 @@ class LinkedListTests(unittest.TestCase):
     self.assertEqual(1, list.size)
     self.assertEqual(list.at(0), 2)
 
+  def test_remove_where(self):
+    list = self.list_class()
+    for value in [1, 2, 1, 3, 1]:
+      list.append(value)
+
+    self.assertEqual(1, list.remove_where(lambda value: value == 1))
+    self.assertEqual([2, 1, 3, 1], [list.at(index) for index in range(0, list.size)])
+
+    self.assertEqual(2, list.remove_where(lambda value: value == 1, True))
+    self.assertEqual([2, 3], [list.at(index) for index in range(0, list.size)])
+
+    self.assertEqual(0, list.remove_where(lambda value: value == 1, True))
+    self.assertEqual(2, list.remove_where(lambda value: True, True))
+    self.assertEqual(0, list.size)
+
+  def test_node_handles(self):
+    list = self.list_class()
+    nodes = [list.append(value) for value in [1, 2, 3]]
+
+    list.move_to_end(nodes[0])
+    self.assertEqual([2, 3, 1], [list.at(index) for index in range(0, list.size)])
+    list.move_to_end(nodes[0]) # already the tail
+    list.remove_node(nodes[2])
+    self.assertEqual([2, 1], [list.at(index) for index in range(0, list.size)])
+    list.remove_node(nodes[1])
+    list.move_to_end(nodes[0])
+    self.assertEqual([1], [list.at(index) for index in range(0, list.size)])
+    list.remove_node(nodes[0])
+    self.assertEqual(0, list.size)
+
   def test_pop_invalid_index(self):
-    list = List()
+    list = self.list_class()
     list.append(1)
 
     self.assertRaises(IndexError, lambda: list.pop(1))
     self.assertRaises(IndexError, lambda: list.pop(-2))
   
   def test_for_each(self):
-    list = List()
+    list = self.list_class()
     list.append(1)
     list.append(2)
     list.append(3)
@@ -83,7 +181,7 @@ class LinkedListTests(unittest.TestCase):
     self.assertEqual(list.size, callback_invocations)
 
   def test_iterator(self):
-    list = List()
+    list = self.list_class()
     list.append(1)
     list.append(2)
     list.append(3)
@@ -0,0 +1,107 @@
+import unittest
+from hashtable import DataNotFound
+from lrucache import LRUCache, memoize
+
+class FakeClock:
+  def __init__(self):
+    self.now = 0.
+
+  def __call__(self) -> float:
+    return self.now
+
+class LRUCacheTest(unittest.TestCase):
+  def test_get_put(self):
+    cache = LRUCache(max_entries=2)
+
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('a', 3)
+
+    self.assertEqual(3, cache.get('a'))
+    self.assertEqual(2, cache.get('b'))
+    self.assertEqual(2, cache.size)
+    self.assertRaises(DataNotFound, lambda: cache.get('c'))
+    self.assertEqual((2, 1), (cache.hits, cache.misses))
+
+  def test_evicts_least_recently_used(self):
+    cache = LRUCache(max_entries=3)
+    for key in 'abc':
+      cache.put(key, key)
+
+    cache.get('a') # b is now the least recently used
+    cache.put('d', 'd')
+
+    self.assertRaises(DataNotFound, lambda: cache.get('b'))
+    for key in 'acd':
+      self.assertEqual(key, cache.get(key))
+    self.assertEqual(1, cache.evictions)
+
+  def test_size_based_eviction(self):
+    cache = LRUCache(max_size=10, size_of=len)
+
+    cache.put(1, 'x' * 4)
+    cache.put(2, 'x' * 4)
+    cache.put(3, 'x' * 4)
+    self.assertRaises(DataNotFound, lambda: cache.get(1))
+    self.assertEqual(8, cache.total_size)
+
+    cache.put(4, 'x' * 11) # larger than the cache
+    self.assertRaises(DataNotFound, lambda: cache.get(4))
+    self.assertEqual(8, cache.total_size)
+
+  def test_ttl(self):
+    clock = FakeClock()
+    cache = LRUCache(ttl=10, clock=clock)
+
+    cache.put('a', 1)
+    cache.put('b', 2, ttl=100)
+    cache.put('c', 3)
+    clock.now = 5
+    self.assertEqual(1, cache.get('a'))
+
+    clock.now = 10
+    self.assertRaises(DataNotFound, lambda: cache.get('a'))
+    self.assertEqual(2, cache.get('b'))
+    self.assertEqual(1, cache.purge_expired()) # c
+    self.assertEqual(1, cache.size)
+    self.assertEqual(2, cache.expirations)
+
+  def test_remove_and_clear(self):
+    cache = LRUCache()
+    cache.put('a', 1)
+    cache.put('b', 2)
+
+    self.assertTrue(cache.remove('a'))
+    self.assertFalse(cache.remove('a'))
+    self.assertEqual(1, cache.size)
+    cache.clear()
+    self.assertEqual(0, cache.size)
+    self.assertRaises(DataNotFound, lambda: cache.get('b'))
+
+  def test_memoize(self):
+    calls = []
+
+    @memoize(max_entries=2)
+    def square(value: int) -> int:
+      calls.append(value)
+      return value * value
+
+    self.assertEqual([4, 4, 9, 16, 4], [square(2), square(2), square(3), square(4), square(2)])
+    self.assertEqual([2, 3, 4, 2], calls)
+    self.assertEqual(1, square.cache.hits)
+    self.assertEqual(2, square.cache.evictions)
+    self.assertEqual('square', square.__name__)
+
+  def test_memoize_keyword_arguments(self):
+    @memoize()
+    def arguments(*args, **kwargs) -> tuple:
+      return args, kwargs
+
+    self.assertEqual(((1,), {'k': 2}), arguments(1, k=2))
+    self.assertEqual((((1,), (('k', 2),)), {}), arguments((1,), (('k', 2),)))
+    self.assertEqual(((1, ('k', 2)), {}), arguments(1, ('k', 2)))
+    self.assertEqual(((1,), {'k': 2}), arguments(1, k=2))
+    self.assertEqual(1, arguments.cache.hits)
+
+if __name__ == '__main__':
+  unittest.main()
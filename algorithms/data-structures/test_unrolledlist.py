@@ -0,0 +1,52 @@
+import unittest
+import test_linkedlist
+from unrolledlist import UnrolledList
+
+class SmallBlocksUnrolledList(UnrolledList):
+  # small blocks, so the tests span several of them
+  def __init__(self, block_size: int = 2):
+    super().__init__(block_size)
+
+class UnrolledListTests(test_linkedlist.LinkedListTests):
+  list_class = SmallBlocksUnrolledList
+
+  def test_remove_where(self):
+    self.skipTest('the unrolled list has no remove_where')
+
+  def test_node_handles(self):
+    self.skipTest('the unrolled list has no nodes')
+
+  def test_blocks(self):
+    list = UnrolledList(4)
+    for value in range(0, 10):
+      list.append(value)
+    self.assertEqual([[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]], list._blocks)
+
+    list.pop(0)
+    list.pop(0)
+    self.assertEqual([[2, 3], [4, 5, 6, 7], [8, 9]], list._blocks)
+    list.pop(5)
+    list.pop(4)
+    list.pop(3)
+    self.assertEqual([[2, 3], [4, 8, 9]], list._blocks)
+    list.pop(1)
+    self.assertEqual([[2, 4, 8, 9]], list._blocks)
+    list.pop(-1)
+    self.assertEqual([[2, 4, 8]], list._blocks)
+    self.assertEqual('[2, 4, 8]', str(list))
+
+  def test_pop_all(self):
+    list = self.list_class()
+    for value in range(0, 7):
+      list.append(value)
+    for value in range(0, 7):
+      self.assertEqual(value, list.at(0))
+      list.pop(0)
+    self.assertEqual(0, list.size)
+    self.assertEqual([], [value for value in list])
+
+  def test_invalid_block_size(self):
+    self.assertRaises(ValueError, lambda: UnrolledList(1))
+
+if __name__ == '__main__':
+  unittest.main()
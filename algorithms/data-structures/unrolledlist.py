@@ -0,0 +1,180 @@
+import typing
+
+class UnrolledList:
+  """
+    An unrolled list, with the same API as the List.
+
+    Instead of a node per value, the values are stored in blocks (python lists)
+    of up to block_size values, so there is no allocation per append and the values
+    of a block sit next to each other. A block is dropped when it gets empty, and
+    when it gets less than half full, it is merged with the next one if both fit in a block.
+
+    Args:
+      block_size:
+        The maximum number of values per block. Defaults to 64
+  """
+
+  def __init__(self, block_size: int = 64):
+    if block_size < 2:
+      raise ValueError('block_size must be at least 2')
+    self._block_size = block_size
+    self._blocks: list[list[typing.Any]] = []
+    self._size: int = 0
+
+  def __str__(self) -> str:
+    return self.__repr__()
+
+  def __repr__(self) -> str:
+    return '[' + ', '.join(str(value) for value in self) + ']'
+
+  @classmethod
+  def from_iterable(cls, values: typing.Iterable[typing.Any], block_size: int | None = None) -> 'UnrolledList':
+    """
+    Creates a list with the given values.
+    [time complexity: O(n)]
+
+    Args:
+      values:
+        The values of the list
+      block_size:
+        The maximum number of values per block. Defaults to the default of the class
+    """
+    list = cls() if block_size is None else cls(block_size)
+    list.extend(values)
+    return list
+
+  def __iter__(self) -> typing.Iterator[typing.Any]:
+    for block in self._blocks:
+      yield from block
+
+  def __reversed__(self) -> typing.Iterator[typing.Any]:
+    for block in reversed(self._blocks):
+      yield from reversed(block)
+
+  def __len__(self) -> int:
+    return self._size
+
+  def __getitem__(self, index: int | slice) -> typing.Any:
+    """Returns the value at a given index (see at), or a new UnrolledList with the values of a slice"""
+    if isinstance(index, slice):
+      sliced = UnrolledList(self._block_size)
+      for position in range(*index.indices(self._size)):
+        sliced.append(self.at(position))
+      return sliced
+    return self.at(index)
+
+  @property
+  def size(self) -> int:
+    """The size of the list"""
+    return self._size
+
+  def append(self, value: typing.Any) -> None:
+    """
+    Appends/adds an element to the end of the list
+    [time complexity: O(1)]
+
+    Args:
+      value:
+        The value to be appended
+    """
+    if not self._blocks or len(self._blocks[-1]) >= self._block_size:
+      self._blocks.append([])
+    self._blocks[-1].append(value)
+    self._size += 1
+
+  def extend(self, values: typing.Iterable[typing.Any]) -> None:
+    """
+    Appends all the given values to the end of the list, a block at a time.
+    [time complexity: O(k), where k is the number of values]
+
+    Args:
+      values:
+        The values to be appended
+    """
+    values = list(values)
+    start = 0
+    if self._blocks and len(self._blocks[-1]) < self._block_size: # fills the last block first
+      start = self._block_size - len(self._blocks[-1])
+      self._blocks[-1].extend(values[:start])
+    for block_start in range(start, len(values), self._block_size):
+      self._blocks.append(values[block_start:block_start + self._block_size])
+    self._size += len(values)
+
+  def _locate(self, index: int) -> tuple[int, int]:
+    # the block of an index, and the index inside the block
+    converted_index = index + self._size if index < 0 else index
+    if converted_index > self._size - 1 or converted_index < 0:
+      raise IndexError(f'Index [{index}] is out of range')
+
+    if converted_index < self._size // 2: # closest to the head
+      for block_index, block in enumerate(self._blocks):
+        if converted_index < len(block):
+          return block_index, converted_index
+        converted_index -= len(block)
+    remaining = self._size - converted_index # closest to the tail
+    for block_index in range(len(self._blocks) - 1, -1, -1):
+      block = self._blocks[block_index]
+      if remaining <= len(block):
+        return block_index, len(block) - remaining
+      remaining -= len(block)
+
+  def at(self, index: int) -> typing.Any:
+    """
+    Returns the value at a given index
+    [time complexity: O(n/b), where b is the block size]
+
+    Args:
+      index:
+        The index of the given value.
+        Negative numbers represents the inverse order of the list.
+        -1 represents the last index, -2 represents the index before the last one.
+
+    Returns:
+      The value at the given index
+
+    Raises:
+      IndexError: The given index is out of range
+    """
+    block_index, index_in_block = self._locate(index)
+    return self._blocks[block_index][index_in_block]
+
+  def pop(self, index: int = -1) -> None:
+    """
+    Removes a value from a given index of the list.
+    [time complexity: O(n/b + b), where b is the block size. O(1) for the last index]
+
+    Args:
+      index:
+        The index of the value to be removed. Defaults to -1.
+        Negative numbers represents the inverse order of the list.
+        -1 represents the last index, -2 represents the index before the last one.
+
+    Raises:
+      IndexError: The given index is out of range
+    """
+    block_index, index_in_block = self._locate(index)
+    block = self._blocks[block_index]
+    del block[index_in_block]
+    self._size -= 1
+    if not block:
+      del self._blocks[block_index]
+    elif (
+      len(block) < self._block_size // 2 and block_index + 1 < len(self._blocks)
+      and len(block) + len(self._blocks[block_index + 1]) <= self._block_size
+    ):
+      block.extend(self._blocks[block_index + 1])
+      del self._blocks[block_index + 1]
+
+  def for_each(self, callback) -> None:
+    """
+    Returns each value of the list to the callback function
+    [time complexity: O(n)]
+
+    Args:
+      callback:
+        The callback function. The callback function returns the value and its index
+        Usage example for a given list of [0, 1, 2]:
+          list.for_each(lambda val, index : print(f'v: {val}, i: {index}'))
+    """
+    for index, value in enumerate(self):
+      callback(value, index)
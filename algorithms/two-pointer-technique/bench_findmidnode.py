@@ -0,0 +1,45 @@
+"""
+  Streaming middle benchmark.
+
+  Pushes items one by one and queries the middle after each push, with the maintained
+  middle (get_middle), with the two pointers scan (scan_middle), and with the previous
+  list, whose push walked to the end. The scans are quadratic, so they run on fewer items.
+
+  Usage: python3 bench_findmidnode.py [number of items] [number of items for the scans]
+"""
+import sys
+import time
+from findmidnode import LinkedList, Node
+
+class LegacyLinkedList(LinkedList):
+  """The previous list, whose push walks from the head to the end"""
+  def push(self, data) -> None:
+    if self.head is None:
+      self.head = Node(data)
+    else:
+      node = self.head
+      while node.next is not None:
+        node = node.next
+      node.next = Node(data)
+
+def stream(list: LinkedList, number_of_items: int, get_middle) -> float:
+  start = time.perf_counter()
+  for item in range(0, number_of_items):
+    list.push(item)
+    get_middle(list)
+  return number_of_items / (time.perf_counter() - start)
+
+def main():
+  number_of_items = int(float(sys.argv[1])) if len(sys.argv) > 1 else 1_000_000
+  number_of_scanned_items = int(float(sys.argv[2])) if len(sys.argv) > 2 else 5_000
+  results = [
+    ('get_middle', number_of_items, stream(LinkedList(), number_of_items, LinkedList.get_middle)),
+    ('scan_middle', number_of_scanned_items, stream(LinkedList(), number_of_scanned_items, LinkedList.scan_middle)),
+    ('legacy push + scan', number_of_scanned_items, stream(LegacyLinkedList(), number_of_scanned_items, LinkedList.scan_middle)),
+  ]
+  print(f'{"middle":>20} {"items":>10} {"items/s":>12}')
+  for middle, items, throughput in results:
+    print(f'{middle:>20} {items:>10} {throughput:>12.0f}')
+
+if __name__ == '__main__':
+  main()
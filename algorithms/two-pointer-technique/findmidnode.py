@@ -5,25 +5,71 @@ class Node:
     self.next = None
 
 class LinkedList:
+  '''
+    A singly linked list that keeps a pointer to its tail, so push is O(1), and to its
+    middle node (the node returned by the two pointers scan), that moves one step
+    on every other push and pop, so get_middle is O(1) while the list is streamed.
+  '''
   def __init__(self) -> None:
     self.head: Node = None
+    self.tail: Node = None
+    self.size = 0
+    self._middle: Node = None
 
   def push(self, data) -> None:
     '''
-      Time Complexity
-        best case (list is empty) -> O(1)
-        worst case -> O(N), where N is the number of nodes in the linked list
+      Appends a node to the end of the list.
+
+      Time Complexity: O(1)
     '''
+    node = Node(data)
     if self.head is None:
-      self.head = Node(data)
+      self.head = node
     else:
-      node = self.head
-      while node.next is not None:
-        node = node.next
-      node.next = Node(data)
+      self.tail.next = node
+    self.tail = node
+    self.size += 1
+
+    # the middle is the node at index (size + 1) // 2, which only exists from 2 nodes on
+    if self.size == 2:
+      self._middle = node
+    elif self.size > 2 and self.size % 2 == 1:
+      self._middle = self._middle.next
+
+  def pop(self):
+    '''
+      Removes the first node of the list and returns its data.
+
+      Time Complexity: O(1)
+    '''
+    if self.head is None:
+      raise IndexError('pop from an empty list')
+    node = self.head
+    self.head = node.next
+    if self.head is None:
+      self.tail = None
+    self.size -= 1
+
+    # the indices move back by one, so the middle only moves when the size was even
+    if self.size < 2:
+      self._middle = None
+    elif self.size % 2 == 1:
+      self._middle = self._middle.next
+    return node.data
 
   def get_middle(self) -> Node:
     '''
+      Returns the maintained middle node, the same one as scan_middle.
+
+      Time Complexity: O(1)
+    '''
+    return self._middle
+
+  def scan_middle(self) -> Node:
+    '''
+      Finds the middle node with the two pointers technique. Does not depend on the
+      maintained middle, so it works even if the nodes are linked by hand.
+
       Time Complexity: O(N), where N is the number of nodes in the linked list
       Auxiliary Space: O(1)
     '''
@@ -35,4 +81,3 @@ class LinkedList:
         fast_pointer = fast_pointer.next
       slow_pointer = slow_pointer.next
     return slow_pointer
-
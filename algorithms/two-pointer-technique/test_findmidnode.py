@@ -16,4 +16,29 @@ class TestFindMidNode(unittest.TestCase):
   def test_13_sized_list(self):
     l = self.initialize_list(13)
 
-    self.assertEqual(7, l.get_middle().data)  
\ No newline at end of file
+    self.assertEqual(7, l.get_middle().data)
+
+  def test_middle_while_pushing(self):
+    l = LinkedList()
+    for i in range(0, 50):
+      l.push(i)
+      self.assertIs(l.scan_middle(), l.get_middle())
+    self.assertEqual(49, l.tail.data)
+    self.assertEqual(50, l.size)
+
+  def test_middle_while_popping(self):
+    l = self.initialize_list(20)
+    for i in range(0, 20):
+      self.assertEqual(i, l.pop())
+      self.assertIs(l.scan_middle(), l.get_middle())
+      if i % 3 == 0: # a sliding window
+        l.push(100 + i)
+        self.assertIs(l.scan_middle(), l.get_middle())
+
+  def test_pop_empty_list(self):
+    l = self.initialize_list(1)
+    l.pop()
+
+    self.assertIsNone(l.head)
+    self.assertIsNone(l.tail)
+    self.assertRaises(IndexError, l.pop)
@@ -0,0 +1,66 @@
+import pygame
+from collections import OrderedDict
+
+EXPLOSION_SOUND_PATH = 'assets/audios/bit-explosion.wav'
+THEME_MUSIC_PATH = 'assets/audios/theme-music.mp3'
+BOMB_IMAGE_PATH = 'assets/images/bomb.png'
+
+class SizedAssets:
+	"""The surfaces pre-scaled/pre-rendered for a given cell size"""
+	def __init__(self, bomb_surface: pygame.Surface, digit_glyphs: list[pygame.Surface]):
+		self.bomb_surface = bomb_surface
+		self.digit_glyphs = digit_glyphs
+
+class AssetManager:
+	"""
+	Loads each asset (sounds, images and fonts) only once and shares it between all cells.
+
+	The bomb surface and the digit glyphs depend on the cell size, so they are
+	pre-scaled/pre-rendered once per size and kept in a LRU cache. When the board
+	is resized, the least recently used sizes are dropped.
+
+	Args:
+		max_cached_sizes:
+			How many cell sizes are kept cached at the same time. Defaults to 4
+	"""
+	def __init__(self, max_cached_sizes: int = 4):
+		self.__max_cached_sizes = max_cached_sizes
+		self.__sounds: dict[str, pygame.mixer.Sound] = {}
+		self.__images: dict[str, pygame.Surface] = {}
+		self.__sized_assets: OrderedDict[int, SizedAssets] = OrderedDict()
+
+	def sound(self, path: str) -> pygame.mixer.Sound:
+		if path not in self.__sounds:
+			self.__sounds[path] = pygame.mixer.Sound(path)
+		return self.__sounds[path]
+
+	def image(self, path: str) -> pygame.Surface:
+		if path not in self.__images:
+			self.__images[path] = pygame.image.load(path).convert_alpha()
+		return self.__images[path]
+
+	def __load_sized_assets(self, cell_size: int) -> SizedAssets:
+		bomb_surface = pygame.transform.scale(self.image(BOMB_IMAGE_PATH), (cell_size // 2, cell_size // 2))
+		font = pygame.font.Font(size=cell_size // 2)
+		digit_glyphs = [font.render(str(digit), True, 'blue') for digit in range(0, 9)]
+		return SizedAssets(bomb_surface, digit_glyphs)
+
+	def __get_sized_assets(self, cell_size: int) -> SizedAssets:
+		cell_size = int(cell_size)
+		if cell_size in self.__sized_assets:
+			self.__sized_assets.move_to_end(cell_size) # most recently used
+		else:
+			self.__sized_assets[cell_size] = self.__load_sized_assets(cell_size)
+			if len(self.__sized_assets) > self.__max_cached_sizes:
+				self.__sized_assets.popitem(last=False) # least recently used
+		return self.__sized_assets[cell_size]
+
+	def bomb_surface(self, cell_size: int) -> pygame.Surface:
+		return self.__get_sized_assets(cell_size).bomb_surface
+
+	def digit_glyph(self, digit: int, cell_size: int) -> pygame.Surface:
+		return self.__get_sized_assets(cell_size).digit_glyphs[digit]
+
+	def cached_sizes(self) -> list[int]:
+		"""The cached cell sizes, from the least to the most recently used"""
+		return list(self.__sized_assets.keys())
@@ -0,0 +1,42 @@
+"""
+Board generation benchmark.
+
+Compares generating seeded boards (the bombs, the adjacency and the zero regions)
+against replaying the same seeds, which are served by the cache of generated boards,
+and checks that each board has its exact number of bombs and a safe first click.
+
+Usage: python3 bench_board.py [cells per row/col] [boards]
+"""
+import gc
+import sys
+import time
+import board
+from board import Board
+
+BOMB_DENSITY = .15
+
+def boards_per_second(size: int, number_of_boards: int) -> float:
+	number_of_bombs = int(size * size * BOMB_DENSITY)
+	start = time.perf_counter()
+	for seed in range(0, number_of_boards):
+		generated = Board(size, number_of_bombs, seed, safe_cell=(size // 2, size // 2))
+		assert int(generated.mines.sum()) == number_of_bombs
+		assert generated.number_of_adjacent_bombs(size // 2, size // 2) == 0
+	return number_of_boards / (time.perf_counter() - start)
+
+def main():
+	gc.disable()
+	size = int(float(sys.argv[1])) if len(sys.argv) > 1 else 100
+	number_of_boards = int(float(sys.argv[2])) if len(sys.argv) > 2 else board.BOARD_CACHE_SIZE
+
+	board.clear_board_cache()
+	generated = boards_per_second(size, number_of_boards)
+	replayed = boards_per_second(size, number_of_boards)
+
+	print(f'{size}x{size} boards, {BOMB_DENSITY:.0%} bombs, {number_of_boards} seeds (cache of {board.BOARD_CACHE_SIZE})')
+	print(f'{"boards":>10} {"boards/s":>12}')
+	print(f'{"generated":>10} {generated:>12.0f}')
+	print(f'{"replayed":>10} {replayed:>12.0f}')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,44 @@
+"""
+Click hit-testing benchmark.
+
+Compares the old approach (collidepoint against every cell) with the arithmetic
+mapping of the Viewport, for growing boards. The viewport latency must stay flat.
+
+Usage: python3 bench_hit_test.py
+"""
+import random
+import timeit
+import pygame
+from viewport import Viewport
+
+WINDOW_SIZE = 800
+NUMBER_OF_CLICKS = 200
+
+def collidepoint_hit_test(rects: list[list[pygame.Rect]], pos: tuple[int, int]) -> tuple[int, int] | None:
+	for row in range(0, len(rects)):
+		for col in range(0, len(rects[row])):
+			if rects[row][col].collidepoint(pos):
+				return row, col
+	return None
+
+def main():
+	rng = random.Random(0)
+	clicks = [(rng.randrange(WINDOW_SIZE), rng.randrange(WINDOW_SIZE)) for _ in range(0, NUMBER_OF_CLICKS)]
+	print(f'{"cells":>10} {"collidepoint (us/click)":>24} {"viewport (us/click)":>20}')
+	for number_of_cells_per_row_col in (10, 50, 100, 200, 400):
+		cell_size = WINDOW_SIZE / number_of_cells_per_row_col
+		viewport = Viewport(cell_size, number_of_cells_per_row_col)
+		rects = [
+			[pygame.Rect(row * cell_size, col * cell_size, cell_size, cell_size) for col in range(0, number_of_cells_per_row_col)]
+			for row in range(0, number_of_cells_per_row_col)
+		]
+		collidepoint_time = timeit.timeit(lambda: [collidepoint_hit_test(rects, pos) for pos in clicks], number=1)
+		viewport_time = timeit.timeit(lambda: [viewport.screen_to_cell(pos) for pos in clicks], number=10) / 10
+		print(
+			f'{number_of_cells_per_row_col ** 2:>10} '
+			f'{collidepoint_time / NUMBER_OF_CLICKS * 1e6:>24.2f} '
+			f'{viewport_time / NUMBER_OF_CLICKS * 1e6:>20.3f}'
+		)
+
+if __name__ == '__main__':
+	main()
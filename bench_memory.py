@@ -0,0 +1,86 @@
+"""
+Memory benchmark of the cell representation.
+
+Compares the original design, where every cell is an object with its own
+__dict__, pygame.Rect, colour strings and explosion Sound, with the current one,
+where the cell state lives in the engine arrays (struct-of-arrays) and slotted
+Cell objects only exist for the visible part of the board.
+
+The original design is measured on 1e3 cells and extrapolated to the larger
+boards, which it cannot allocate in practice.
+
+Usage: python3 bench_memory.py
+"""
+import os
+import math
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from engine import Minesweeper
+from assets import AssetManager, EXPLOSION_SOUND_PATH
+from viewport import Viewport
+from game import Cell
+
+WINDOW_SIZE = 800
+CELL_SIZE = 20
+BOMB_DENSITY = .125
+MEASURED_LEGACY_CELLS = 1_000
+
+class LegacyCell:
+	"""The fields of a cell in the original design"""
+	def __init__(self, size: int, pos: pygame.Vector2, is_bomb: bool):
+		self.__border_width = 1
+		rect_size = size - self.__border_width
+		self.__size = size
+		self.__rect = pygame.Rect(pos.x, pos.y, rect_size, rect_size)
+		self.__fill_color = '#d1cfcf'
+		self.__border_color = '#6b6b6b'
+		self.__is_bomb = is_bomb
+		self.__is_revealed = False
+		self.__number_of_adjacent_bombs = 0
+		self.__played_explosion_sound = False
+		self.__explosion_sound = pygame.mixer.Sound(EXPLOSION_SOUND_PATH)
+
+def legacy_bytes_per_cell() -> float:
+	tracemalloc.start()
+	cells = [LegacyCell(CELL_SIZE, pygame.Vector2(i, i), False) for i in range(0, MEASURED_LEGACY_CELLS)]
+	python_bytes = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	# the decoded samples of a Sound live in SDL, out of the reach of tracemalloc
+	sound_bytes = cells[0]._LegacyCell__explosion_sound.get_raw().__len__()
+	return python_bytes / MEASURED_LEGACY_CELLS + sound_bytes
+
+def compact_bytes(number_of_cells: int) -> int:
+	number_of_cells_per_row_col = math.isqrt(number_of_cells)
+	assets = AssetManager()
+	tracemalloc.start()
+	engine = Minesweeper(number_of_cells_per_row_col, int(number_of_cells * BOMB_DENSITY), seed=0)
+	viewport = Viewport(CELL_SIZE, number_of_cells_per_row_col)
+	first_row, last_row, first_col, last_col = viewport.visible_range((WINDOW_SIZE, WINDOW_SIZE))
+	cells = [
+		Cell(CELL_SIZE, pygame.Vector2(viewport.cell_to_screen(row, col)), engine, (row, col), assets)
+		for row in range(first_row, last_row) for col in range(first_col, last_col)
+	]
+	used_bytes = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	return used_bytes
+
+def main():
+	pygame.mixer.init()
+	bytes_per_legacy_cell = legacy_bytes_per_cell()
+	print(f'{"cells":>10} {"original (MB)":>16} {"compact (MB)":>14} {"compact (B/cell)":>17}')
+	for number_of_cells in (10_000, 1_000_000, 10_000_000):
+		used_bytes = compact_bytes(number_of_cells)
+		print(
+			f'{number_of_cells:>10} '
+			f'{bytes_per_legacy_cell * number_of_cells / 2 ** 20:>16.1f} '
+			f'{used_bytes / 2 ** 20:>14.1f} '
+			f'{used_bytes / number_of_cells:>17.1f}'
+		)
+	print(f'original design: {bytes_per_legacy_cell:.0f} B/cell, measured on {MEASURED_LEGACY_CELLS} cells')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,51 @@
+"""
+New game benchmark.
+
+Compares starting a new game by generating its board on the spot (what the game
+loop used to do) against swapping in the board generated in the background by the
+BoardPregenerator while the previous game was played, against a 60 FPS frame budget.
+The first click of each game is timed too, with a safe first click: the bombs around
+it are moved out of the pre-generated board instead of generating another one.
+
+Usage: python3 bench_restart.py [games]
+"""
+import gc
+import sys
+import time
+from engine import Minesweeper, BoardPregenerator
+
+BOMB_DENSITY = .15
+FRAME_BUDGET = 1 / 60
+SIZES = (100, 500, 1_000, 2_000)
+
+def restart_seconds(game: Minesweeper, number_of_games: int, next_boards: BoardPregenerator | None = None) -> tuple[float, float]:
+	# the worst restart and the worst first click, the previous game being played long enough for the next board to be ready
+	worst_restart, worst_first_click = 0, 0
+	size = game.size
+	for _ in range(0, number_of_games):
+		while next_boards is not None and not next_boards.is_ready:
+			time.sleep(.001)
+		start = time.perf_counter()
+		game.reset(board=next_boards.take() if next_boards is not None else None)
+		worst_restart = max(worst_restart, time.perf_counter() - start)
+		start = time.perf_counter()
+		game.reveal(size // 2, size // 2)
+		worst_first_click = max(worst_first_click, time.perf_counter() - start)
+	return worst_restart, worst_first_click
+
+def main():
+	gc.disable()
+	number_of_games = int(float(sys.argv[1])) if len(sys.argv) > 1 else 5
+
+	print(f'{BOMB_DENSITY:.0%} bombs, worst of {number_of_games} restarts, frame budget {FRAME_BUDGET * 1000:.1f} ms')
+	print(f'{"cells":>12} {"on the spot (ms)":>17} {"pre-generated (ms)":>19} {"first click (ms)":>17}')
+	for size in SIZES:
+		number_of_bombs = int(size * size * BOMB_DENSITY)
+		game = Minesweeper(size, number_of_bombs, first_click_safe=True)
+		on_the_spot, _ = restart_seconds(game, number_of_games)
+		with BoardPregenerator(size, number_of_bombs) as next_boards:
+			pregenerated, first_click = restart_seconds(game, number_of_games, next_boards)
+		print(f'{size * size:>12} {on_the_spot * 1000:>17.2f} {pregenerated * 1000:>19.2f} {first_click * 1000:>17.2f}')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,39 @@
+"""
+Solver benchmark.
+
+Plays seeded games with the constraint propagation solver on growing boards (by default,
+with the bomb density of the expert level), and reports the win rate, the guesses, the solve time
+and the constraints evaluated (nodes) and clicks per second, which track the cost of reveals.
+
+Usage: python3 bench_solver.py [games per board] [bomb density]
+"""
+import sys
+import numpy as np
+from engine import Minesweeper
+from solver import Solver
+
+BOMB_DENSITY = .206 # 99 bombs on 480 cells
+BOARD_SIZES = (9, 16, 30, 100, 300)
+
+def main():
+	number_of_games = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+	bomb_density = float(sys.argv[2]) if len(sys.argv) > 2 else BOMB_DENSITY
+	print(f'{"cells":>8} {"bombs":>6} {"win rate":>9} {"guesses":>8} {"time (ms)":>10} {"nodes/s":>10} {"clicks/s":>10}')
+	for number_of_cells_per_row_col in BOARD_SIZES:
+		number_of_bombs = round(number_of_cells_per_row_col ** 2 * bomb_density)
+		results = [
+			Solver(Minesweeper(number_of_cells_per_row_col, number_of_bombs, seed), np.random.default_rng(seed)).solve()
+			for seed in range(0, number_of_games)
+		]
+		seconds = sum(result.seconds for result in results)
+		print(
+			f'{number_of_cells_per_row_col ** 2:>8} {number_of_bombs:>6} '
+			f'{np.mean([result.won for result in results]):>9.0%} '
+			f'{np.mean([result.guesses for result in results]):>8.1f} '
+			f'{seconds / number_of_games * 1e3:>10.2f} '
+			f'{sum(result.nodes for result in results) / seconds:>10.0f} '
+			f'{sum(result.clicks for result in results) / seconds:>10.0f}'
+		)
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,523 @@
+import threading
+import typing
+import numpy as np
+from collections import OrderedDict
+
+# the (row, col) offsets of the 8 neighbours of a cell
+NEIGHBOUR_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+# how many seeded boards are kept cached, see Board
+BOARD_CACHE_SIZE = 16
+# the (read-only) arrays of the seeded boards, keyed by their generation arguments, from the least to the most recently used
+_board_cache: OrderedDict[tuple, tuple[np.ndarray | None, ...]] = OrderedDict()
+# the boards are generated by the main thread and by the BoardPregenerator worker, so the cache
+# is only read and written under this lock (the boards themselves are generated out of it)
+_board_cache_lock = threading.Lock()
+
+# how many cells around a window where the zero cells changed are labeled again, see Board.with_safe_cell
+LOCAL_MARGIN = 4
+
+def clear_board_cache():
+	with _board_cache_lock:
+		_board_cache.clear()
+
+def _count_adjacent_bombs(mines: np.ndarray, first_row: int, last_row: int, first_col: int, last_col: int) -> np.ndarray:
+	# the number of adjacent bombs of the cells of a window of the mask (0 for the bombs), from the
+	# window with a border of one cell, padded with empty cells out of the mask
+	number_of_rows, number_of_cols = mines.shape
+	border = mines[max(first_row - 1, 0):last_row + 1, max(first_col - 1, 0):last_col + 1]
+	padded = np.pad(border.astype(np.uint8), (
+		(1 if first_row == 0 else 0, 1 if last_row == number_of_rows else 0),
+		(1 if first_col == 0 else 0, 1 if last_col == number_of_cols else 0),
+	))
+	height, width = last_row - first_row, last_col - first_col
+	adjacency = np.zeros((height, width), dtype=np.uint8)
+	for row_offset in (0, 1, 2):
+		for col_offset in (0, 1, 2):
+			if row_offset == 1 and col_offset == 1: # the cell itself
+				continue
+			adjacency += padded[row_offset:row_offset + height, col_offset:col_offset + width]
+	adjacency[mines[first_row:last_row, first_col:last_col]] = 0 # bombs do not show a number
+	return adjacency
+
+def _label_regions(is_zero: np.ndarray) -> np.ndarray:
+	# connected components (8-neighbourhood) of a boolean mask, by label propagation with hooking
+	# and pointer jumping. The label of a region is the smallest flat index of its cells (its root),
+	# -1 out of the mask. parent[i] <= i always holds, so the labels only decrease until they converge.
+	height, width = is_zero.shape
+	number_of_cells = height * width
+	label_dtype = np.int32 if number_of_cells < np.iinfo(np.int32).max else np.int64
+	no_label = label_dtype(number_of_cells) # sentinel, larger than any label
+	zero_cells = np.flatnonzero(is_zero).astype(label_dtype)
+	parent = np.full(number_of_cells + 1, no_label, dtype=label_dtype) # the sentinel is its own parent
+	parent[zero_cells] = zero_cells
+
+	while True:
+		labels = parent[:-1].reshape(height, width)
+		padded = np.pad(labels, 1, constant_values=no_label)
+		neighbour_min = labels.copy()
+		for row_offset, col_offset in NEIGHBOUR_OFFSETS:
+			np.minimum(neighbour_min, padded[1 + row_offset:1 + row_offset + height, 1 + col_offset:1 + col_offset + width], out=neighbour_min)
+		neighbour_min = neighbour_min.ravel()[zero_cells]
+		roots = parent[zero_cells]
+		if np.array_equal(neighbour_min, roots): # every cell has the same label as its neighbours
+			break
+		# hooking: the root of each cell adopts the smallest label around the cell
+		np.minimum.at(parent, roots, neighbour_min)
+		# pointer jumping: the parent of a parent is in the same region and is never larger
+		while True:
+			jumped = parent[parent]
+			if np.array_equal(jumped, parent):
+				break
+			parent = jumped
+
+	return np.where(is_zero.ravel(), parent[:-1], label_dtype(-1)).reshape(height, width)
+
+def _group_by_label(zero_labels: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+	# the flat indices of the labeled cells grouped by label, so a region is a contiguous slice, and their labels
+	labels = zero_labels.ravel()
+	zero_cells = np.flatnonzero(labels >= 0).astype(labels.dtype)
+	cells_by_label = zero_cells[np.argsort(labels[zero_cells], kind='stable')]
+	return cells_by_label, labels[cells_by_label]
+
+class Board:
+	"""
+	The minesweeper board model, backed by numpy arrays.
+
+	The mines are kept as a boolean mask and the number of adjacent bombs of every
+	cell is computed at once with a vectorized neighbourhood sum, so the board can
+	be generated for sizes far beyond what a per cell loop could handle.
+
+	The bombs are placed by a numpy Generator of its own, so a seed always gives the same
+	board. The arrays of the last BOARD_CACHE_SIZE seeded boards are kept in a LRU cache,
+	keyed by the generation arguments, so replaying a seed skips the generation. The arrays
+	of a cached board are shared with the cache, so they are read-only. The cache can be
+	used from several threads.
+
+	Args:
+		number_of_cells_per_row_col:
+			The number of cells in each row and column of the (square) board
+		number_of_bombs:
+			The number of bombs to be placed. Clamped to the number of cells out of the safe zone
+		seed:
+			The seed used to place the bombs. Defaults to None (a random board)
+		label_zero_regions:
+			If true, the connected regions of cells with no adjacent bombs are labeled when
+			the board is generated, so revealing one of them is a single label lookup
+			instead of a flood fill. Defaults to True
+		safe_cell:
+			The (row, col) of a cell (usually the first click) that, with its 8 neighbours,
+			never has a bomb, so it always opens a region. Defaults to None (no safe zone)
+		cache:
+			If false, a seeded board is neither looked up in the cache nor added to it, for the
+			boards that are never replayed (e.g. the simulated games). Defaults to True
+	"""
+	def __init__(
+		self,
+		number_of_cells_per_row_col: int,
+		number_of_bombs: int,
+		seed: int | None = None,
+		label_zero_regions: bool = True,
+		safe_cell: tuple[int, int] | None = None,
+		cache: bool = True,
+	):
+		self.__size = number_of_cells_per_row_col
+		self.__safe_cell = safe_cell
+		self.__number_of_bombs = min(number_of_bombs, self.__size * self.__size - (int(self.__safe_zone().sum()) if safe_cell is not None else 0))
+		self.__seed = seed
+		self.__cache = cache and seed is not None
+		self.__zero_labels: np.ndarray | None = None
+		self.__cells_by_label: np.ndarray | None = None
+		self.__sorted_labels: np.ndarray | None = None
+
+		cache_key = (self.__size, self.__number_of_bombs, seed, safe_cell, label_zero_regions)
+		if self.__cache:
+			with _board_cache_lock:
+				cached = _board_cache.get(cache_key)
+				if cached is not None:
+					_board_cache.move_to_end(cache_key) # most recently used
+			if cached is not None:
+				self.__mines, self.__adjacency, self.__zero_labels, self.__cells_by_label, self.__sorted_labels = cached
+				return
+
+		self.__rng = np.random.default_rng(seed)
+		self.__mines = self.__generate_mines()
+		self.__adjacency = self.__calculate_adjacency()
+		if label_zero_regions:
+			self.__label_zero_regions()
+		if self.__cache:
+			arrays = (self.__mines, self.__adjacency, self.__zero_labels, self.__cells_by_label, self.__sorted_labels)
+			for array in arrays:
+				if array is not None:
+					array.flags.writeable = False
+			with _board_cache_lock:
+				_board_cache[cache_key] = arrays
+				_board_cache.move_to_end(cache_key) # generated by another thread meanwhile
+				while len(_board_cache) > BOARD_CACHE_SIZE:
+					_board_cache.popitem(last=False) # least recently used
+
+	@property
+	def size(self) -> int:
+		return self.__size
+
+	@property
+	def number_of_bombs(self) -> int:
+		return self.__number_of_bombs
+
+	@property
+	def seed(self) -> int | None:
+		return self.__seed
+
+	@property
+	def safe_cell(self) -> tuple[int, int] | None:
+		return self.__safe_cell
+
+	@classmethod
+	def __from_arrays(
+		cls,
+		seed: int | None,
+		safe_cell: tuple[int, int] | None,
+		mines: np.ndarray,
+		adjacency: np.ndarray,
+		zero_labels: np.ndarray | None,
+		cells_by_label: np.ndarray | None,
+		sorted_labels: np.ndarray | None,
+	) -> 'Board':
+		# a board over arrays computed elsewhere, with no generation
+		board = cls.__new__(cls)
+		board.__size = mines.shape[0]
+		board.__number_of_bombs = int(np.count_nonzero(mines))
+		board.__seed = seed
+		board.__cache = False # its arrays are not in the cache
+		board.__safe_cell = safe_cell
+		board.__mines = mines
+		board.__adjacency = adjacency
+		board.__zero_labels = zero_labels
+		board.__cells_by_label = cells_by_label
+		board.__sorted_labels = sorted_labels
+		return board
+
+	@property
+	def mines(self) -> np.ndarray:
+		"""A (size, size) boolean mask, true where there is a bomb"""
+		return self.__mines
+
+	@property
+	def adjacency(self) -> np.ndarray:
+		"""A (size, size) uint8 array with the number of adjacent bombs of each cell"""
+		return self.__adjacency
+
+	@property
+	def zero_labels(self) -> np.ndarray | None:
+		"""
+		A (size, size) array with the region label of each cell with no adjacent bombs
+		(-1 for the other cells), or None if the regions have not been labeled
+		"""
+		return self.__zero_labels
+
+	def __str__(self) -> str:
+		return f'Board(size={self.size}, number_of_bombs={self.number_of_bombs})'
+
+	def __repr__(self) -> str:
+		return self.__str__()
+
+	def __window(self, row: int, col: int, radius: int) -> tuple[int, int, int, int]:
+		# the (first row, last row + 1, first col, last col + 1) of the cells up to radius cells away from a cell
+		return max(row - radius, 0), min(row + radius + 1, self.__size), max(col - radius, 0), min(col + radius + 1, self.__size)
+
+	def __safe_zone(self, safe_cell: tuple[int, int] | None = None) -> np.ndarray:
+		# a (size, size) boolean mask of the safe cell (the one of the board by default) and its neighbours
+		safe_cell = safe_cell if safe_cell is not None else self.__safe_cell
+		safe_zone = np.zeros((self.__size, self.__size), dtype=bool)
+		if safe_cell is not None:
+			first_row, last_row, first_col, last_col = self.__window(*safe_cell, 1)
+			safe_zone[first_row:last_row, first_col:last_col] = True
+		return safe_zone
+
+	def __generate_mines(self) -> np.ndarray:
+		# sampling without replacement out of the safe zone, so there are always exactly number_of_bombs bombs
+		number_of_cells = self.__size * self.__size
+		candidates = np.flatnonzero(~self.__safe_zone()) if self.__safe_cell is not None else number_of_cells
+		flat_positions = self.__rng.choice(candidates, size=self.__number_of_bombs, replace=False)
+		mines = np.zeros(number_of_cells, dtype=bool)
+		mines[flat_positions] = True
+		return mines.reshape(self.__size, self.__size)
+
+	def __calculate_adjacency(self) -> np.ndarray:
+		# pad the mask with a border of empty cells, then sum the 8 shifted views of it
+		return _count_adjacent_bombs(self.__mines, 0, self.__size, 0, self.__size)
+
+	def __label_zero_regions(self):
+		self.__zero_labels = _label_regions((self.__adjacency == 0) & ~self.__mines)
+		self.__cells_by_label, self.__sorted_labels = _group_by_label(self.__zero_labels)
+
+	def with_safe_cell(self, row: int, col: int) -> 'Board':
+		"""
+		Makes a cell and its neighbours free of bombs, as for a safe first click.
+
+		Their bombs are moved to random free cells out of them (so the bombs are still
+		spread uniformly), and the adjacency and the zero regions are only updated around
+		the moved bombs, instead of generating a whole board again.
+		[time complexity: O(n) array copies, plus the size of the zero regions next to the moved bombs]
+
+		Returns:
+			This board if there is no bomb around the cell, else a new board (the arrays of
+			this one are never changed)
+		"""
+		first_row, last_row, first_col, last_col = self.__window(row, col, 1)
+		if not self.__mines[first_row:last_row, first_col:last_col].any():
+			return self
+
+		safe_zone = self.__safe_zone((row, col))
+		removed = np.flatnonzero(self.__mines & safe_zone)
+		candidates = np.flatnonzero(~(self.__mines | safe_zone))
+		if candidates.size < removed.size: # not enough room out of the zone, the number of bombs is clamped
+			return Board(self.__size, self.__number_of_bombs, self.__seed, self.__zero_labels is not None, safe_cell=(row, col), cache=self.__cache)
+		rng = np.random.default_rng(None if self.__seed is None else (self.__seed, row, col))
+		added = rng.choice(candidates, size=removed.size, replace=False)
+
+		mines = self.__mines.copy()
+		mines.ravel()[removed] = False
+		mines.ravel()[added] = True
+		# the cells whose number may have changed: up to 2 cells away from the safe cell, and around the new bombs
+		windows = [self.__window(row, col, 2)] + [self.__window(*divmod(int(cell), self.__size), 1) for cell in added]
+		adjacency = self.__adjacency.copy()
+		for first_row, last_row, first_col, last_col in windows:
+			adjacency[first_row:last_row, first_col:last_col] = _count_adjacent_bombs(mines, first_row, last_row, first_col, last_col)
+
+		if self.__zero_labels is None:
+			return Board.__from_arrays(self.__seed, (row, col), mines, adjacency, None, None, None)
+		zero_labels, cells_by_label, sorted_labels = self.__relabel_zero_regions(mines, adjacency, windows)
+		return Board.__from_arrays(self.__seed, (row, col), mines, adjacency, zero_labels, cells_by_label, sorted_labels)
+
+	def __cells_of(self, label: int) -> np.ndarray:
+		# the flat indices of the cells of a zero region
+		start, end = np.searchsorted(self.__sorted_labels, (label, label + 1))
+		return self.__cells_by_label[start:end]
+
+	def __relabel_zero_regions(
+		self,
+		mines: np.ndarray,
+		adjacency: np.ndarray,
+		windows: list[tuple[int, int, int, int]],
+	) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+		# The zero cells only change in the windows, so they are labeled again only in a box around
+		# each group of overlapping windows, and these local components are joined through the
+		# regions they touch, with a union-find. A region that lost cells in a box may have been
+		# split: if its cells left in the box are in a single local component, any path through the
+		# lost cells can go around them, between its cells next to the lost ones. Else its cells are
+		# labeled again, in its bounding box, and each of its pieces is joined on its own
+		size = self.__size
+		is_zero = (adjacency == 0) & ~mines
+		flat_is_zero = is_zero.ravel()
+		old_labels = self.__zero_labels
+		label_dtype = old_labels.dtype
+
+		# disjoint boxes, a merged box being checked again against the others as it grows
+		boxes: list[tuple[int, int, int, int]] = []
+		for first_row, last_row, first_col, last_col in windows:
+			box = (max(first_row - LOCAL_MARGIN, 0), last_row + LOCAL_MARGIN, max(first_col - LOCAL_MARGIN, 0), last_col + LOCAL_MARGIN)
+			overlapping = True
+			while overlapping:
+				overlapping = False
+				for other in boxes:
+					if box[0] < other[1] and other[0] < box[1] and box[2] < other[3] and other[2] < box[3]:
+						box = (min(box[0], other[0]), max(box[1], other[1]), min(box[2], other[2]), max(box[3], other[3]))
+						boxes.remove(other)
+						overlapping = True
+						break
+			boxes.append(box)
+
+		# the local components: their cells, and the previous label of each of them
+		components: list[tuple[np.ndarray, np.ndarray]] = []
+		split_labels: set[int] = set()
+		for first_row, last_row, first_col, last_col in boxes:
+			box_is_zero = is_zero[first_row:last_row, first_col:last_col]
+			box_old_labels = old_labels[first_row:last_row, first_col:last_col]
+			rows, cols = np.nonzero(box_is_zero)
+			local_labels = _label_regions(box_is_zero)[rows, cols]
+			cells = (rows + first_row) * size + cols + first_col
+			previous = box_old_labels[rows, cols]
+			height, width = box_is_zero.shape
+			lost = (box_old_labels >= 0) & ~box_is_zero
+			for label in np.unique(box_old_labels[lost]).tolist():
+				# the cells of the region next to its lost cells, where a path through them would enter and leave
+				lost_cells = np.pad(lost & (box_old_labels == label), 1)
+				near_lost = lost_cells[1:-1, 1:-1].copy()
+				for row_offset, col_offset in NEIGHBOUR_OFFSETS:
+					near_lost |= lost_cells[1 + row_offset:1 + row_offset + height, 1 + col_offset:1 + col_offset + width]
+				if np.unique(local_labels[near_lost[rows, cols] & (previous == label)]).size > 1:
+					split_labels.add(label)
+			order = np.argsort(local_labels, kind='stable')
+			boundaries = np.flatnonzero(np.diff(local_labels[order])) + 1
+			for component in np.split(order, boundaries) if order.size > 0 else []:
+				components.append((cells[component], previous[component]))
+
+		# the pieces of the regions that may have been split, as sorted cells with their piece
+		pieces: list[np.ndarray] = []
+		piece_cells, piece_of_cells = [np.empty(0, np.int64)], [np.empty(0, np.int64)]
+		for label in sorted(split_labels):
+			cells = self.__cells_of(label).astype(np.int64)
+			cells = cells[flat_is_zero[cells]]
+			if cells.size == 0:
+				continue
+			rows, cols = np.divmod(cells, size)
+			first_row, first_col = int(rows.min()), int(cols.min())
+			region_mask = np.zeros((int(rows.max()) + 1 - first_row, int(cols.max()) + 1 - first_col), dtype=bool)
+			region_mask[rows - first_row, cols - first_col] = True
+			local_labels = _label_regions(region_mask)[rows - first_row, cols - first_col]
+			for piece in np.unique(local_labels).tolist():
+				piece_cells.append(cells[local_labels == piece])
+				piece_of_cells.append(np.full(piece_cells[-1].size, len(pieces)))
+				pieces.append(piece_cells[-1])
+		piece_cells, piece_of_cells = np.concatenate(piece_cells), np.concatenate(piece_of_cells)
+		order = np.argsort(piece_cells)
+		piece_cells, piece_of_cells = piece_cells[order], piece_of_cells[order]
+
+		# union-find over the previous labels (their own value), the local components ('component', index)
+		# and the pieces ('piece', index)
+		parent: dict[typing.Hashable, typing.Hashable] = {}
+		def find(node: typing.Hashable) -> typing.Hashable:
+			while parent.setdefault(node, node) != node:
+				parent[node] = parent[parent[node]]
+				node = parent[node]
+			return node
+
+		for index, (cells, previous) in enumerate(components):
+			root = find(('component', index))
+			for label in np.unique(previous[previous >= 0]).tolist():
+				if label in split_labels:
+					split_cells = cells[previous == label]
+					for piece in np.unique(piece_of_cells[np.searchsorted(piece_cells, split_cells)]).tolist():
+						parent[find(('piece', piece))] = root
+				else:
+					parent[find(label)] = root
+		for index in range(0, len(pieces)):
+			find(('piece', index))
+
+		# the label of each region: the one of its largest previous region (not written again), else
+		# the smallest of its cells (that was not a label, being in a split region or a new zero cell)
+		sizes = {node: self.__cells_of(node).size for node in parent if isinstance(node, int)}
+		labels_of_roots: dict[typing.Hashable, int] = {}
+		for label, label_size in sizes.items():
+			root = find(label)
+			if root not in labels_of_roots or label_size > sizes[labels_of_roots[root]]:
+				labels_of_roots[root] = label
+		smallest_cells: dict[typing.Hashable, int] = {}
+		for node_cells in [(('component', index), cells) for index, (cells, _) in enumerate(components)] + [(('piece', index), cells) for index, cells in enumerate(pieces)]:
+			node, cells = node_cells
+			root = find(node)
+			if root not in labels_of_roots and cells.size > 0:
+				smallest_cells[root] = min(smallest_cells.get(root, size * size), int(cells.min()))
+		labels_of_roots.update(smallest_cells)
+
+		zero_labels = old_labels.copy()
+		flat_labels = zero_labels.ravel()
+		for first_row, last_row, first_col, last_col in windows:
+			window = zero_labels[first_row:last_row, first_col:last_col]
+			window[~is_zero[first_row:last_row, first_col:last_col]] = -1
+		# the cells whose label changes: the previous regions merged into another one, the pieces and the new zero cells
+		relabeled = [label for label in sizes if labels_of_roots[find(label)] != label] + sorted(split_labels)
+		new_labels, new_cells = [np.empty(0, label_dtype)], [np.empty(0, label_dtype)]
+		def relabel(node: typing.Hashable, cells: np.ndarray):
+			label = labels_of_roots[find(node)]
+			flat_labels[cells] = label
+			new_cells.append(cells.astype(label_dtype))
+			new_labels.append(np.full(cells.size, label, label_dtype))
+		for label in relabeled[:len(relabeled) - len(split_labels)]:
+			cells = self.__cells_of(label)
+			relabel(label, cells[flat_is_zero[cells]])
+		for index, cells in enumerate(pieces):
+			relabel(('piece', index), cells)
+		for index, (cells, previous) in enumerate(components):
+			relabel(('component', index), cells[previous < 0])
+
+		# the kept cells, with the relabeled ones inserted in their label group
+		kept = flat_is_zero[self.__cells_by_label] & ~np.isin(self.__sorted_labels, relabeled)
+		labels, cells = np.concatenate(new_labels), np.concatenate(new_cells)
+		order = np.argsort(labels, kind='stable')
+		labels, cells = labels[order], cells[order]
+		kept_labels, kept_cells = self.__sorted_labels[kept], self.__cells_by_label[kept]
+		positions = np.searchsorted(kept_labels, labels)
+		return zero_labels, np.insert(kept_cells, positions, cells), np.insert(kept_labels, positions, labels)
+
+	def __zero_region_bounds(self, label: int) -> tuple[int, int, int, int]:
+		# the bounding box (first row, last row + 1, first col, last col + 1) of a zero region and its border
+		start, end = np.searchsorted(self.__sorted_labels, (label, label + 1))
+		rows, cols = np.divmod(self.__cells_by_label[start:end], self.__size)
+		return (
+			max(int(rows.min()) - 1, 0), min(int(rows.max()) + 2, self.__size),
+			max(int(cols.min()) - 1, 0), min(int(cols.max()) + 2, self.__size),
+		)
+
+	def flood_fill(self, row: int, col: int, state: np.ndarray) -> list[tuple[int, int]]:
+		"""
+		Reveals a non bomb cell and, if it has no adjacent bombs, spreads to its 8 neighbours,
+		using an explicit queue (so there is no recursion limit).
+		[time complexity: O(n), where n is the number of revealed cells]
+
+		Args:
+			row, col:
+				The cell where the flood starts
+			state:
+				A (size, size) boolean or integer array, nonzero for the cells that must not be
+				revealed (already revealed, flagged...). The revealed cells are set to 1 in place
+
+		Returns:
+			The (row, col) of the cells revealed by this call
+		"""
+		if state[row, col] or self.is_bomb(row, col):
+			return []
+
+		size = self.__size
+		adjacency = self.__adjacency
+		revealed_cells: list[tuple[int, int]] = [(row, col)]
+		state[row, col] = 1
+		queue = [(row, col)]
+		while queue:
+			row, col = queue.pop()
+			if adjacency[row, col] != 0:
+				continue
+			for row_offset, col_offset in NEIGHBOUR_OFFSETS:
+				r, c = row + row_offset, col + col_offset
+				if 0 <= r < size and 0 <= c < size and not state[r, c]:
+					state[r, c] = 1
+					revealed_cells.append((r, c))
+					queue.append((r, c))
+		return revealed_cells
+
+	def reveal_region(self, row: int, col: int, state: np.ndarray) -> list[tuple[int, int]]:
+		"""
+		Same as flood_fill, but when the zero regions are labeled, a cell with
+		no adjacent bombs reveals its whole region (and its border) at once.
+		The cells of the state that are neither hidden (0) nor revealed (1), such as
+		the flags, may cut the region, so the flood fill is used when there is any
+		of them around the region.
+		"""
+		if self.__zero_labels is None or self.__zero_labels[row, col] < 0 or state[row, col]:
+			return self.flood_fill(row, col, state)
+
+		label = self.__zero_labels[row, col]
+		first_row, last_row, first_col, last_col = self.__zero_region_bounds(label)
+		state_window = state[first_row:last_row, first_col:last_col]
+		if (state_window > 1).any():
+			return self.flood_fill(row, col, state)
+		# the region dilated by one cell (its border), only within its bounding box
+		region = np.pad(self.__zero_labels[first_row:last_row, first_col:last_col] == label, 1)
+		height, width = last_row - first_row, last_col - first_col
+		to_reveal = region[1:-1, 1:-1].copy()
+		for row_offset, col_offset in NEIGHBOUR_OFFSETS:
+			to_reveal |= region[1 + row_offset:1 + row_offset + height, 1 + col_offset:1 + col_offset + width]
+		to_reveal &= state_window == 0
+		state_window[to_reveal] = 1
+		rows, cols = np.nonzero(to_reveal)
+		return list(zip((rows + first_row).tolist(), (cols + first_col).tolist()))
+
+	def in_bounds(self, row: int, col: int) -> bool:
+		return 0 <= row < self.__size and 0 <= col < self.__size
+
+	def is_bomb(self, row: int, col: int) -> bool:
+		return bool(self.__mines[row, col])
+
+	def number_of_adjacent_bombs(self, row: int, col: int) -> int:
+		return int(self.__adjacency[row, col])
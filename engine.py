@@ -0,0 +1,218 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
+from board import Board
+
+# the states of a cell, kept in a single uint8 array
+HIDDEN = 0
+REVEALED = 1 # the board reveals cells by setting them to 1
+FLAGGED = 2
+
+class Minesweeper:
+	"""
+	The minesweeper game logic, with no dependency on pygame.
+
+	It owns the board and the state of every cell (hidden/revealed/flagged), and knows
+	when the game has been won or lost, so games can be built, played and tested
+	without a display or an audio device. The pygame front end is only a view over it.
+
+	Args:
+		number_of_cells_per_row_col:
+			The number of cells in each row and column of the (square) board
+		number_of_bombs:
+			The number of bombs of the board
+		seed:
+			The seed of the board. Defaults to None (a random board)
+		first_click_safe:
+			If true, the first reveal never hits a bomb nor a numbered cell: the bombs around
+			the revealed cell are moved elsewhere (see Board.with_safe_cell). Defaults to False
+		board:
+			The board of the first game, generated beforehand, as in reset. Defaults to None
+	"""
+	def __init__(
+		self,
+		number_of_cells_per_row_col: int,
+		number_of_bombs: int,
+		seed: int | None = None,
+		first_click_safe: bool = False,
+		board: Board | None = None,
+	):
+		self.__number_of_cells_per_row_col = number_of_cells_per_row_col
+		self.__number_of_bombs = number_of_bombs
+		self.__first_click_safe = first_click_safe
+		self.reset(seed, board)
+
+	def reset(self, seed: int | None = None, board: Board | None = None):
+		"""
+		Starts a new game, on a new board.
+
+		Args:
+			seed:
+				The seed of the new board. Defaults to None (a random board)
+			board:
+				A board generated beforehand (see BoardPregenerator), used instead of generating
+				one. Its seed replaces the given one. Defaults to None
+
+		Raises:
+			ValueError: The given board does not have the size of the game
+		"""
+		size = self.__number_of_cells_per_row_col
+		if board is not None and board.size != size:
+			raise ValueError(f'The board size [{board.size}] is not the game size [{size}]')
+		self.__board = board if board is not None else Board(size, self.__number_of_bombs, seed)
+		self.__seed = self.__board.seed
+		self.__state = np.zeros((size, size), dtype=np.uint8) # HIDDEN
+		self.__number_of_revealed = 0
+		self.__is_lost = False
+		self.__is_first_reveal = True
+
+	@property
+	def board(self) -> Board:
+		return self.__board
+
+	@property
+	def seed(self) -> int | None:
+		return self.__seed
+
+	@property
+	def size(self) -> int:
+		return self.__number_of_cells_per_row_col
+
+	@property
+	def state(self) -> np.ndarray:
+		"""A (size, size) uint8 array with the state (HIDDEN/REVEALED/FLAGGED) of each cell. Must not be changed"""
+		return self.__state
+
+	@property
+	def revealed(self) -> np.ndarray:
+		"""A (size, size) boolean mask of the revealed cells"""
+		return self.__state == REVEALED
+
+	@property
+	def flagged(self) -> np.ndarray:
+		"""A (size, size) boolean mask of the flagged cells"""
+		return self.__state == FLAGGED
+
+	@property
+	def number_of_revealed(self) -> int:
+		return self.__number_of_revealed
+
+	@property
+	def is_lost(self) -> bool:
+		return self.__is_lost
+
+	@property
+	def is_won(self) -> bool:
+		number_of_cells = self.size * self.size
+		return not self.__is_lost and self.__number_of_revealed == number_of_cells - self.__board.number_of_bombs
+
+	@property
+	def is_over(self) -> bool:
+		return self.is_lost or self.is_won
+
+	def __str__(self) -> str:
+		return f'Minesweeper(size={self.size}, number_of_bombs={self.__board.number_of_bombs}, seed={self.seed}, revealed={self.number_of_revealed})'
+
+	def __repr__(self) -> str:
+		return self.__str__()
+
+	def is_revealed(self, row: int, col: int) -> bool:
+		return bool(self.__state[row, col] == REVEALED)
+
+	def is_flagged(self, row: int, col: int) -> bool:
+		return bool(self.__state[row, col] == FLAGGED)
+
+	def __reveal_all_bombs(self) -> list[tuple[int, int]]:
+		bombs = self.__board.mines & (self.__state != REVEALED)
+		self.__state[bombs] = REVEALED
+		rows, cols = np.nonzero(bombs)
+		return list(zip(rows.tolist(), cols.tolist()))
+
+	def reveal(self, row: int, col: int) -> list[tuple[int, int]]:
+		"""
+		Reveals a cell. Revealing a bomb loses the game and reveals all the bombs,
+		revealing a cell with no adjacent bombs also reveals its whole region.
+		Flagged cells are never revealed.
+
+		Returns:
+			The (row, col) of the cells revealed by this call
+		"""
+		if self.is_over or self.__state[row, col] != HIDDEN:
+			return []
+
+		if self.__is_first_reveal:
+			self.__is_first_reveal = False
+			if self.__first_click_safe:
+				self.__board = self.__board.with_safe_cell(row, col)
+
+		if self.__board.is_bomb(row, col):
+			self.__is_lost = True
+			return self.__reveal_all_bombs()
+
+		# only the HIDDEN (zero) cells are revealed, so flagged cells block the reveal
+		revealed_cells = self.__board.reveal_region(row, col, self.__state)
+		self.__number_of_revealed += len(revealed_cells)
+		return revealed_cells
+
+	def toggle_flag(self, row: int, col: int) -> bool:
+		"""
+		Flags/unflags a hidden cell.
+
+		Returns:
+			True if the cell state has changed
+		"""
+		if self.is_over or self.__state[row, col] == REVEALED:
+			return False
+		self.__state[row, col] = HIDDEN if self.__state[row, col] == FLAGGED else FLAGGED
+		return True
+
+class BoardPregenerator:
+	"""
+	Generates the next board on a worker thread, while the current game is played.
+
+	The board generation is vectorized numpy code, which releases the GIL on large
+	arrays, so it runs alongside the game loop. take() hands over the board generated in
+	the background (only waiting for it if it is not done yet) and starts the next one,
+	so a new game starts with no generation at all, whatever the size of the board.
+
+	Args:
+		number_of_cells_per_row_col:
+			The number of cells in each row and column of the boards
+		number_of_bombs:
+			The number of bombs of the boards
+		first_seed:
+			The seed of the first board, the next boards use the following seeds.
+			Defaults to None (random boards)
+	"""
+	def __init__(self, number_of_cells_per_row_col: int, number_of_bombs: int, first_seed: int | None = None):
+		self.__number_of_cells_per_row_col = number_of_cells_per_row_col
+		self.__number_of_bombs = number_of_bombs
+		self.__next_seed = first_seed
+		self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='board')
+		self.__next_board = self.__submit()
+
+	def __enter__(self) -> 'BoardPregenerator':
+		return self
+
+	def __exit__(self, *exc_info):
+		self.close()
+
+	def __submit(self) -> Future[Board]:
+		seed = self.__next_seed
+		if seed is not None:
+			self.__next_seed += 1
+		return self.__executor.submit(Board, self.__number_of_cells_per_row_col, self.__number_of_bombs, seed)
+
+	@property
+	def is_ready(self) -> bool:
+		"""True if the next board is generated, so take() does not wait"""
+		return self.__next_board.done()
+
+	def take(self) -> Board:
+		"""Returns the next board, and starts generating the one after it"""
+		board = self.__next_board.result()
+		self.__next_board = self.__submit()
+		return board
+
+	def close(self):
+		"""Stops the worker thread, without waiting for a board being generated"""
+		self.__executor.shutdown(wait=False, cancel_futures=True)
@@ -1,35 +1,58 @@
+import time
 import pygame
-import random
+from engine import Minesweeper, BoardPregenerator
+from assets import AssetManager, EXPLOSION_SOUND_PATH, THEME_MUSIC_PATH
+from renderer import Renderer
+from viewport import Viewport
+from profiler import FrameProfiler
+
+# the phases of a frame, 'events' does not include 'reveal' (which happens during the event handling)
+FRAME_PHASES = ('events', 'reveal', 'view', 'render', 'overlay', 'display', 'tick')
 
 class Cell:
-	def __init__(self, size: int, pos: pygame.Vector2, is_bomb: bool):
-		self.__border_width = 1
-		rect_size = size - self.__border_width
+	"""
+	The view of a single cell of the engine.
+
+	The cell state lives in the engine arrays, and the colours and assets are shared
+	by all cells, so a cell only holds its position. Cells are created only for the
+	visible part of the board.
+	"""
+	__slots__ = ('__size', '__rect', '__engine', '__coords', '__assets')
+
+	BORDER_WIDTH = 1
+	BORDER_COLOR = '#6b6b6b' # dark grey
+	HIDDEN_COLOR = '#d1cfcf' # light grey
+	REVEALED_COLOR = '#808080' # darker grey
+	BOMB_COLOR = '#fa6161' # light red
+
+	def __init__(self, size: int, pos: pygame.Vector2, engine: Minesweeper, coords: tuple[int, int], assets: AssetManager):
+		rect_size = size - self.BORDER_WIDTH
 		self.__size = size 
 		self.__rect = pygame.Rect(pos.x, pos.y, rect_size, rect_size)
-		self.__fill_color = '#d1cfcf' # light grey
-		self.__border_color = '#6b6b6b' # dark grey
-		self.__is_bomb = is_bomb
-		self.__is_revealed = False
-		self.__number_of_adjacent_bombs = 0
-		self.__played_explosion_sound = False
-		self.__explosion_sound = pygame.mixer.Sound('assets/audios/bit-explosion.wav')
+		self.__engine = engine
+		self.__coords = coords
+		self.__assets = assets
 
 	@property
 	def is_bomb(self) -> bool:
-		return self.__is_bomb
+		return self.__engine.board.is_bomb(*self.__coords)
 	
 	@property
 	def is_revealed(self) -> bool:
-		return self.__is_revealed
+		return self.__engine.is_revealed(*self.__coords)
+
+	@property
+	def is_flagged(self) -> bool:
+		return self.__engine.is_flagged(*self.__coords)
 	
 	@property
 	def number_of_adjacent_bombs(self) -> int:
-		return self.__number_of_adjacent_bombs
-	
-	@number_of_adjacent_bombs.setter
-	def number_of_adjacent_bombs(self, amount: int):
-		self.__number_of_adjacent_bombs = amount
+		return self.__engine.board.number_of_adjacent_bombs(*self.__coords)
+
+	@property
+	def rect(self) -> pygame.Rect:
+		"""The screen area covered by the cell, border included"""
+		return pygame.Rect(self.__rect.left, self.__rect.top, self.__rect.width + self.BORDER_WIDTH, self.__rect.height + self.BORDER_WIDTH)
 
 	def __str__(self) -> str:
 		return f'Cell(size={self.__size},pos=[x:{self.__rect.left}, y:{self.__rect.top}], is_bomb={self.is_bomb}, adj={self.number_of_adjacent_bombs})'
@@ -37,21 +60,27 @@ class Cell:
 	def __repr__(self) -> str:
 		return self.__str__()
 
+	def __fill_color(self) -> str:
+		if not self.is_revealed:
+			return self.HIDDEN_COLOR
+		if not self.is_bomb:
+			return self.REVEALED_COLOR
+		return self.BOMB_COLOR
+
 	def __draw_rect(self, surface: pygame.Surface):
-		pygame.draw.rect(surface, self.__fill_color, self.__rect)
+		pygame.draw.rect(surface, self.__fill_color(), self.__rect)
 
 	def __draw_border(self, surface: pygame.Surface):
 		x, y = self.__rect.left, self.__rect.top
 		rect_width, rect_height = self.__rect.width, self.__rect.height
 		border_cords = ((x, y), (x+rect_width, y), (x+rect_width, y+rect_height), (x, y+rect_height))
-		pygame.draw.lines(surface, self.__border_color, True, border_cords, self.__border_width)
+		pygame.draw.lines(surface, self.BORDER_COLOR, True, border_cords, self.BORDER_WIDTH)
 
 	def __draw_number_of_adjacents(self, surface: pygame.Surface):
 		if not self.is_revealed or self.number_of_adjacent_bombs == 0:
 			return
 
-		font = pygame.font.Font(size=int(self.__size // 2))
-		text = font.render(str(self.number_of_adjacent_bombs), True, 'blue')
+		text = self.__assets.digit_glyph(self.number_of_adjacent_bombs, self.__size)
 		text_rect = text.get_rect()
 		text_rect.center = (self.__rect.left + self.__size // 2), (self.__rect.top + self.__size // 2)
 		surface.blit(text, text_rect)
@@ -60,196 +89,253 @@ class Cell:
 		if not self.is_revealed or not self.is_bomb:
 			return
 		
-		self.__play_explosion_sound()
-		bomb_image = pygame.image.load('assets/images/bomb.png').convert_alpha()
-		bomb_surface = pygame.transform.scale(bomb_image, (self.__size // 2, self.__size // 2))
+		bomb_surface = self.__assets.bomb_surface(self.__size)
 		bomb_rect = bomb_surface.get_rect()
 		bomb_rect.center = (self.__rect.left + self.__size // 2), (self.__rect.top + self.__size // 2)
 		surface.blit(bomb_surface, bomb_rect)
 
-	def __play_explosion_sound(self):
-		if not self.__played_explosion_sound:
-			self.__explosion_sound.play()
-			self.__played_explosion_sound = True
+	def __draw_flag(self, surface: pygame.Surface):
+		if not self.is_flagged:
+			return
+
+		x, y, quarter = self.__rect.left, self.__rect.top, self.__size / 4
+		flag_cords = ((x + quarter, y + quarter), (x + 3 * quarter, y + 2 * quarter), (x + quarter, y + 3 * quarter))
+		pygame.draw.polygon(surface, 'red', flag_cords)
 
 	def render(self, surface: pygame.Surface):
 		self.__draw_rect(surface)
 		self.__draw_border(surface)
 		self.__draw_number_of_adjacents(surface)
 		self.__draw_bomb(surface)
-
-	def reveal(self):
-		if self.__is_revealed:
-			return
-		
-		self.__is_revealed = True
-		if not self.is_bomb:
-			self.__fill_color = '#808080' # darker grey
-		else:
-			self.__fill_color = '#fa6161' # light red
+		self.__draw_flag(surface)
 
 	def collidepoint(self, pos: tuple[int, int]) -> bool:
 		return self.__rect.collidepoint(pos[0], pos[1])
 
 class Game:
-	def __init__(self):
+	"""
+	The pygame front end of the engine.
+
+	F3 toggles the frame profiler and its overlay (the frame time percentiles and the
+	cells drawn per frame), F4 dumps the profiled frames to profile.csv and profile.json.
+
+	Args:
+		number_of_cells_per_row_col:
+			The number of cells in each row and column of the board. Defaults to 10
+		number_of_bombs:
+			The number of bombs of the board. Defaults to 25
+		profile:
+			If true, the frame profiler starts enabled. Defaults to False
+	"""
+	def __init__(self, number_of_cells_per_row_col: int = 10, number_of_bombs: int = 25, profile: bool = False):
 		self.window_size = 800
 		self.running = True
-		self.theme_music = pygame.mixer.Sound('assets/audios/theme-music.mp3')
+		self.assets = AssetManager()
+		self.theme_music = self.assets.sound(THEME_MUSIC_PATH)
 		self.theme_music.set_volume(.2)
 		self.theme_music.play(-1)
 		self.screen = pygame.display.set_mode((self.window_size, self.window_size))
 		self.clock = pygame.time.Clock()
-		self.number_of_bombs = 25
-		self.number_of_cells_per_row_col = 10
-		self.bomb_coords = self.__generate_bomb_coords()
+		self.number_of_bombs = number_of_bombs
+		self.number_of_cells_per_row_col = number_of_cells_per_row_col
+		self.min_cell_size = 20 # boards that do not fit the window at this size are scrolled
+		self.min_visible_cell_size = 8 # how far the view can be zoomed out
+		self.zoom_step = 1.25
+		self.engine = Minesweeper(self.number_of_cells_per_row_col, self.number_of_bombs, first_click_safe=True)
+		# the board of the next game is generated in the background while this one is played
+		self.next_boards = BoardPregenerator(self.number_of_cells_per_row_col, self.number_of_bombs)
+		self.game_over_font = pygame.font.Font(size=100)
+		self.game_over_shown = False
+		self.profiler = FrameProfiler(FRAME_PHASES)
+		self.profiler.enabled = profile
+		self.profiler_font = pygame.font.Font(size=24)
+		self.profiler_text: pygame.Surface | None = None
+		self.profiler_text_age = 0 # frames since the overlay text was rendered
+		self.profiler_text_refresh = 30 # frames between two renders of the overlay text
+		self.profiler_rect: pygame.Rect | None = None # the area covered by the overlay since it was shown
+		cell_size = max(self.window_size / self.number_of_cells_per_row_col, self.min_cell_size)
+		self.viewport = Viewport(cell_size, self.number_of_cells_per_row_col, min_scale=min(self.min_visible_cell_size / cell_size, 1))
+		self.view_changed = False
 		self.cells = self.__generate_cell_grid()
-		self.__set_number_of_adjacent_bombs()
-		self.game_over = False
+		self.renderer = Renderer(self.screen, self.cells.values())
 
 		pygame.display.set_caption('Mineweeper')
 
-	def __generate_bomb_coords(self) -> list[tuple[int, int]]:
-		bomb_coords: list[tuple[int, int]] = []
-		max_col = self.number_of_cells_per_row_col - 1
-
-		for i in range(0, self.number_of_bombs):
-			bomb_coords.append((random.randint(0, max_col), random.randint(0, max_col)))	
-		
-		return bomb_coords 
-	
-	def __is_bomb(self, cell_coords: tuple[int, int]) -> bool:
-		return cell_coords in self.bomb_coords
-	
-	def __calculate_adjacent_bombs(self, cell_pos: tuple[int, int]) -> int:
-		number_of_adjacent_bombs = 0
-		row, col = cell_pos[0], cell_pos[1]
-		adjacent_cells_coords: dict[Cell, tuple[int, int]] = [
-			(row+1, col), # bottom
-			(row-1, col), # top
-			(row, col+1), # right
-			(row, col-1), # left
-			(row+1, col+1), # bottom-right diag
-			(row+1, col-1), # bottom-left diag
-			(row-1, col+1), # top-right diag
-			(row-1, col-1), # top-left diag
-		]
-		
-		for r, c in adjacent_cells_coords:
-			if (
-				(r >= 0 and r < self.number_of_cells_per_row_col) and
-				(c >= 0 and c < self.number_of_cells_per_row_col)
-			):
-				cell = self.cells[r][c]
-				number_of_adjacent_bombs += 1 if cell.is_bomb else 0
-
-		return number_of_adjacent_bombs
-
-	def __set_number_of_adjacent_bombs(self):
-		for row in range(0, len(self.cells)):
-			for col in range(0, len(self.cells[row])):
-				cell = self.cells[row][col]
-				if not cell.is_bomb:
-					cell.number_of_adjacent_bombs = self.__calculate_adjacent_bombs((row, col))
-
-	def __generate_cell_grid(self) -> list[list[Cell]]:
-		grid: list[list[Cell]] = []
-		cell_size = self.window_size / self.number_of_cells_per_row_col
-		for row in range(0, self.number_of_cells_per_row_col): # row
-			column: list[Cell] = []
-			for col in range(0, self.number_of_cells_per_row_col): # col
-				cell_pos = pygame.Vector2(row * cell_size, col * cell_size)
-				column.append(Cell(cell_size, cell_pos, self.__is_bomb((row, col))))
-			grid.append(column)
+	def __generate_cell_grid(self) -> dict[tuple[int, int], Cell]:
+		# cells are only created for the visible part of the board
+		grid: dict[tuple[int, int], Cell] = {}
+		cell_size = self.viewport.scaled_cell_size
+		first_row, last_row, first_col, last_col = self.viewport.visible_range(self.screen.get_size())
+		for row in range(first_row, last_row): # row
+			for col in range(first_col, last_col): # col
+				cell_pos = pygame.Vector2(self.viewport.cell_to_screen(row, col))
+				grid[(row, col)] = Cell(cell_size, cell_pos, self.engine, (row, col), self.assets)
 		return grid
 	
-	def __render_cell_grid(self):
-		for row in self.cells:
-			for cell in row:
-				cell.render(self.screen)
-
-	def __index_not_out_of_range(self, row: int, col: int) -> bool:
-		return (
-			(row >= 0 and row < self.number_of_cells_per_row_col) and
-			(col >= 0 and col < self.number_of_cells_per_row_col)
-		)
-
-	def __reveal_non_bomb_cell(self, cell_coords: tuple[int, int]):
-		row, col = cell_coords
-		adjacent_cell_coords = [
-			(row+1, col), # bottom
-			(row-1, col), # top
-			(row, col+1), # right
-			(row, col-1), # left
-		]
-		if self.__index_not_out_of_range(row, col):
-			cell = self.cells[row][col]
-			if not cell.is_bomb:
-				cell.reveal()
-				if cell.number_of_adjacent_bombs == 0:
-					for adjacent_cell_coord in adjacent_cell_coords:
-						r, c = adjacent_cell_coord
-						if self.__index_not_out_of_range(r, c) and not self.cells[r][c].is_revealed:
-							self.__reveal_non_bomb_cell((r, c))
-						else:
-							pass
-
-	def __review_all_bombs(self):
-		for row in self.cells:
-			for cell in row:
-				if cell.is_bomb:
-					cell.reveal()
-
-	def __reveal_cells(self, initial_coords: tuple[int, int]):
-		row, col = initial_coords
-		cell = self.cells[row][col]
-		if cell.is_bomb:
-			cell.reveal()
-			self.__review_all_bombs()
-			self.game_over = True
-			return
-		self.__reveal_non_bomb_cell(initial_coords)
+	def __render_cell_grid(self) -> list[pygame.Rect]:
+		return self.renderer.render()
+
+	@property
+	def game_over(self) -> bool:
+		return self.engine.is_over
+
+	def __mark_dirty(self, cells_coords: list[tuple[int, int]]):
+		for cell_coords in cells_coords:
+			cell = self.cells.get(cell_coords)
+			if cell is not None: # not visible
+				self.renderer.mark_dirty(cell)
+
+	def __restart(self):
+		# swaps in the pre-generated board, so only the visible cells are rebuilt
+		self.engine.reset(board=self.next_boards.take())
+		self.cells = self.__generate_cell_grid()
+		self.renderer.reset(self.cells.values())
+		self.game_over_shown = False
 
 	def __on_grid_click(self, mouse_click_pos: tuple[int, int]):
-		for row in range(0, len(self.cells)):
-			for col in range(0, len(self.cells[row])):
-				if self.cells[row][col].collidepoint(mouse_click_pos):
-					self.__reveal_cells((row, col))
+		if self.game_over:
+			self.__restart()
+			return
+		cell_coords = self.viewport.screen_to_cell(mouse_click_pos)
+		if cell_coords is None:
+			return
+		if self.profiler.enabled:
+			start = time.perf_counter()
+			revealed_cells = self.engine.reveal(*cell_coords)
+			self.profiler.add('reveal', time.perf_counter() - start, part_of='events')
+		else:
+			revealed_cells = self.engine.reveal(*cell_coords)
+		self.__mark_dirty(revealed_cells)
+		if self.engine.is_lost: # the clicks after the game is over restart it, so this is the losing click
+			self.assets.sound(EXPLOSION_SOUND_PATH).play()
+
+	def __on_grid_right_click(self, mouse_click_pos: tuple[int, int]):
+		cell_coords = self.viewport.screen_to_cell(mouse_click_pos)
+		if cell_coords is not None and self.engine.toggle_flag(*cell_coords):
+			self.__mark_dirty([cell_coords])
+
+	def __pan(self, delta: tuple[float, float]):
+		if self.viewport.pan(delta, self.screen.get_size()):
+			self.view_changed = True
+
+	def __zoom(self, steps: int, anchor: tuple[int, int]):
+		if self.viewport.zoom(self.zoom_step ** steps, anchor, self.screen.get_size()):
+			self.view_changed = True
+
+	def __on_key_down(self, key: int):
+		step = self.viewport.scaled_cell_size
+		deltas = {
+			pygame.K_LEFT: (-step, 0),
+			pygame.K_RIGHT: (step, 0),
+			pygame.K_UP: (0, -step),
+			pygame.K_DOWN: (0, step),
+		}
+		if key in deltas:
+			self.__pan(deltas[key])
+		elif key == pygame.K_r:
+			self.__restart()
+		elif key == pygame.K_F3:
+			self.__toggle_profiler()
+		elif key == pygame.K_F4:
+			self.profiler.to_csv('profile.csv')
+			self.profiler.to_json('profile.json')
+
+	def __toggle_profiler(self):
+		if not self.profiler.toggle():
+			# the full redraw erases the overlay
+			self.renderer.reset(self.cells.values())
+			self.game_over_shown = False
+		self.profiler_text = None
+		self.profiler_rect = None
+
+	def __refresh_view(self):
+		# the cells are recreated for the new visible range, at most once per frame
+		if self.view_changed:
+			self.cells = self.__generate_cell_grid()
+			self.renderer.reset(self.cells.values())
+			self.view_changed = False
+			self.game_over_shown = False # the full redraw covers it
 
 	def __handle_event(self):
 		for event in pygame.event.get():
 			if event.type == pygame.QUIT:
 				self.running = False
 			elif event.type == pygame.MOUSEBUTTONUP and event.button == pygame.BUTTON_LEFT:
-				mouse_click_pos = pygame.mouse.get_pos()
-				self.__on_grid_click(mouse_click_pos)
+				self.__on_grid_click(event.pos)
+			elif event.type == pygame.MOUSEBUTTONUP and event.button == pygame.BUTTON_RIGHT:
+				self.__on_grid_right_click(event.pos)
+			elif event.type == pygame.MOUSEMOTION and event.buttons[1]: # dragging with the middle button
+				self.__pan((-event.rel[0], -event.rel[1]))
+			elif event.type == pygame.MOUSEWHEEL:
+				self.__zoom(event.y, pygame.mouse.get_pos())
+			elif event.type == pygame.KEYDOWN:
+				self.__on_key_down(event.key)
 
-	def __render_game_over(self):
-		if self.game_over:
-			font = pygame.font.Font(size=100)
-			game_over_text = font.render('Game Over!', True, 'red')
-			text_rect = game_over_text.get_rect()
-			text_rect.center = self.window_size // 2, self.window_size // 2
-			self.screen.blit(game_over_text, text_rect)
-			self.cells = self.__generate_cell_grid()
+	def __render_game_over(self) -> list[pygame.Rect]:
+		# drawn once over the cells, the next click (or R) starts a new game
+		if not self.game_over or self.game_over_shown:
+			return []
+		game_over_text = self.game_over_font.render('Game Over!', True, 'red')
+		text_rect = game_over_text.get_rect()
+		text_rect.center = self.window_size // 2, self.window_size // 2
+		self.screen.blit(game_over_text, text_rect)
+		self.game_over_shown = True
+		return [text_rect]
+
+	def __render_profiler(self) -> list[pygame.Rect]:
+		# drawn over the cells on every frame, its text is only rendered again every profiler_text_refresh frames
+		if self.profiler_text is None or self.profiler_text_age >= self.profiler_text_refresh:
+			self.profiler_text = self.profiler_font.render(str(self.profiler), True, 'white', 'black')
+			self.profiler_text_age = 0
+		self.profiler_text_age += 1
+		# the background covers the widest text drawn so far, so a narrower text leaves no tail
+		rect = self.profiler_text.get_rect()
+		self.profiler_rect = rect if self.profiler_rect is None else rect.union(self.profiler_rect)
+		self.screen.fill('black', self.profiler_rect)
+		self.screen.blit(self.profiler_text, (0, 0))
+		return [self.profiler_rect.copy()]
 
 	def run(self):
+		profiler = self.profiler
 		while self.running:
+			# the profiler is only called when enabled, so it costs a branch per phase otherwise
+			profiling = profiler.enabled
+			if profiling:
+				profiler.start_frame()
+				cells_drawn = self.renderer.cells_drawn
+
 			self.__handle_event()
+			if profiling:
+				profiler.lap('events')
+			self.__refresh_view()
+			if profiling:
+				profiler.lap('view')
 
-			# fill the screen with a color to wipe away anything from last frame
-			self.screen.fill("green")
-			self.__render_cell_grid()
-			#self.__render_game_over()
-			# flip() the display to put your work on screen
-			pygame.display.flip()
+			# only the cells that changed since the last frame are repainted
+			dirty_rects = self.__render_cell_grid()
+			if profiling:
+				profiler.lap('render')
+			dirty_rects += self.__render_game_over()
+			if profiling and profiler.enabled: # not just disabled by F3
+				dirty_rects += self.__render_profiler()
+				profiler.lap('overlay')
+			# push only the repainted areas to the screen
+			if dirty_rects:
+				pygame.display.update(dirty_rects)
+			if profiling:
+				profiler.lap('display')
 
 			# limits FPS to 60
 			# dt is delta time in seconds since last frame, used for framerate-
 			# independent physics.
 			self.clock.tick(60)
+			if profiling:
+				profiler.lap('tick')
+				profiler.end_frame(self.renderer.cells_drawn - cells_drawn)
+		self.next_boards.close()
 
-pygame.init()
-game = Game()
-game.run()
-pygame.quit()
\ No newline at end of file
+if __name__ == '__main__':
+	pygame.init()
+	game = Game()
+	game.run()
+	pygame.quit()
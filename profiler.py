@@ -0,0 +1,150 @@
+import csv
+import json
+import time
+import typing
+import numpy as np
+
+class FrameProfiler:
+	"""
+	Per phase timings of the game loop, for the last max_frames frames.
+
+	A frame is timed from start_frame to end_frame, and each lap(phase) adds the time
+	since the previous lap to that phase, so the phases of a frame add up to its time.
+	A part of a phase (e.g. the reveal, inside the event handling) can be timed on its own
+	with add, and taken out of the phase it is part of, so the phases still add up.
+	The frames are written into preallocated numpy arrays used as a ring buffer, so the
+	memory of the profiler does not grow, and the percentiles and the dumps are only
+	computed over the kept frames when asked.
+
+	The profiler does not check whether it is enabled: the game loop only calls it
+	when enabled is true, so a disabled profiler costs a branch per phase.
+
+	Args:
+		phases:
+			The names of the phases of a frame, in the order of the dumps
+		max_frames:
+			How many of the most recent frames are kept. Defaults to 1024
+		clock:
+			The clock, in seconds. Defaults to time.perf_counter
+	"""
+	def __init__(self, phases: typing.Sequence[str], max_frames: int = 1024, clock: typing.Callable[[], float] = time.perf_counter):
+		if max_frames < 1:
+			raise ValueError('max_frames must be at least 1')
+		self.phases = tuple(phases)
+		self.enabled = False
+		self.__phase_indices = {phase: index for index, phase in enumerate(self.phases)}
+		self.__max_frames = max_frames
+		self.__clock = clock
+		# seconds per phase, with the whole frame in the last column
+		self.__times = np.zeros((max_frames, len(self.phases) + 1), dtype=np.float64)
+		self.__cells_drawn = np.zeros(max_frames, dtype=np.int64)
+		self.__current = [0.0] * len(self.phases)
+		self.__frame_start = 0.0
+		self.__last_lap = 0.0
+		self.__number_of_frames = 0 # ever recorded, the next frame goes to number_of_frames % max_frames
+
+	def toggle(self) -> bool:
+		"""Enables/disables the profiler, the frames of a previous run are dropped when enabled"""
+		self.enabled = not self.enabled
+		if self.enabled:
+			self.clear()
+		return self.enabled
+
+	def clear(self):
+		self.__number_of_frames = 0
+
+	@property
+	def number_of_frames(self) -> int:
+		"""The number of frames kept"""
+		return min(self.__number_of_frames, self.__max_frames)
+
+	def start_frame(self):
+		self.__frame_start = self.__last_lap = self.__clock()
+		self.__current = [0.0] * len(self.phases)
+
+	def lap(self, phase: str):
+		"""Adds the time since the previous lap (or the start of the frame) to a phase"""
+		now = self.__clock()
+		self.__current[self.__phase_indices[phase]] += now - self.__last_lap
+		self.__last_lap = now
+
+	def add(self, phase: str, seconds: float, part_of: str | None = None):
+		"""Adds a time measured elsewhere to a phase, and takes it out of the phase it is part of if any"""
+		self.__current[self.__phase_indices[phase]] += seconds
+		if part_of is not None:
+			self.__current[self.__phase_indices[part_of]] -= seconds
+
+	def end_frame(self, cells_drawn: int = 0):
+		row = self.__number_of_frames % self.__max_frames
+		self.__times[row, :-1] = self.__current
+		self.__times[row, -1] = self.__clock() - self.__frame_start
+		self.__cells_drawn[row] = cells_drawn
+		self.__number_of_frames += 1
+
+	def __recorded(self) -> tuple[np.ndarray, np.ndarray]:
+		# the kept frames, from the oldest to the most recent
+		if self.__number_of_frames <= self.__max_frames:
+			return self.__times[:self.__number_of_frames], self.__cells_drawn[:self.__number_of_frames]
+		order = np.roll(np.arange(self.__max_frames), -(self.__number_of_frames % self.__max_frames))
+		return self.__times[order], self.__cells_drawn[order]
+
+	def frame_times(self, phase: str | None = None) -> np.ndarray:
+		"""The seconds of a phase (or of the whole frame) for each kept frame, from the oldest"""
+		times, _ = self.__recorded()
+		return times[:, -1 if phase is None else self.__phase_indices[phase]]
+
+	def cells_drawn(self) -> np.ndarray:
+		"""The number of cells drawn in each kept frame, from the oldest"""
+		return self.__recorded()[1]
+
+	def percentiles(self, phase: str | None = None, percentiles: typing.Sequence[float] = (50, 95, 99)) -> dict[float, float]:
+		"""The percentiles (0-100) of the seconds of a phase (or of the whole frame)"""
+		times = self.frame_times(phase)
+		if times.size == 0:
+			return {percentile: 0.0 for percentile in percentiles}
+		return dict(zip(percentiles, np.percentile(times, percentiles).tolist()))
+
+	def summary(self) -> dict[str, typing.Any]:
+		"""The percentiles of the frame times and the mean of each phase, in milliseconds, and the cells drawn"""
+		times, cells_drawn = self.__recorded()
+		mean_ms = times.mean(axis=0) * 1000 if len(times) > 0 else np.zeros(len(self.phases) + 1)
+		return {
+			'frames': self.number_of_frames,
+			'frame_ms': {f'p{percentile:g}': seconds * 1000 for percentile, seconds in self.percentiles().items()},
+			'phase_mean_ms': dict(zip(self.phases, mean_ms[:-1].tolist())),
+			'cells_drawn': {
+				'mean': float(cells_drawn.mean()) if len(cells_drawn) > 0 else 0.0,
+				'max': int(cells_drawn.max()) if len(cells_drawn) > 0 else 0,
+			},
+		}
+
+	def __str__(self) -> str:
+		frame_ms = self.summary()['frame_ms']
+		cells_drawn = self.cells_drawn()
+		return (
+			f'frame p50 {frame_ms["p50"]:.2f} p95 {frame_ms["p95"]:.2f} p99 {frame_ms["p99"]:.2f} ms, '
+			f'cells drawn {int(cells_drawn[-1]) if len(cells_drawn) > 0 else 0}'
+		)
+
+	def __repr__(self) -> str:
+		return self.__str__()
+
+	def to_csv(self, path: str):
+		"""Writes a row per kept frame, with the milliseconds of each phase and of the frame, and the cells drawn"""
+		times, cells_drawn = self.__recorded()
+		with open(path, 'w', newline='') as file:
+			writer = csv.writer(file)
+			writer.writerow([*(f'{phase}_ms' for phase in self.phases), 'frame_ms', 'cells_drawn'])
+			for frame_times, frame_cells_drawn in zip((times * 1000).tolist(), cells_drawn.tolist()):
+				writer.writerow([*frame_times, frame_cells_drawn])
+
+	def to_json(self, path: str):
+		"""Writes the summary, along with the milliseconds of each phase for each kept frame"""
+		times, cells_drawn = self.__recorded()
+		frames_ms = times * 1000
+		with open(path, 'w') as file:
+			json.dump({
+				**self.summary(),
+				'frames_ms': {phase: frames_ms[:, index].tolist() for index, phase in enumerate((*self.phases, 'frame'))},
+				'frames_cells_drawn': cells_drawn.tolist(),
+			}, file)
@@ -0,0 +1,75 @@
+import pygame
+import typing
+
+class Renderer:
+	"""
+	A retained mode renderer for the cell grid.
+
+	The static grid (every cell in its initial, hidden state) is drawn only once onto
+	a background surface. After that, only the cells marked as dirty are repainted,
+	and only their rects are pushed to the display, so an idle board costs nothing.
+
+	Args:
+		screen:
+			The display surface
+		cells:
+			The cells to be drawn
+		background_color:
+			The color behind the cells. Defaults to green
+		max_dirty_rects:
+			Above this number of dirty rects, a single rect containing all of them
+			is pushed to the display instead. Defaults to 256
+	"""
+	def __init__(self, screen: pygame.Surface, cells: typing.Iterable[typing.Any], background_color: str = 'green', max_dirty_rects: int = 256):
+		self.__screen = screen
+		self.__background_color = background_color
+		self.__max_dirty_rects = max_dirty_rects
+		self.__background = pygame.Surface(screen.get_size())
+		self.__dirty_cells: list[typing.Any] = []
+		self.__needs_full_redraw = True
+		self.cells_drawn = 0 # the number of cell renders since the renderer was created
+		self.reset(cells)
+
+	def reset(self, cells: typing.Iterable[typing.Any]):
+		"""Redraws the background for a new cell grid and schedules a full redraw"""
+		self.__background.fill(self.__background_color)
+		for cell in cells:
+			cell.render(self.__background)
+			self.cells_drawn += 1
+		self.__dirty_cells.clear()
+		self.__needs_full_redraw = True
+
+	def mark_dirty(self, cell: typing.Any):
+		"""Schedules a cell to be repainted on the next render"""
+		self.__dirty_cells.append(cell)
+
+	@property
+	def is_idle(self) -> bool:
+		return not self.__needs_full_redraw and not self.__dirty_cells
+
+	def render(self) -> list[pygame.Rect]:
+		"""
+		Repaints what has changed since the last call.
+
+		Returns:
+			The rects of the screen that have been repainted, to be passed to pygame.display.update
+		"""
+		if self.__needs_full_redraw:
+			self.__screen.blit(self.__background, (0, 0))
+			self.__needs_full_redraw = False
+			for cell in self.__dirty_cells:
+				cell.render(self.__screen)
+			self.cells_drawn += len(self.__dirty_cells)
+			self.__dirty_cells.clear()
+			return [self.__screen.get_rect()]
+
+		dirty_rects: list[pygame.Rect] = []
+		for cell in self.__dirty_cells:
+			cell.render(self.__screen)
+			dirty_rects.append(cell.rect)
+		self.cells_drawn += len(self.__dirty_cells)
+		self.__dirty_cells.clear()
+
+		if len(dirty_rects) > self.__max_dirty_rects:
+			return [dirty_rects[0].unionall(dirty_rects[1:])]
+		return dirty_rects
@@ -0,0 +1,181 @@
+"""
+Batch Monte Carlo simulation of minesweeper boards, with no UI.
+
+Plays many seeded games of a board configuration across a process pool and reports
+the win rate, the distribution of the zero region sizes and the mean adjacency, along
+with the games per second and the scaling efficiency for a growing number of workers.
+
+The seeds are split into chunks: each task plays a whole chunk and returns only its
+aggregated statistics, which are merged as the tasks complete, so no per game object
+ever crosses the process boundary or stays in memory.
+
+Usage: python3 simulate.py [cells per row/col] [bombs] [games] [strategy]
+"""
+import os
+import sys
+import time
+import typing
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+import numpy as np
+from board import Board
+from engine import Minesweeper, HIDDEN
+from solver import play_solver
+
+# plays a game until it is over, and returns the number of clicks
+type Strategy = typing.Callable[[Minesweeper, np.random.Generator], int]
+
+def play_random(game: Minesweeper, rng: np.random.Generator) -> int:
+	"""Reveals hidden cells in a random order"""
+	clicks = 0
+	size = game.size
+	for flat_index in rng.permutation(size * size).tolist():
+		if game.is_over:
+			break
+		row, col = divmod(flat_index, size)
+		if game.state[row, col] == HIDDEN:
+			game.reveal(row, col)
+			clicks += 1
+	return clicks
+
+STRATEGIES: dict[str, Strategy] = {
+	'random': play_random,
+	'solver': play_solver,
+}
+
+class SimulationStats:
+	"""
+	The statistics of a batch of games, that can be merged with the ones of other batches.
+
+	Args:
+		number_of_cells_per_row_col:
+			The number of cells in each row and column of the boards
+	"""
+	def __init__(self, number_of_cells_per_row_col: int):
+		self.number_of_cells_per_row_col = number_of_cells_per_row_col
+		self.games = 0
+		self.wins = 0
+		self.clicks = 0
+		self.revealed_cells = 0
+		self.safe_cells = 0
+		self.adjacency_sum = 0
+		# zero_region_sizes[n] is the number of zero regions of n cells
+		self.zero_region_sizes = np.zeros(number_of_cells_per_row_col ** 2 + 1, dtype=np.int64)
+
+	def add_game(self, game: Minesweeper, clicks: int):
+		board = game.board
+		safe = ~board.mines
+		self.games += 1
+		self.wins += game.is_won
+		self.clicks += clicks
+		self.revealed_cells += game.number_of_revealed
+		self.safe_cells += int(np.count_nonzero(safe))
+		self.adjacency_sum += int(board.adjacency[safe].sum())
+		labels = board.zero_labels
+		if labels is not None:
+			region_sizes = np.bincount(labels[labels >= 0])
+			self.zero_region_sizes += np.bincount(region_sizes[region_sizes > 0], minlength=self.zero_region_sizes.size)
+
+	def merge(self, other: 'SimulationStats'):
+		self.games += other.games
+		self.wins += other.wins
+		self.clicks += other.clicks
+		self.revealed_cells += other.revealed_cells
+		self.safe_cells += other.safe_cells
+		self.adjacency_sum += other.adjacency_sum
+		self.zero_region_sizes += other.zero_region_sizes
+
+	@property
+	def win_rate(self) -> float:
+		return self.wins / self.games if self.games > 0 else 0
+
+	@property
+	def mean_adjacency(self) -> float:
+		"""The mean number of adjacent bombs of the safe cells"""
+		return self.adjacency_sum / self.safe_cells if self.safe_cells > 0 else 0
+
+	@property
+	def mean_zero_region_size(self) -> float:
+		number_of_regions = self.zero_region_sizes.sum()
+		return float(self.zero_region_sizes @ np.arange(self.zero_region_sizes.size)) / number_of_regions if number_of_regions > 0 else 0
+
+	def zero_region_size_percentile(self, percentile: float) -> int:
+		"""The size of the zero region below which there are a given percentage (0-100) of the regions"""
+		cumulative = np.cumsum(self.zero_region_sizes)
+		if cumulative[-1] == 0:
+			return 0
+		return int(np.searchsorted(cumulative, cumulative[-1] * percentile / 100))
+
+	def __str__(self) -> str:
+		return (
+			f'{self.games} games, win rate {self.win_rate:.2%}, '
+			f'{self.clicks / max(self.games, 1):.1f} clicks and {self.revealed_cells / max(self.games, 1):.1f} cells revealed per game, '
+			f'mean adjacency {self.mean_adjacency:.3f}, '
+			f'zero regions per board {self.zero_region_sizes.sum() / max(self.games, 1):.2f}, '
+			f'zero region size mean {self.mean_zero_region_size:.2f} '
+			f'p50 {self.zero_region_size_percentile(50)} p95 {self.zero_region_size_percentile(95)}'
+		)
+
+def simulate_chunk(number_of_cells_per_row_col: int, number_of_bombs: int, first_seed: int, number_of_games: int, strategy: str = 'random') -> SimulationStats:
+	"""Plays the games of the seeds first_seed to first_seed + number_of_games - 1"""
+	play = STRATEGIES[strategy]
+	stats = SimulationStats(number_of_cells_per_row_col)
+	for seed in range(first_seed, first_seed + number_of_games):
+		# the boards are never replayed, so they are kept out of the board cache
+		board = Board(number_of_cells_per_row_col, number_of_bombs, seed, cache=False)
+		game = Minesweeper(number_of_cells_per_row_col, number_of_bombs, board=board)
+		clicks = play(game, np.random.default_rng((seed, 1))) # the player never uses the board seed
+		stats.add_game(game, clicks)
+	return stats
+
+def simulate(
+	number_of_cells_per_row_col: int,
+	number_of_bombs: int,
+	number_of_games: int,
+	first_seed: int = 0,
+	chunk_size: int = 500,
+	max_workers: int | None = None,
+	strategy: str = 'random',
+) -> SimulationStats:
+	"""
+	Plays the games of number_of_games consecutive seeds, in chunks of chunk_size games spread
+	over a pool of max_workers processes, and merges the statistics of the chunks as they complete
+	(with at most two chunks per worker submitted at a time). The statistics are sums, so the
+	result only depends on the seeds, not on the number of workers nor on the completion order.
+	"""
+	stats = SimulationStats(number_of_cells_per_row_col)
+	chunks = [(first_seed + start, min(chunk_size, number_of_games - start)) for start in range(0, number_of_games, chunk_size)]
+	# enough tasks to keep the workers busy, without queueing all the chunks at once
+	max_in_flight = 2 * (max_workers or os.cpu_count() or 1)
+	with ProcessPoolExecutor(max_workers) as executor:
+		in_flight: set[Future[SimulationStats]] = set()
+		for chunk_first_seed, chunk_games in chunks:
+			if len(in_flight) >= max_in_flight:
+				completed = next(as_completed(in_flight))
+				in_flight.remove(completed)
+				stats.merge(completed.result())
+			in_flight.add(executor.submit(simulate_chunk, number_of_cells_per_row_col, number_of_bombs, chunk_first_seed, chunk_games, strategy))
+		for completed in as_completed(in_flight):
+			stats.merge(completed.result())
+	return stats
+
+def main():
+	number_of_cells_per_row_col = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+	number_of_bombs = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+	number_of_games = int(float(sys.argv[3])) if len(sys.argv) > 3 else 20_000
+	strategy = sys.argv[4] if len(sys.argv) > 4 else 'random'
+	number_of_cpus = os.cpu_count() or 1
+	worker_counts = sorted({1, number_of_cpus} | {2 ** power for power in range(0, number_of_cpus.bit_length()) if 2 ** power <= number_of_cpus})
+
+	print(f'{number_of_cells_per_row_col}x{number_of_cells_per_row_col} boards, {number_of_bombs} bombs, {strategy} strategy, {number_of_cpus} cpus')
+	print(f'{"workers":>8} {"games/s":>10} {"efficiency":>11}')
+	single_worker_rate = None
+	for workers in worker_counts:
+		start = time.perf_counter()
+		stats = simulate(number_of_cells_per_row_col, number_of_bombs, number_of_games, max_workers=workers, strategy=strategy)
+		games_per_second = number_of_games / (time.perf_counter() - start)
+		single_worker_rate = single_worker_rate or games_per_second
+		print(f'{workers:>8} {games_per_second:>10.0f} {games_per_second / (single_worker_rate * workers):>11.0%}')
+	print(stats)
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,175 @@
+import time
+from dataclasses import dataclass
+import numpy as np
+from board import NEIGHBOUR_OFFSETS
+from engine import Minesweeper, HIDDEN, FLAGGED
+
+@dataclass
+class SolveResult:
+	won: bool
+	clicks: int
+	guesses: int
+	nodes: int # the number of constraints evaluated
+	seconds: float
+
+	@property
+	def nodes_per_second(self) -> float:
+		return self.nodes / self.seconds if self.seconds > 0 else 0
+
+class Solver:
+	"""
+	Plays a game through the engine reveal logic, by constraint propagation.
+
+	Each revealed numbered cell with hidden neighbours is a constraint (its hidden
+	neighbours hold its number minus its flagged neighbours of bombs), and the set of
+	these cells is the frontier. The frontier is kept up to date incrementally: a reveal
+	or a flag only marks as dirty the constraints around the cells it changed, and only
+	the dirty constraints are evaluated again, with two rules:
+		- single cell: when a constraint has no bombs left, all its hidden cells are safe,
+		and when it has as many bombs left as hidden cells, they are all bombs (flagged)
+		- subset: when the hidden cells of a constraint are a subset of the ones of another
+		constraint, the difference holds the difference of their bombs
+	When nothing can be deduced, the cell with the lowest estimated bomb probability is
+	revealed (a guess). The solver only reads the numbers of the revealed cells.
+
+	Args:
+		game:
+			The game to be played, from its start
+		rng:
+			The random generator used to break ties between guesses. Defaults to an unseeded one
+	"""
+	def __init__(self, game: Minesweeper, rng: np.random.Generator | None = None):
+		self.__game = game
+		self.__rng = rng if rng is not None else np.random.default_rng()
+		self.__size = game.size
+		# flat views, a cell is its flat index
+		self.__state = game.state.reshape(-1)
+		self.__adjacency = game.board.adjacency.reshape(-1)
+		self.__frontier: set[int] = set()
+		self.__dirty: set[int] = set()
+		self.__safe: set[int] = set()
+		self.__number_of_flags = 0
+		self.clicks = 0
+		self.guesses = 0
+		self.nodes = 0
+
+	def __neighbours(self, cell: int) -> list[int]:
+		size = self.__size
+		row, col = divmod(cell, size)
+		return [
+			(row + row_offset) * size + col + col_offset
+			for row_offset, col_offset in NEIGHBOUR_OFFSETS
+			if 0 <= row + row_offset < size and 0 <= col + col_offset < size
+		]
+
+	def __constraint(self, cell: int) -> tuple[set[int], int]:
+		# the hidden neighbours of a revealed cell, and how many bombs they hold
+		hidden, bombs = set(), int(self.__adjacency[cell])
+		for neighbour in self.__neighbours(cell):
+			state = self.__state[neighbour]
+			if state == HIDDEN:
+				hidden.add(neighbour)
+			elif state == FLAGGED:
+				bombs -= 1
+		return hidden, bombs
+
+	def __mark_dirty_around(self, cell: int):
+		for neighbour in self.__neighbours(cell):
+			if neighbour in self.__frontier:
+				self.__dirty.add(neighbour)
+
+	def __reveal(self, cell: int):
+		self.clicks += 1
+		revealed_cells = self.__game.reveal(*divmod(cell, self.__size))
+		# the first reveal of a first_click_safe game generates a new board
+		self.__adjacency = self.__game.board.adjacency.reshape(-1)
+		for row, col in revealed_cells:
+			if self.__game.is_lost:
+				return
+			revealed = row * self.__size + col
+			self.__safe.discard(revealed)
+			self.__mark_dirty_around(revealed)
+			if self.__adjacency[revealed] > 0:
+				self.__frontier.add(revealed)
+				self.__dirty.add(revealed)
+
+	def __flag(self, cell: int):
+		if self.__state[cell] == HIDDEN:
+			self.__game.toggle_flag(*divmod(cell, self.__size))
+			self.__number_of_flags += 1
+			self.__mark_dirty_around(cell)
+
+	def __apply(self, cells: set[int], bombs: int):
+		# the deduction for a set of hidden cells holding a known number of bombs
+		if bombs == 0:
+			self.__safe.update(cells)
+		elif bombs == len(cells):
+			for cell in cells:
+				self.__flag(cell)
+
+	def __propagate(self):
+		# evaluates the dirty constraints until a safe cell is found or nothing changes
+		while self.__dirty and not self.__safe:
+			cell = self.__dirty.pop()
+			self.nodes += 1
+			hidden, bombs = self.__constraint(cell)
+			if not hidden:
+				self.__frontier.discard(cell)
+				continue
+			self.__apply(hidden, bombs)
+			if bombs == 0 or bombs == len(hidden):
+				continue
+
+			# subset rule, against the constraints that may share hidden cells (up to 2 cells away)
+			size = self.__size
+			row, col = divmod(cell, size)
+			for other_row in range(max(row - 2, 0), min(row + 3, size)):
+				for other_col in range(max(col - 2, 0), min(col + 3, size)):
+					other = other_row * size + other_col
+					if other == cell or other not in self.__frontier:
+						continue
+					other_hidden, other_bombs = self.__constraint(other)
+					if hidden < other_hidden:
+						self.__apply(other_hidden - hidden, other_bombs - bombs)
+					elif other_hidden < hidden:
+						self.__apply(hidden - other_hidden, bombs - other_bombs)
+
+	def __guess(self):
+		# the bomb probability of a frontier cell is estimated by its most constraining
+		# neighbour, and the one of any other hidden cell by the density of the bombs left
+		self.guesses += 1
+		probabilities: dict[int, float] = {}
+		for cell in self.__frontier:
+			hidden, bombs = self.__constraint(cell)
+			for neighbour in hidden:
+				probabilities[neighbour] = max(probabilities.get(neighbour, 0), bombs / len(hidden))
+
+		others = np.flatnonzero(self.__state == HIDDEN)
+		others = others[~np.isin(others, list(probabilities))]
+		if others.size > 0:
+			bombs_left = self.__game.board.number_of_bombs - self.__number_of_flags - sum(probabilities.values())
+			other_probability = max(bombs_left, 0) / others.size
+			if not probabilities or other_probability < min(probabilities.values()):
+				self.__reveal(int(self.__rng.choice(others)))
+				return
+		self.__reveal(min(probabilities, key=probabilities.get))
+
+	def solve(self) -> SolveResult:
+		"""Plays until the game is over, starting at the center of the board"""
+		start = time.perf_counter()
+		if self.__game.number_of_revealed == 0 and not self.__game.is_over:
+			self.guesses += 1
+			self.__reveal((self.__size // 2) * self.__size + self.__size // 2)
+		while not self.__game.is_over:
+			self.__propagate()
+			if self.__safe:
+				cell = self.__safe.pop()
+				if self.__state[cell] == HIDDEN:
+					self.__reveal(cell)
+			else:
+				self.__guess()
+		return SolveResult(self.__game.is_won, self.clicks, self.guesses, self.nodes, time.perf_counter() - start)
+
+def play_solver(game: Minesweeper, rng: np.random.Generator) -> int:
+	"""A simulation strategy (see _simulate.py_) that plays with the Solver"""
+	return Solver(game, rng).solve().clicks
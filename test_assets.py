@@ -0,0 +1,49 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from assets import AssetManager
+
+class AssetManagerTest(unittest.TestCase):
+	@classmethod
+	def setUpClass(cls):
+		pygame.display.init()
+		pygame.font.init()
+		pygame.display.set_mode((1, 1)) # convert_alpha needs a display mode
+
+	@classmethod
+	def tearDownClass(cls):
+		pygame.quit()
+
+	def test_sized_assets_are_shared(self):
+		assets = AssetManager()
+
+		self.assertIs(assets.bomb_surface(20), assets.bomb_surface(20.0))
+		self.assertEqual((10, 10), assets.bomb_surface(20).get_size())
+		self.assertIs(assets.digit_glyph(3, 20), assets.digit_glyph(3, 20))
+		self.assertEqual([20], assets.cached_sizes())
+
+	def test_cached_sizes_are_least_recently_used_first(self):
+		assets = AssetManager(max_cached_sizes=2)
+		bomb_surface = assets.bomb_surface(20)
+		assets.bomb_surface(10)
+		self.assertEqual([20, 10], assets.cached_sizes())
+
+		assets.digit_glyph(1, 20) # most recently used again
+		self.assertEqual([10, 20], assets.cached_sizes())
+
+		assets.bomb_surface(30) # evicts 10
+		self.assertEqual([20, 30], assets.cached_sizes())
+		self.assertIs(bomb_surface, assets.bomb_surface(20))
+
+		assets.bomb_surface(10) # evicts 30
+		assets.bomb_surface(30) # evicts 20
+		self.assertEqual([10, 30], assets.cached_sizes())
+		self.assertIsNot(bomb_surface, assets.bomb_surface(20)) # loaded again
+		self.assertEqual([30, 20], assets.cached_sizes())
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,191 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import board as board_module
+from board import Board
+
+class BoardTest(unittest.TestCase):
+	def test_exact_number_of_bombs(self):
+		board = Board(10, 25, seed=1)
+
+		self.assertEqual(25, int(board.mines.sum()))
+		self.assertEqual(25, board.number_of_bombs)
+
+	def test_number_of_bombs_is_clamped(self):
+		board = Board(3, 50, seed=1)
+
+		self.assertEqual(9, int(board.mines.sum()))
+
+	def test_same_seed_same_board(self):
+		self.assertTrue(np.array_equal(Board(20, 40, seed=7).mines, Board(20, 40, seed=7).mines))
+
+	def test_safe_cell_has_no_bomb_around(self):
+		for row, col in ((0, 0), (5, 5), (9, 3)):
+			board = Board(10, 80, seed=4, safe_cell=(row, col))
+
+			self.assertEqual(80, int(board.mines.sum()))
+			self.assertFalse(board.mines[max(row - 1, 0):row + 2, max(col - 1, 0):col + 2].any())
+			self.assertEqual(0, board.number_of_adjacent_bombs(row, col))
+
+	def test_number_of_bombs_is_clamped_out_of_safe_zone(self):
+		board = Board(5, 50, seed=1, safe_cell=(2, 2))
+
+		self.assertEqual(16, board.number_of_bombs)
+		self.assertEqual(16, int(board.mines.sum()))
+
+	def test_seeded_boards_are_cached(self):
+		board_module.clear_board_cache()
+		board = Board(20, 40, seed=7)
+		same_board = Board(20, 40, seed=7)
+
+		self.assertIs(board.mines, same_board.mines)
+		self.assertIs(board.adjacency, same_board.adjacency)
+		self.assertIs(board.zero_labels, same_board.zero_labels)
+		self.assertIsNot(board.mines, Board(20, 40, seed=8).mines)
+		self.assertIsNot(board.mines, Board(20, 40, seed=7, safe_cell=(0, 0)).mines)
+		self.assertIsNot(Board(20, 40).mines, Board(20, 40).mines)
+
+	def test_seeded_boards_are_read_only(self):
+		board = Board(10, 25, seed=1)
+
+		with self.assertRaises(ValueError):
+			board.mines[0, 0] = True
+		with self.assertRaises(ValueError):
+			board.adjacency[0, 0] = 1
+
+	def test_board_cache_evicts_least_recently_used(self):
+		board_module.clear_board_cache()
+		first = Board(10, 25, seed=0)
+		for seed in range(1, board_module.BOARD_CACHE_SIZE):
+			Board(10, 25, seed=seed)
+		Board(10, 25, seed=0) # most recently used again
+		Board(10, 25, seed=board_module.BOARD_CACHE_SIZE) # evicts seed 1
+
+		self.assertIs(first.mines, Board(10, 25, seed=0).mines)
+		self.assertEqual(board_module.BOARD_CACHE_SIZE, len(board_module._board_cache))
+		self.assertNotIn((10, 25, 1, None, True), board_module._board_cache)
+
+	def test_uncached_boards(self):
+		board_module.clear_board_cache()
+		board = Board(10, 25, seed=1, cache=False)
+		board.mines[0, 0] = not board.mines[0, 0] # not shared, so writable
+
+		self.assertEqual(0, len(board_module._board_cache))
+		self.assertIsNot(Board(10, 25, seed=1).mines, Board(10, 25, seed=1, cache=False).mines)
+		self.assertEqual(1, len(board_module._board_cache))
+		self.assertTrue(np.array_equal(Board(10, 25, seed=1).mines, Board(10, 25, seed=1, cache=False).mines))
+
+	def test_board_cache_is_shared_between_threads(self):
+		board_module.clear_board_cache()
+		seeds = [seed % (2 * board_module.BOARD_CACHE_SIZE) for seed in range(0, 400)]
+		with ThreadPoolExecutor(max_workers=4) as executor:
+			boards = list(executor.map(lambda seed: Board(10, 25, seed=seed), seeds))
+
+		for seed, board in zip(seeds, boards):
+			self.assertEqual(seed, board.seed)
+			self.assertEqual(25, int(board.mines.sum()))
+			self.assertTrue(np.array_equal(board.mines, boards[seed].mines))
+		self.assertEqual(board_module.BOARD_CACHE_SIZE, len(board_module._board_cache))
+
+	def assert_adjacency(self, board: Board):
+		size = board.size
+		for row in range(0, size):
+			for col in range(0, size):
+				if board.is_bomb(row, col):
+					self.assertEqual(0, board.number_of_adjacent_bombs(row, col))
+					continue
+				expected = 0
+				for r in range(row - 1, row + 2):
+					for c in range(col - 1, col + 2):
+						if (r, c) != (row, col) and board.in_bounds(r, c) and board.is_bomb(r, c):
+							expected += 1
+				self.assertEqual(expected, board.number_of_adjacent_bombs(row, col))
+
+	def assert_regions(self, board: Board):
+		# revealing any region through its label reveals the same cells as a flood fill
+		size = board.size
+		rows, cols = np.nonzero(board.zero_labels >= 0)
+		_, first_cells = np.unique(board.zero_labels[rows, cols], return_index=True)
+		self.assertTrue(np.array_equal((board.adjacency == 0) & ~board.mines, board.zero_labels >= 0))
+		for row, col in zip(rows[first_cells].tolist(), cols[first_cells].tolist()):
+			labeled = np.zeros((size, size), dtype=bool)
+			flooded = np.zeros((size, size), dtype=bool)
+			board.reveal_region(row, col, labeled)
+			board.flood_fill(row, col, flooded)
+			self.assertTrue(np.array_equal(labeled, flooded))
+
+	def test_adjacency(self):
+		self.assert_adjacency(Board(30, 200, seed=3))
+
+	def test_with_safe_cell(self):
+		for seed in range(0, 30):
+			board = Board(30, 30 + seed * 12, seed=seed)
+			mines = board.mines.copy()
+			row, col = divmod(int(np.argwhere(board.mines.ravel())[0, 0]), 30)
+			safe_board = board.with_safe_cell(row, col)
+
+			self.assertEqual(board.number_of_bombs, int(safe_board.mines.sum()))
+			self.assertFalse(safe_board.mines[max(row - 1, 0):row + 2, max(col - 1, 0):col + 2].any())
+			self.assertEqual((row, col), safe_board.safe_cell)
+			self.assertEqual(seed, safe_board.seed)
+			self.assertTrue(np.array_equal(mines, board.mines)) # the arrays of the board are never changed
+			self.assert_adjacency(safe_board)
+			self.assert_regions(safe_board)
+			self.assertTrue(np.array_equal(safe_board.mines, board.with_safe_cell(row, col).mines))
+
+	def test_with_safe_cell_on_a_low_density_board(self):
+		# a few large regions, that the moved bombs may split
+		for seed in range(0, 10):
+			board = Board(40, 100, seed=seed)
+			row, col = divmod(int(np.argwhere(board.mines.ravel())[0, 0]), 40)
+			safe_board = board.with_safe_cell(row, col)
+
+			self.assert_adjacency(safe_board)
+			self.assert_regions(safe_board)
+
+	def test_with_safe_cell_keeps_a_safe_board(self):
+		board = Board(10, 0, seed=1)
+
+		self.assertIs(board, board.with_safe_cell(5, 5))
+
+	def test_with_safe_cell_clamps_the_number_of_bombs(self):
+		board = Board(4, 12, seed=1).with_safe_cell(0, 0)
+
+		self.assertEqual(12, board.number_of_bombs)
+		self.assertFalse(board.mines[0:2, 0:2].any())
+		board = Board(4, 14, seed=1).with_safe_cell(1, 1)
+		self.assertEqual(7, board.number_of_bombs)
+		self.assertFalse(board.mines[0:3, 0:3].any())
+
+	def test_flood_fill_spreads_to_8_neighbours(self):
+		board = Board(3, 0, seed=1)
+		revealed = np.zeros((3, 3), dtype=bool)
+
+		revealed_cells = board.flood_fill(0, 0, revealed)
+		self.assertEqual(9, len(revealed_cells))
+		self.assertTrue(revealed.all())
+		self.assertEqual([], board.flood_fill(1, 1, revealed))
+
+	def test_flood_fill_large_region(self):
+		board = Board(400, 10, seed=2, label_zero_regions=False)
+		revealed = np.zeros((400, 400), dtype=bool)
+		start = tuple(int(i) for i in np.argwhere(board.adjacency == 0)[0])
+
+		revealed_cells = board.flood_fill(*start, revealed)
+		self.assertEqual(len(revealed_cells), len(set(revealed_cells)))
+		self.assertEqual(len(revealed_cells), int(revealed.sum()))
+		self.assertFalse((revealed & board.mines).any())
+
+	def test_reveal_region_matches_flood_fill(self):
+		board = Board(60, 400, seed=5)
+		for row, col in np.argwhere(~board.mines)[::37]:
+			labeled = np.zeros((60, 60), dtype=bool)
+			flooded = np.zeros((60, 60), dtype=bool)
+
+			revealed_cells = board.reveal_region(int(row), int(col), labeled)
+			board.flood_fill(int(row), int(col), flooded)
+			self.assertTrue(np.array_equal(labeled, flooded))
+			self.assertEqual(int(labeled.sum()), len(revealed_cells))
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,145 @@
+import os
+import subprocess
+import sys
+import time
+import unittest
+import numpy as np
+from board import Board
+from engine import Minesweeper, BoardPregenerator
+
+class MinesweeperTest(unittest.TestCase):
+	def safe_cells(self, game: Minesweeper) -> list[tuple[int, int]]:
+		rows, cols = np.nonzero(~game.board.mines)
+		return list(zip(rows.tolist(), cols.tolist()))
+
+	def test_same_seed_same_game(self):
+		self.assertTrue(np.array_equal(Minesweeper(20, 50, seed=3).board.mines, Minesweeper(20, 50, seed=3).board.mines))
+
+	def test_reveal_bomb_loses(self):
+		game = Minesweeper(10, 25, seed=1)
+		row, col = (int(i) for i in np.argwhere(game.board.mines)[0])
+
+		revealed_cells = game.reveal(row, col)
+		self.assertTrue(game.is_lost)
+		self.assertTrue(game.is_over)
+		self.assertFalse(game.is_won)
+		self.assertEqual(25, len(revealed_cells))
+		self.assertEqual([], game.reveal(*self.safe_cells(game)[0]))
+
+	def test_reveal_all_safe_cells_wins(self):
+		game = Minesweeper(10, 25, seed=1)
+
+		self.assertFalse(game.is_won)
+		for row, col in self.safe_cells(game):
+			game.reveal(row, col)
+		self.assertTrue(game.is_won)
+		self.assertEqual(75, game.number_of_revealed)
+
+	def test_flag_blocks_reveal(self):
+		game = Minesweeper(10, 0, seed=1)
+
+		self.assertTrue(game.toggle_flag(5, 5))
+		revealed_cells = game.reveal(0, 0)
+		self.assertEqual(99, len(revealed_cells))
+		self.assertFalse(game.is_revealed(5, 5))
+		self.assertEqual([], game.reveal(5, 5))
+
+		self.assertTrue(game.toggle_flag(5, 5))
+		self.assertEqual([(5, 5)], game.reveal(5, 5))
+		self.assertTrue(game.is_won)
+		self.assertFalse(game.toggle_flag(5, 5))
+
+	def test_flags_cut_the_region(self):
+		game = Minesweeper(5, 0, seed=1)
+		for row in range(0, 5):
+			game.toggle_flag(row, 2)
+
+		revealed_cells = game.reveal(0, 0)
+		self.assertEqual(10, len(revealed_cells))
+		self.assertTrue(all(col < 2 for _, col in revealed_cells))
+		self.assertFalse(game.is_revealed(0, 4))
+
+	def test_first_click_safe(self):
+		for seed in range(0, 20):
+			game = Minesweeper(9, 60, seed=seed, first_click_safe=True)
+			revealed_cells = game.reveal(4, 4)
+
+			self.assertFalse(game.is_lost)
+			self.assertEqual(0, game.board.number_of_adjacent_bombs(4, 4))
+			self.assertGreaterEqual(len(revealed_cells), 9)
+
+	def test_first_click_safe_keeps_a_safe_board(self):
+		game = Minesweeper(10, 0, seed=1, first_click_safe=True)
+		board = game.board
+		game.reveal(0, 0)
+
+		self.assertIs(board, game.board)
+		self.assertIsNone(game.board.safe_cell)
+
+	def test_first_click_safe_is_deterministic(self):
+		game = Minesweeper(20, 80, seed=5, first_click_safe=True)
+		same_game = Minesweeper(20, 80, seed=5, first_click_safe=True)
+		game.reveal(3, 7)
+		same_game.reveal(3, 7)
+
+		self.assertTrue(np.array_equal(game.board.mines, same_game.board.mines))
+		self.assertTrue(np.array_equal(game.revealed, same_game.revealed))
+
+	def test_reset(self):
+		game = Minesweeper(10, 25, seed=1)
+		game.reveal(*self.safe_cells(game)[0])
+		game.reset(seed=2)
+
+		self.assertEqual(0, game.number_of_revealed)
+		self.assertEqual(2, game.seed)
+		self.assertFalse(game.revealed.any())
+
+	def test_reset_on_a_given_board(self):
+		game = Minesweeper(10, 25, seed=1)
+		board = Board(10, 25, seed=9)
+		game.reveal(*self.safe_cells(game)[0])
+		game.reset(board=board)
+
+		self.assertIs(board, game.board)
+		self.assertEqual(9, game.seed)
+		self.assertEqual(0, game.number_of_revealed)
+		with self.assertRaises(ValueError):
+			game.reset(board=Board(11, 25))
+
+class BoardPregeneratorTest(unittest.TestCase):
+	def test_seeded_boards(self):
+		with BoardPregenerator(20, 50, first_seed=3) as next_boards:
+			boards = [next_boards.take() for _ in range(0, 3)]
+
+		for seed, board in zip((3, 4, 5), boards):
+			self.assertEqual(seed, board.seed)
+			self.assertEqual(20, board.size)
+			self.assertEqual(50, int(board.mines.sum()))
+			self.assertTrue(np.array_equal(Board(20, 50, seed).mines, board.mines))
+
+	def test_random_boards(self):
+		with BoardPregenerator(30, 100) as next_boards:
+			board, next_board = next_boards.take(), next_boards.take()
+
+		self.assertIsNone(board.seed)
+		self.assertFalse(np.array_equal(board.mines, next_board.mines))
+
+	def test_next_board_is_generated_in_background(self):
+		with BoardPregenerator(50, 300) as next_boards:
+			next_boards.take()
+			deadline = time.monotonic() + 10
+			while not next_boards.is_ready and time.monotonic() < deadline:
+				time.sleep(.01)
+
+			self.assertTrue(next_boards.is_ready)
+
+class WithoutPygameTest(unittest.TestCase):
+	def test_modules_import_without_pygame(self):
+		# in another interpreter, so that pygame is only hidden from these imports
+		code = "import sys; sys.modules['pygame'] = None; import board, engine, profiler, simulate, solver"
+		result = subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True)
+
+		self.assertEqual(0, result.returncode, result.stderr)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,105 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from profiler import FrameProfiler
+
+class FakeClock:
+	def __init__(self):
+		self.now = 0.0
+
+	def __call__(self) -> float:
+		return self.now
+
+class FrameProfilerTest(unittest.TestCase):
+	def setUp(self):
+		self.clock = FakeClock()
+
+	def play_frame(self, profiler: FrameProfiler, events: float, render: float, cells_drawn: int = 0):
+		profiler.start_frame()
+		self.clock.now += events
+		profiler.lap('events')
+		self.clock.now += render
+		profiler.lap('render')
+		profiler.end_frame(cells_drawn)
+
+	def test_laps(self):
+		profiler = FrameProfiler(('events', 'render'), clock=self.clock)
+		self.play_frame(profiler, .002, .003, cells_drawn=7)
+
+		self.assertEqual(1, profiler.number_of_frames)
+		self.assertAlmostEqual(.002, profiler.frame_times('events')[0])
+		self.assertAlmostEqual(.003, profiler.frame_times('render')[0])
+		self.assertAlmostEqual(.005, profiler.frame_times()[0])
+		self.assertEqual([7], profiler.cells_drawn().tolist())
+
+	def test_add(self):
+		profiler = FrameProfiler(('events', 'reveal', 'render'), clock=self.clock)
+		profiler.start_frame()
+		self.clock.now += .001
+		profiler.add('reveal', .001, part_of='events')
+		self.clock.now += .003
+		profiler.lap('events')
+		profiler.end_frame()
+
+		self.assertAlmostEqual(.001, profiler.frame_times('reveal')[0])
+		self.assertAlmostEqual(.003, profiler.frame_times('events')[0])
+		self.assertEqual(0, profiler.frame_times('render')[0])
+		self.assertAlmostEqual(.004, profiler.frame_times()[0]) # the sum of the phases
+
+	def test_ring_buffer_keeps_the_last_frames(self):
+		profiler = FrameProfiler(('events', 'render'), max_frames=4, clock=self.clock)
+		for frame in range(0, 10):
+			self.play_frame(profiler, frame, 0, cells_drawn=frame)
+
+		self.assertEqual(4, profiler.number_of_frames)
+		self.assertEqual([6, 7, 8, 9], profiler.frame_times('events').tolist())
+		self.assertEqual([6, 7, 8, 9], profiler.cells_drawn().tolist())
+
+	def test_percentiles(self):
+		profiler = FrameProfiler(('events', 'render'), max_frames=200, clock=self.clock)
+		for frame in range(1, 101):
+			self.play_frame(profiler, 0, frame / 1000)
+
+		percentiles = profiler.percentiles()
+		self.assertAlmostEqual(.0505, percentiles[50])
+		self.assertAlmostEqual(.09505, percentiles[95])
+		self.assertAlmostEqual(.09901, percentiles[99])
+		self.assertAlmostEqual(50.5, profiler.summary()['frame_ms']['p50'])
+		self.assertEqual({50: 0.0, 95: 0.0, 99: 0.0}, FrameProfiler(('events',)).percentiles())
+
+	def test_toggle_clears(self):
+		profiler = FrameProfiler(('events', 'render'), clock=self.clock)
+		self.assertTrue(profiler.toggle())
+		self.play_frame(profiler, .001, .001)
+		self.assertFalse(profiler.toggle())
+		self.assertEqual(1, profiler.number_of_frames)
+		self.assertTrue(profiler.toggle())
+		self.assertEqual(0, profiler.number_of_frames)
+
+	def test_dumps(self):
+		profiler = FrameProfiler(('events', 'render'), clock=self.clock)
+		self.play_frame(profiler, .001, .002, cells_drawn=3)
+		self.play_frame(profiler, .003, .004, cells_drawn=5)
+
+		with tempfile.TemporaryDirectory() as directory:
+			csv_path, json_path = os.path.join(directory, 'profile.csv'), os.path.join(directory, 'profile.json')
+			profiler.to_csv(csv_path)
+			profiler.to_json(json_path)
+			with open(csv_path, newline='') as file:
+				rows = list(csv.reader(file))
+			with open(json_path) as file:
+				dump = json.load(file)
+
+		self.assertEqual(['events_ms', 'render_ms', 'frame_ms', 'cells_drawn'], rows[0])
+		self.assertEqual(3, len(rows))
+		self.assertAlmostEqual(7, float(rows[2][2]))
+		self.assertEqual('5', rows[2][3])
+		self.assertEqual(2, dump['frames'])
+		self.assertEqual([3, 5], dump['frames_cells_drawn'])
+		self.assertAlmostEqual(2, dump['phase_mean_ms']['events'])
+		self.assertAlmostEqual(7, dump['frames_ms']['frame'][1])
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import pygame
+from renderer import Renderer
+
+class FakeCell:
+	def __init__(self, x: int, y: int, size: int = 10):
+		self.rect = pygame.Rect(x, y, size, size)
+		self.renders = 0
+
+	def render(self, surface: pygame.Surface):
+		surface.fill('red', self.rect)
+		self.renders += 1
+
+class RendererTest(unittest.TestCase):
+	def setUp(self):
+		self.screen = pygame.Surface((100, 100))
+		self.cells = [FakeCell(x, y) for y in range(0, 100, 10) for x in range(0, 100, 10)]
+
+	def test_idle_frame(self):
+		renderer = Renderer(self.screen, self.cells)
+
+		self.assertEqual([self.screen.get_rect()], renderer.render()) # the first frame is a full redraw
+		self.assertTrue(renderer.is_idle)
+		self.assertEqual([], renderer.render())
+		self.assertEqual(100, renderer.cells_drawn) # the background only
+
+	def test_only_dirty_rects(self):
+		renderer = Renderer(self.screen, self.cells)
+		renderer.render()
+
+		renderer.mark_dirty(self.cells[0])
+		renderer.mark_dirty(self.cells[55])
+		self.assertEqual([pygame.Rect(0, 0, 10, 10), pygame.Rect(50, 50, 10, 10)], renderer.render())
+		self.assertEqual(2, self.cells[0].renders) # on the background, then on the screen
+		self.assertEqual(1, self.cells[1].renders)
+		self.assertEqual(102, renderer.cells_drawn)
+		self.assertEqual([], renderer.render())
+
+	def test_too_many_dirty_rects_are_merged(self):
+		renderer = Renderer(self.screen, self.cells, max_dirty_rects=2)
+		renderer.render()
+
+		for cell in (self.cells[11], self.cells[12], self.cells[33]):
+			renderer.mark_dirty(cell)
+		self.assertEqual([pygame.Rect(10, 10, 30, 30)], renderer.render())
+
+if __name__ == '__main__':
+	unittest.main()
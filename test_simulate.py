@@ -0,0 +1,52 @@
+import unittest
+import numpy as np
+import board as board_module
+from engine import Minesweeper
+from simulate import SimulationStats, simulate, simulate_chunk
+
+class SimulateTest(unittest.TestCase):
+	def test_chunk_stats(self):
+		stats = simulate_chunk(8, 10, first_seed=3, number_of_games=5)
+
+		self.assertEqual(5, stats.games)
+		boards = [Minesweeper(8, 10, seed).board for seed in range(3, 8)]
+		self.assertEqual(sum(int(np.count_nonzero(~board.mines)) for board in boards), stats.safe_cells)
+		self.assertEqual(sum(int(board.adjacency.sum()) for board in boards), stats.adjacency_sum)
+		self.assertEqual(
+			sum(int(np.count_nonzero(board.zero_labels >= 0)) for board in boards),
+			int(stats.zero_region_sizes @ np.arange(stats.zero_region_sizes.size)),
+		)
+		self.assertGreaterEqual(stats.clicks, 5)
+
+	def test_chunk_boards_are_not_cached(self):
+		board_module.clear_board_cache()
+		simulate_chunk(8, 10, first_seed=0, number_of_games=3)
+
+		self.assertEqual(0, len(board_module._board_cache))
+
+	def test_same_result_for_any_chunking(self):
+		expected = simulate_chunk(6, 4, first_seed=0, number_of_games=30)
+		stats = simulate(6, 4, 30, chunk_size=7, max_workers=2)
+
+		self.assertEqual(
+			(expected.games, expected.wins, expected.clicks, expected.revealed_cells, expected.adjacency_sum),
+			(stats.games, stats.wins, stats.clicks, stats.revealed_cells, stats.adjacency_sum),
+		)
+		self.assertTrue(np.array_equal(expected.zero_region_sizes, stats.zero_region_sizes))
+
+	def test_no_bombs_always_wins(self):
+		stats = simulate_chunk(5, 0, first_seed=0, number_of_games=3)
+
+		self.assertEqual(1., stats.win_rate)
+		self.assertEqual(0, stats.mean_adjacency)
+		self.assertEqual(25, stats.zero_region_size_percentile(50)) # a single region with every cell
+
+	def test_empty_stats(self):
+		stats = SimulationStats(4)
+
+		self.assertEqual(0, stats.win_rate)
+		self.assertEqual(0, stats.mean_zero_region_size)
+		self.assertEqual(0, stats.zero_region_size_percentile(95))
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+import numpy as np
+from engine import Minesweeper
+from simulate import simulate_chunk
+from solver import Solver
+
+class SolverTest(unittest.TestCase):
+	def test_no_bombs(self):
+		result = Solver(Minesweeper(10, 0, seed=0)).solve()
+
+		self.assertTrue(result.won)
+		self.assertEqual((1, 1), (result.clicks, result.guesses))
+
+	def test_flags_are_bombs(self):
+		nodes = 0
+		for seed in range(0, 30):
+			game = Minesweeper(12, 20, seed)
+			result = Solver(game, np.random.default_rng(seed)).solve()
+
+			self.assertTrue(game.is_over)
+			self.assertEqual(result.won, game.is_won)
+			self.assertFalse((game.flagged & ~game.board.mines).any(), f'seed {seed}')
+			nodes += result.nodes
+		self.assertGreater(nodes, 0)
+
+	def test_wins_most_easy_boards(self):
+		wins = sum(Solver(Minesweeper(9, 10, seed), np.random.default_rng(seed)).solve().won for seed in range(0, 50))
+
+		self.assertGreater(wins, 30)
+
+	def test_simulation_strategy(self):
+		stats = simulate_chunk(9, 10, first_seed=0, number_of_games=20, strategy='solver')
+
+		self.assertGreater(stats.win_rate, simulate_chunk(9, 10, first_seed=0, number_of_games=20).win_rate)
+
+if __name__ == '__main__':
+	unittest.main()
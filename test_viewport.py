@@ -0,0 +1,50 @@
+import unittest
+from viewport import Viewport
+
+class ViewportTest(unittest.TestCase):
+	def test_screen_to_cell(self):
+		viewport = Viewport(80, 10)
+
+		self.assertEqual((0, 0), viewport.screen_to_cell((0, 0)))
+		self.assertEqual((0, 0), viewport.screen_to_cell((79, 79)))
+		self.assertEqual((1, 0), viewport.screen_to_cell((80, 5)))
+		self.assertEqual((9, 3), viewport.screen_to_cell((799, 250)))
+		self.assertIsNone(viewport.screen_to_cell((800, 5)))
+		self.assertIsNone(viewport.screen_to_cell((-1, 5)))
+
+	def test_offset_and_scale(self):
+		viewport = Viewport(10, 100, offset=(50, 20), scale=2)
+
+		self.assertEqual((5, 2), viewport.screen_to_cell((0, 0)))
+		self.assertEqual((6, 3), viewport.screen_to_cell((20, 20)))
+		self.assertEqual((0, 0), viewport.cell_to_screen(5, 2))
+		self.assertEqual((20, 20), viewport.cell_to_screen(6, 3))
+
+	def test_visible_range(self):
+		viewport = Viewport(10, 1000, offset=(55, 0), scale=2)
+
+		self.assertEqual((5, 46, 0, 40), viewport.visible_range((800, 800)))
+		self.assertEqual((0, 10, 0, 10), Viewport(80, 10).visible_range((800, 800)))
+
+	def test_pan(self):
+		viewport = Viewport(10, 100)
+
+		self.assertTrue(viewport.pan((30, 40), (500, 500)))
+		self.assertEqual((30, 40), viewport.offset)
+		self.assertTrue(viewport.pan((-100, 1000), (500, 500)))
+		self.assertEqual((0, 500), viewport.offset) # clamped to the board
+		self.assertFalse(viewport.pan((0, 10), (500, 500)))
+
+	def test_zoom_keeps_anchor(self):
+		viewport = Viewport(10, 100)
+		anchor = (200, 300)
+		cell = viewport.screen_to_cell(anchor)
+
+		self.assertTrue(viewport.zoom(2, anchor, (500, 500)))
+		self.assertEqual(2, viewport.scale)
+		self.assertEqual(cell, viewport.screen_to_cell(anchor))
+		self.assertTrue(viewport.zoom(100, anchor, (500, 500)))
+		self.assertEqual(4, viewport.scale) # clamped to max_scale
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,107 @@
+import math
+
+class Viewport:
+	"""
+	Maps screen (pixel) coordinates to grid indices and back, by arithmetic.
+
+	The grid is placed at an offset (the grid position under the top-left corner of
+	the screen, in unscaled pixels) and drawn with a scale factor, so the same mapping
+	works for a scrolled or zoomed view. The view can be panned and zoomed, and only
+	the cells in its visible range need to be drawn.
+
+	Note that, as in the cell grid, the first index (row) grows along the x axis
+	and the second one (col) grows along the y axis.
+
+	Args:
+		cell_size:
+			The unscaled size of a cell, in pixels
+		number_of_cells_per_row_col:
+			The number of cells in each row and column of the grid
+		offset:
+			The unscaled grid position at the top-left corner of the screen. Defaults to (0, 0)
+		scale:
+			The zoom factor. Defaults to 1
+		min_scale, max_scale:
+			The limits of the zoom factor. Default to .25 and 4
+	"""
+	def __init__(self, cell_size: float, number_of_cells_per_row_col: int, offset: tuple[float, float] = (0, 0), scale: float = 1, min_scale: float = .25, max_scale: float = 4):
+		self.cell_size = cell_size
+		self.number_of_cells_per_row_col = number_of_cells_per_row_col
+		self.offset = offset
+		self.scale = scale
+		self.min_scale = min_scale
+		self.max_scale = max_scale
+
+	@property
+	def scaled_cell_size(self) -> float:
+		return self.cell_size * self.scale
+
+	def screen_to_cell(self, pos: tuple[int, int]) -> tuple[int, int] | None:
+		"""
+		Returns the (row, col) of the cell under a screen position, or None if there is no cell there.
+		[time complexity: O(1)]
+		"""
+		scaled_cell_size = self.scaled_cell_size
+		row = math.floor((pos[0] / scaled_cell_size) + (self.offset[0] / self.cell_size))
+		col = math.floor((pos[1] / scaled_cell_size) + (self.offset[1] / self.cell_size))
+		if 0 <= row < self.number_of_cells_per_row_col and 0 <= col < self.number_of_cells_per_row_col:
+			return row, col
+		return None
+
+	def visible_range(self, screen_size: tuple[int, int]) -> tuple[int, int, int, int]:
+		"""
+		Returns the range of cells visible on a screen of a given size,
+		as (first row, last row + 1, first col, last col + 1).
+		"""
+		first_row, first_col = (math.floor(offset / self.cell_size) for offset in self.offset)
+		last_row = math.ceil((self.offset[0] + screen_size[0] / self.scale) / self.cell_size)
+		last_col = math.ceil((self.offset[1] + screen_size[1] / self.scale) / self.cell_size)
+		size = self.number_of_cells_per_row_col
+		return (
+			min(max(first_row, 0), size), min(max(last_row, 0), size),
+			min(max(first_col, 0), size), min(max(last_col, 0), size),
+		)
+
+	def __clamp_offset(self, screen_size: tuple[int, int]):
+		# keeps the view over the board. When the board is smaller than the screen, it sticks to the top-left corner
+		board_size = self.cell_size * self.number_of_cells_per_row_col
+		self.offset = tuple(
+			min(max(offset, 0), max(board_size - screen / self.scale, 0))
+			for offset, screen in zip(self.offset, screen_size)
+		)
+
+	def pan(self, delta: tuple[float, float], screen_size: tuple[int, int]) -> bool:
+		"""
+		Moves the view by a given amount of screen pixels.
+
+		Returns:
+			True if the view has changed
+		"""
+		previous_offset = self.offset
+		self.offset = (self.offset[0] + delta[0] / self.scale, self.offset[1] + delta[1] / self.scale)
+		self.__clamp_offset(screen_size)
+		return self.offset != previous_offset
+
+	def zoom(self, factor: float, anchor: tuple[int, int], screen_size: tuple[int, int]) -> bool:
+		"""
+		Multiplies the scale by a given factor, keeping the grid point under the anchor (a screen position) in place.
+
+		Returns:
+			True if the view has changed
+		"""
+		previous_offset, previous_scale = self.offset, self.scale
+		scale = min(max(self.scale * factor, self.min_scale), self.max_scale)
+		# the grid point under the anchor, in unscaled pixels
+		anchor_x = self.offset[0] + anchor[0] / self.scale
+		anchor_y = self.offset[1] + anchor[1] / self.scale
+		self.offset = (anchor_x - anchor[0] / scale, anchor_y - anchor[1] / scale)
+		self.scale = scale
+		self.__clamp_offset(screen_size)
+		return self.offset != previous_offset or self.scale != previous_scale
+
+	def cell_to_screen(self, row: int, col: int) -> tuple[float, float]:
+		"""Returns the screen position of the top-left corner of a cell"""
+		return (
+			(row * self.cell_size - self.offset[0]) * self.scale,
+			(col * self.cell_size - self.offset[1]) * self.scale,
+		)